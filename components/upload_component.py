@@ -8,15 +8,378 @@ Author: Benjamín Riquelme
 """
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import mmap
 import os
-import xml.etree.ElementTree as ET
+import re
+import shutil
+import tempfile
+import threading
+import time
+from lxml import etree
+
+
+# Carpeta donde se guardan los archivos subidos
+TEMP_DIR = Path("temp")
+
+# Tamaño máximo aceptado por archivo subido (igual a server.maxUploadSize)
+UPLOAD_MAX_BYTES = 50 * 1024 * 1024
+
+# Sobre este tamaño, el archivo se copia a disco por bloques y se valida
+# desde ahí, sin crear copias en memoria del contenido
+UPLOAD_STREAM_THRESHOLD = 16 * 1024 * 1024
+
+# Threads usados para escribir en temp/ los archivos subidos
+UPLOAD_WRITE_WORKERS = 8
+
+# Antigüedad máxima (segundos) de archivos huérfanos en temp/ al iniciar
+TEMP_MAX_AGE_SECONDS = 24 * 60 * 60
+
+
+# Tags raíz aceptados como exportación de PowerCenter
+POWERCENTER_ROOT_TAGS = frozenset({'POWERMART', 'Repository', 'Folder'})
+
+# Estilos y plantilla HTML de la vista de cards. Los estilos se emiten una
+# sola vez por render y cada card sólo lleva clases, no CSS inline.
+_CARDS_CSS = """
+<style>
+    .xml-card {
+        border: 2px solid #ddd;
+        background-color: #f8f9fa;
+        padding: 15px;
+        border-radius: 8px;
+        margin-bottom: 15px;
+    }
+    .xml-card.active {
+        border-color: #28a745;
+        background-color: #d4edda;
+    }
+    .xml-card h4 { margin: 0 0 10px 0; }
+    .xml-card p { margin: 0; color: #666; }
+    .xml-card p.xml-card-badge { margin: 5px 0 0 0; color: #28a745; font-weight: bold; }
+</style>
+"""
+
+_CARD_TEMPLATE = (
+    '<div class="xml-card{active_cls}">'
+    '<h4>{icon} {name}</h4>'
+    '<p><strong>Size:</strong> {size}</p>'
+    '{badge}'
+    '</div>'
+)
+
+# Fragmentos de la card indexados por int(is_active)
+_CARD_ACTIVE_CLASS = ("", " active")
+_CARD_ICON = ("📄", "▶️")
+_CARD_BADGE = ("", '<p class="xml-card-badge">✓ Active</p>')
+
+# Bytes iniciales que se inspeccionan para identificar el tag raíz sin parsear
+ROOT_SNIFF_BYTES = 4096
+
+# Tamaño de los bloques que se entregan al parser incremental
+FEED_CHUNK_BYTES = 1 << 20
+
+# Prólogo XML (BOM, declaración, comentarios, DOCTYPE) seguido del tag raíz
+_ROOT_TAG_RE = re.compile(
+    rb'\A(?:\xef\xbb\xbf)?'
+    rb'(?:\s+|<\?.*?\?>|<!--.*?-->|<!DOCTYPE[^>\[]*(?:\[.*?\])?\s*>)*'
+    rb'<([A-Za-z_][\w.:-]*)',
+    re.DOTALL
+)
+
+
+def _sniff_root_tag(head):
+    """
+    Obtiene el tag raíz a partir de los primeros bytes de un XML
+
+    Args:
+        head: Primeros bytes del documento
+
+    Returns:
+        Nombre del tag raíz, o None si no se puede determinar desde el prefijo
+    """
+    match = _ROOT_TAG_RE.match(head)
+    return match.group(1).decode('ascii', 'replace') if match else None
+
+
+class _RootTagTarget:
+    """
+    Target SAX para lxml: recorre el documento completo (verificando que
+    esté bien formado) sin construir el árbol, registrando sólo el tag raíz
+    """
+
+    def __init__(self):
+        self.root_tag = None
+
+    def start(self, tag, attrib):
+        if self.root_tag is None:
+            self.root_tag = tag
+
+    def close(self):
+        # Se reinicia para que el parser (y este target) puedan reutilizarse
+        root_tag, self.root_tag = self.root_tag, None
+        return root_tag
+
+
+# Parser reutilizable por thread (los parsers de lxml no son thread-safe)
+_parser_local = threading.local()
+
+
+def _root_tag_parser():
+    """Devuelve el parser con _RootTagTarget del thread actual, creándolo si falta"""
+    parser = getattr(_parser_local, 'parser', None)
+    if parser is None:
+        parser = etree.XMLParser(target=_RootTagTarget(), resolve_entities=False, huge_tree=False)
+        _parser_local.parser = parser
+    return parser
+
+
+def is_powercenter_xml(source, size=None):
+    """
+    Verifica que un XML esté bien formado y que su raíz sea de PowerCenter
+
+    Args:
+        source: Ruta al archivo XML o contenido en bytes
+        size: Tamaño del archivo si el llamador ya lo obtuvo (evita un fstat)
+
+    Returns:
+        Tuple (is_valid, error_message)
+    """
+    if isinstance(source, (bytes, bytearray)):
+        return _check_powercenter_bytes(source)
+
+    # Los archivos en disco se mapean en memoria: el kernel carga las páginas
+    # a medida que el parser avanza, sin copiar el archivo completo a RAM
+    try:
+        with open(source, 'rb') as f:
+            if size is None:
+                size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return False, "XML Parse Error: Document is empty"
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _check_powercenter_bytes(mm)
+    except OSError as e:
+        return False, f"Error: {str(e)}"
+
+
+def _check_powercenter_bytes(data):
+    """
+    Valida un XML a partir de un objeto tipo bytes (bytes, bytearray o mmap)
+
+    Returns:
+        Tuple (is_valid, error_message)
+    """
+    # Descarte rápido: el prefijo basta para ver un tag raíz ajeno a PowerCenter
+    root_tag = _sniff_root_tag(data[:ROOT_SNIFF_BYTES])
+    if root_tag is not None and root_tag not in POWERCENTER_ROOT_TAGS:
+        return False, "Not a valid PowerCenter XML file"
+
+    parser = _root_tag_parser()
+
+    try:
+        for offset in range(0, len(data), FEED_CHUNK_BYTES):
+            parser.feed(data[offset:offset + FEED_CHUNK_BYTES])
+        root_tag = parser.close()
+    except etree.XMLSyntaxError as e:
+        # Un error puede dejar el parser a medio documento: se descarta
+        _parser_local.parser = None
+        return False, f"XML Parse Error: {str(e)}"
+
+    if root_tag not in POWERCENTER_ROOT_TAGS:
+        return False, "Not a valid PowerCenter XML file"
+
+    return True, None
+
+
+@st.cache_data(show_spinner=False)
+def _validate_path_cached(path, mtime_ns, size):
+    """
+    Valida un XML en disco. El resultado queda cacheado por (path, mtime, size),
+    de modo que los reruns de Streamlit no vuelven a parsear archivos sin cambios.
+    """
+    return is_powercenter_xml(path, size)
+
+
+@st.cache_data(show_spinner=False)
+def _validate_buffer_cached(digest, _data):
+    """
+    Valida un XML en memoria. El cache se indexa sólo por el digest del
+    contenido (``_data`` no se hashea por llevar prefijo ``_``). ``_data``
+    puede ser un memoryview: sólo se copia a bytes cuando hay que validar.
+    """
+    return is_powercenter_xml(bytes(_data))
+
+
+def _sweep_stale_temp_files():
+    """Elimina de temp/ los archivos más antiguos que TEMP_MAX_AGE_SECONDS"""
+    if not TEMP_DIR.is_dir():
+        return
+
+    cutoff = time.time() - TEMP_MAX_AGE_SECONDS
+    with os.scandir(TEMP_DIR) as entries:
+        for entry in entries:
+            try:
+                if entry.is_file() and entry.stat().st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except OSError:
+                pass
+
+
+@st.cache_resource(show_spinner=False)
+def _temp_file_owners():
+    """
+    Registro a nivel de proceso: ruta en temp/ -> ids de sesión que la usan.
+    Se crea una sola vez por proceso, momento en que se limpian los
+    archivos huérfanos que dejaron ejecuciones anteriores.
+    """
+    _sweep_stale_temp_files()
+    return {}
+
+
+def _session_id():
+    """Id de la sesión de Streamlit actual (None fuera de un script run)"""
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+
+def _release_temp_file(path):
+    """Libera un archivo de temp/ y lo elimina si ninguna sesión lo usa"""
+    owners = _temp_file_owners()
+    sessions = owners.get(path)
+    if sessions is None:
+        return
+
+    sessions.discard(_session_id())
+    if not sessions:
+        del owners[path]
+        Path(path).unlink(missing_ok=True)
+
+
+def _write_temp_file(path, data, digest):
+    """
+    Escribe ``data`` en ``path`` salvo que ya tenga el mismo contenido.
+    ``data`` puede ser el contenido en bytes o la ruta de una copia privada
+    ya validada (ver _stream_to_temp), que se mueve a ``path`` o se descarta.
+    """
+    if isinstance(data, Path):
+        if _same_content(path, data.stat().st_size, digest):
+            data.unlink(missing_ok=True)
+        else:
+            os.replace(data, path)
+    elif data is not None and not _same_content(path, len(data), digest):
+        path.write_bytes(data)
+
+
+def _stream_to_temp(uploaded_file):
+    """
+    Copia un archivo subido en bloques a un archivo privado de temp/ y lo
+    valida desde disco. La ruta definitiva no se toca: si el XML no es
+    válido, sólo se elimina la copia privada.
+
+    Returns:
+        Tuple (is_valid, error_message, staged_path); staged_path es None si no es válido
+    """
+    uploaded_file.seek(0)
+    f = tempfile.NamedTemporaryFile(dir=TEMP_DIR, prefix='.upload-', suffix='.part', delete=False)
+    staged_path = Path(f.name)
+    try:
+        with f:
+            shutil.copyfileobj(uploaded_file, f, length=FEED_CHUNK_BYTES)
+        is_valid, error = is_powercenter_xml(staged_path, uploaded_file.size)
+    except BaseException:
+        staged_path.unlink(missing_ok=True)
+        raise
+
+    if not is_valid:
+        staged_path.unlink(missing_ok=True)
+        return False, error, None
+    return True, None, staged_path
+
+
+def _format_kb(size_bytes):
+    """Formatea un tamaño en bytes como KB con dos decimales (ej. '10.75 KB')"""
+    return f"{size_bytes / 1024:.2f} KB"
+
+
+def _same_content(path, size, digest):
+    """Indica si ``path`` ya existe con el tamaño y digest indicados"""
+    try:
+        if path.stat().st_size != size:
+            return False
+    except FileNotFoundError:
+        return False
+    return hashlib.blake2b(path.read_bytes(), digest_size=16).digest() == digest
+
+
+def _request_removal(*indices):
+    """Callback: marca archivos para ser eliminados al inicio del próximo render"""
+    st.session_state['_delete_indices'] = indices
+
+
+def _apply_pending_removal():
+    """Elimina los archivos marcados por _request_removal, si los hay"""
+    indices = st.session_state.pop('_delete_indices', None)
+    if not indices:
+        return
+
+    xml_files = st.session_state['xml_files']
+    active_path = st.session_state.get('xml_path')
+    removed_active = False
+
+    # De mayor a menor para que los índices pendientes sigan siendo válidos
+    for idx in sorted(set(indices), reverse=True):
+        if idx >= len(xml_files):
+            continue
+        removed = xml_files.pop(idx)
+        st.session_state['xml_names'].discard(removed['name'])
+        st.session_state['xml_digests'].discard(removed.get('digest'))
+        _release_temp_file(removed['path'])
+        removed_active = removed_active or removed['path'] == active_path
+
+    # La selección de la tabla apunta a filas que ya no existen
+    st.session_state.pop('xml_table', None)
+
+    # Si es el archivo activo, limpiar session state
+    if removed_active:
+        st.session_state['xml_path'] = None
+        st.session_state['xml_name'] = None
+        st.session_state['xml_loaded'] = False
+        st.session_state['parsed_data'] = None
+        st.session_state['adf_data'] = None
+        st.session_state['migrated'] = False
+
+
+def _select_file(idx):
+    """Callback: establece un archivo como activo y limpia datos previos"""
+    xml_file = st.session_state['xml_files'][idx]
+    st.session_state['xml_path'] = xml_file['path']
+    st.session_state['xml_name'] = Path(xml_file['name']).stem
+    st.session_state['xml_loaded'] = True
+    st.session_state['parsed_data'] = None
+    st.session_state['adf_data'] = None
+    st.session_state['migrated'] = False
 
 
 def render_upload_tab():
     """
     Renderiza el tab de carga de archivos XML
     """
+    # Índice de nombres cargados para detección de duplicados en O(1)
+    st.session_state.setdefault(
+        'xml_names', {f['name'] for f in st.session_state.get('xml_files', [])}
+    )
+    # Índice de contenidos cargados (archivos idénticos con distinto nombre)
+    st.session_state.setdefault(
+        'xml_digests',
+        {f['digest'] for f in st.session_state.get('xml_files', []) if f.get('digest')}
+    )
+
+    # Aplicar eliminaciones pendientes antes de renderizar la lista
+    _apply_pending_removal()
+
     st.header("📁 Upload PowerCenter Mappings")
     st.markdown("Upload XML files individually or load from a folder containing multiple mappings")
 
@@ -45,49 +408,91 @@ def render_upload_tab():
         )
 
         if uploaded_files is not None and len(uploaded_files) > 0:
-            # Procesar cada archivo subido
-            new_files_count = 0
+            # Procesar cada archivo subido (los cambios se aplican al final)
+            additions = []
+            pending_writes = []
+            loaded_names = st.session_state['xml_names']
+            loaded_digests = st.session_state['xml_digests']
             errors = []
 
+            TEMP_DIR.mkdir(exist_ok=True)
+
             for uploaded_file in uploaded_files:
                 # Verificar si ya existe
-                if any(f['name'] == uploaded_file.name for f in st.session_state['xml_files']):
+                if uploaded_file.name in loaded_names:
                     continue
 
-                # Guardar archivo temporalmente
-                temp_path = Path("temp") / uploaded_file.name
-                temp_path.parent.mkdir(exist_ok=True)
+                # Rechazar archivos sobre el límite antes de tocar su contenido
+                if uploaded_file.size > UPLOAD_MAX_BYTES:
+                    errors.append(
+                        f"File too large '{uploaded_file.name}': {_format_kb(uploaded_file.size)} "
+                        f"(limit: {UPLOAD_MAX_BYTES >> 20} MB)"
+                    )
+                    continue
 
                 try:
-                    # Escribir archivo
-                    with open(temp_path, "wb") as f:
-                        f.write(uploaded_file.getbuffer())
-
-                    # Validar que sea XML válido
-                    try:
-                        ET.parse(str(temp_path))
-
-                        # Agregar a lista de archivos
-                        st.session_state['xml_files'].append({
-                            'name': uploaded_file.name,
-                            'path': str(temp_path),
-                            'size': round(uploaded_file.size / 1024, 2)
-                        })
-                        new_files_count += 1
-
-                    except ET.ParseError as e:
-                        errors.append(f"Invalid XML '{uploaded_file.name}': {str(e)}")
-                        # Eliminar archivo inválido
-                        if temp_path.exists():
-                            temp_path.unlink()
+                    buf = uploaded_file.getbuffer()
+
+                    # Omitir contenido ya cargado, aunque venga con otro nombre
+                    digest = hashlib.blake2b(buf, digest_size=16).digest()
+                    if digest in loaded_digests:
+                        continue
+
+                    temp_path = TEMP_DIR / uploaded_file.name
+
+                    if uploaded_file.size > UPLOAD_STREAM_THRESHOLD:
+                        # Archivos grandes: se validan desde una copia privada en disco,
+                        # que luego se mueve a temp_path junto con las demás escrituras
+                        is_valid, error, buf = _stream_to_temp(uploaded_file)
+                    else:
+                        # Validar que sea XML válido (cacheado por contenido)
+                        is_valid, error = _validate_buffer_cached(digest, buf)
+
+                    if not is_valid:
+                        errors.append(f"Invalid file '{uploaded_file.name}': {error}")
+                        continue
+
+                    # Guardar archivo temporalmente (se escribe en lote más abajo)
+                    pending_writes.append((temp_path, buf, digest, {
+                        'name': uploaded_file.name,
+                        'path': str(temp_path),
+                        'size_bytes': uploaded_file.size,
+                        'size_label': _format_kb(uploaded_file.size),
+                        'digest': digest
+                    }))
+                    loaded_names.add(uploaded_file.name)
+                    loaded_digests.add(digest)
 
                 except Exception as e:
                     errors.append(f"Error processing '{uploaded_file.name}': {str(e)}")
 
-            # Mostrar resultados
+            # Escribir los archivos en paralelo; se agregan en el orden de carga
+            if pending_writes:
+                with ThreadPoolExecutor(max_workers=UPLOAD_WRITE_WORKERS) as pool:
+                    futures = [
+                        pool.submit(_write_temp_file, temp_path, buf, digest)
+                        for temp_path, buf, digest, _ in pending_writes
+                    ]
+
+                    for (temp_path, buf, digest, entry), future in zip(pending_writes, futures):
+                        try:
+                            future.result()
+                        except OSError as e:
+                            if isinstance(buf, Path):
+                                buf.unlink(missing_ok=True)
+                            errors.append(f"Error processing '{entry['name']}': {str(e)}")
+                            loaded_names.discard(entry['name'])
+                            loaded_digests.discard(digest)
+                            continue
+
+                        _temp_file_owners().setdefault(str(temp_path), set()).add(_session_id())
+                        additions.append(entry)
+
+            # Mostrar resultados (la lista de abajo se renderiza en este mismo run)
+            new_files_count = len(additions)
             if new_files_count > 0:
+                st.session_state['xml_files'] = st.session_state['xml_files'] + additions
                 st.success(f"✅ Successfully added {new_files_count} file(s)")
-                st.rerun()
 
             if errors:
                 for error in errors:
@@ -121,16 +526,14 @@ def render_upload_tab():
                     xml_files = load_xmls_from_folder(folder_path)
                     if xml_files:
                         # Agregar archivos que no estén ya en la lista
-                        new_files = 0
-                        for xml_file in xml_files:
-                            if not any(f['name'] == xml_file['name']
-                                     for f in st.session_state['xml_files']):
-                                st.session_state['xml_files'].append(xml_file)
-                                new_files += 1
+                        loaded_names = st.session_state['xml_names']
+                        additions = [f for f in xml_files if f['name'] not in loaded_names]
+                        new_files = len(additions)
 
                         if new_files > 0:
+                            st.session_state['xml_files'] = st.session_state['xml_files'] + additions
+                            loaded_names.update(f['name'] for f in additions)
                             st.success(f"✅ Added {new_files} new XML files")
-                            st.rerun()
                         else:
                             st.info("ℹ️ All files from folder already loaded")
                 else:
@@ -184,98 +587,72 @@ def render_upload_tab():
 
 
 def render_table_view():
-    """Renderiza lista de archivos en formato tabla"""
-    for idx, xml_file in enumerate(st.session_state['xml_files']):
-        col1, col2, col3, col4 = st.columns([4, 2, 1, 1])
+    """Renderiza lista de archivos en formato tabla (un único st.dataframe)"""
+    xml_files = st.session_state['xml_files']
+    active_path = st.session_state.get('xml_path')
+
+    event = st.dataframe(
+        {
+            'Active': [f['path'] == active_path for f in xml_files],
+            'Name': [f['name'] for f in xml_files],
+            'Size': [f['size_label'] for f in xml_files],
+        },
+        column_config={
+            'Active': st.column_config.CheckboxColumn("Active", width="small"),
+            'Name': st.column_config.TextColumn("Name", width="large"),
+            'Size': st.column_config.TextColumn("Size", width="small"),
+        },
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="multi-row",
+        key="xml_table"
+    )
+    selected_rows = event.selection.rows
+
+    col1, col2, _ = st.columns([1, 1, 2])
 
-        with col1:
-            # Mostrar indicador si es el archivo activo
-            is_active = st.session_state.get('xml_path') == xml_file['path']
-            icon = "▶️" if is_active else "📄"
-            st.text(f"{icon} {xml_file['name']}")
-
-        with col2:
-            st.text(f"{xml_file['size']} KB")
-
-        with col3:
-            if st.button("👁️", key=f"view_{idx}", help="Select this file"):
-                st.session_state['xml_path'] = xml_file['path']
-                st.session_state['xml_name'] = Path(xml_file['name']).stem
-                st.session_state['xml_loaded'] = True
-                # Limpiar datos parseados previos
-                st.session_state['parsed_data'] = None
-                st.session_state['adf_data'] = None
-                st.session_state['migrated'] = False
-                st.success(f"✅ Selected: {xml_file['name']}")
-                st.rerun()
-
-        with col4:
-            if st.button("🗑️", key=f"delete_{idx}", help="Remove this file"):
-                # Si es el archivo activo, limpiar session state
-                if st.session_state.get('xml_path') == xml_file['path']:
-                    st.session_state['xml_path'] = None
-                    st.session_state['xml_name'] = None
-                    st.session_state['xml_loaded'] = False
-                    st.session_state['parsed_data'] = None
-                    st.session_state['adf_data'] = None
-                    st.session_state['migrated'] = False
-
-                st.session_state['xml_files'].pop(idx)
-                st.rerun()
+    with col1:
+        st.button("👁️ Select", key="view_selected", help="Select the highlighted file",
+                  disabled=len(selected_rows) != 1, use_container_width=True,
+                  on_click=_select_file, args=tuple(selected_rows[:1]))
+
+    with col2:
+        st.button("🗑️ Remove", key="delete_selected", help="Remove the highlighted files",
+                  disabled=not selected_rows, use_container_width=True,
+                  on_click=_request_removal, args=tuple(selected_rows))
 
 
 def render_cards_view():
     """Renderiza lista de archivos en formato cards"""
+    # Estilos compartidos por todas las cards (una sola vez por render)
+    st.markdown(_CARDS_CSS, unsafe_allow_html=True)
+
     cols = st.columns(3)
 
     for idx, xml_file in enumerate(st.session_state['xml_files']):
         with cols[idx % 3]:
             is_active = st.session_state.get('xml_path') == xml_file['path']
-            border_color = "#28a745" if is_active else "#ddd"
-            bg_color = "#d4edda" if is_active else "#f8f9fa"
-
-            st.markdown(f"""
-            <div style="border: 2px solid {border_color};
-                        background-color: {bg_color};
-                        padding: 15px;
-                        border-radius: 8px;
-                        margin-bottom: 15px;">
-                <h4 style="margin: 0 0 10px 0;">
-                    {'▶️' if is_active else '📄'} {xml_file['name']}
-                </h4>
-                <p style="margin: 0; color: #666;">
-                    <strong>Size:</strong> {xml_file['size']} KB
-                </p>
-                {'<p style="margin: 5px 0 0 0; color: #28a745; font-weight: bold;">✓ Active</p>' if is_active else ''}
-            </div>
-            """, unsafe_allow_html=True)
+
+            i = int(is_active)
+
+            st.markdown(_CARD_TEMPLATE.format(
+                active_cls=_CARD_ACTIVE_CLASS[i],
+                icon=_CARD_ICON[i],
+                name=xml_file['name'],
+                size=xml_file['size_label'],
+                badge=_CARD_BADGE[i]
+            ), unsafe_allow_html=True)
 
             col_a, col_b = st.columns(2)
 
             with col_a:
-                if st.button("👁️ Select", key=f"view_card_{idx}", use_container_width=True):
-                    st.session_state['xml_path'] = xml_file['path']
-                    st.session_state['xml_name'] = Path(xml_file['name']).stem
-                    st.session_state['xml_loaded'] = True
-                    # Limpiar datos previos
-                    st.session_state['parsed_data'] = None
-                    st.session_state['adf_data'] = None
-                    st.session_state['migrated'] = False
-                    st.rerun()
+                st.button("👁️ Select", key=f"view_card_{idx}", use_container_width=True,
+                          on_click=_select_file, args=(idx,))
 
             with col_b:
-                if st.button("🗑️ Remove", key=f"delete_card_{idx}", use_container_width=True):
-                    # Si es el archivo activo, limpiar session state
-                    if st.session_state.get('xml_path') == xml_file['path']:
-                        st.session_state['xml_path'] = None
-                        st.session_state['xml_name'] = None
-                        st.session_state['xml_loaded'] = False
-                        st.session_state['parsed_data'] = None
-                        st.session_state['adf_data'] = None
-                        st.session_state['migrated'] = False
-
-                    st.session_state['xml_files'].pop(idx)
-                    st.rerun()
+                st.button("🗑️ Remove", key=f"delete_card_{idx}", use_container_width=True,
+                          on_click=_request_removal, args=(idx,))
 
 
 def load_xmls_from_folder(folder_path):
@@ -296,9 +673,14 @@ def load_xmls_from_folder(folder_path):
         return []
 
     try:
-        # Buscar todos los archivos XML
-        path_obj = Path(folder_path)
-        xml_found = list(path_obj.glob("*.xml"))
+        # Buscar todos los archivos XML (scandir entrega nombre y stat en una
+        # sola pasada sobre el directorio)
+        with os.scandir(folder_path) as entries:
+            xml_found = [
+                (entry.name, entry.path, entry.stat())
+                for entry in entries
+                if entry.name.lower().endswith('.xml') and entry.is_file()
+            ]
 
         if not xml_found:
             st.warning(f"⚠️ No XML files found in: {folder_path}")
@@ -308,23 +690,26 @@ def load_xmls_from_folder(folder_path):
         valid_count = 0
         invalid_files = []
 
-        for file_path in xml_found:
+        for name, path, stat in xml_found:
             try:
-                # Intentar parsear el XML
-                ET.parse(str(file_path))
+                # Validar el XML (cacheado por path, mtime y tamaño)
+                is_valid, _ = _validate_path_cached(path, stat.st_mtime_ns, stat.st_size)
+                if not is_valid:
+                    invalid_files.append(name)
+                    continue
 
                 # Si es válido, agregar a la lista
                 xml_files.append({
-                    'name': file_path.name,
-                    'path': str(file_path),
-                    'size': round(file_path.stat().st_size / 1024, 2)
+                    'name': name,
+                    'path': path,
+                    'size_bytes': stat.st_size,
+                    'size_label': _format_kb(stat.st_size),
+                    'mtime_ns': stat.st_mtime_ns
                 })
                 valid_count += 1
 
-            except ET.ParseError:
-                invalid_files.append(file_path.name)
             except Exception as e:
-                st.warning(f"⚠️ Error reading {file_path.name}: {str(e)}")
+                st.warning(f"⚠️ Error reading {name}: {str(e)}")
 
         # Mostrar resumen
         if valid_count > 0:
@@ -355,18 +740,4 @@ def validate_xml_file(file_path):
     Returns:
         Tuple (is_valid, error_message)
     """
-    try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-
-        # Verificar que sea un archivo de PowerCenter
-        # (Los archivos PC suelen tener un tag root específico)
-        if root.tag not in ['POWERMART', 'Repository', 'Folder']:
-            return False, "Not a valid PowerCenter XML file"
-
-        return True, None
-
-    except ET.ParseError as e:
-        return False, f"XML Parse Error: {str(e)}"
-    except Exception as e:
-        return False, f"Error: {str(e)}"
+    return is_powercenter_xml(file_path)
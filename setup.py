@@ -1,55 +1,9 @@
 """
-Setup configuration for PowerCenter to Azure Data Factory Migrator
-"""
-from setuptools import setup, find_packages
-from pathlib import Path
+Setup configuration for PowerCenter to ADF Migrator
 
-# Read the contents of README file
-this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text(encoding="utf-8")
+La metadata del paquete vive en pyproject.toml (PEP 621); este archivo se
+mantiene sólo como shim para herramientas que aún invocan setup.py.
+"""
+from setuptools import setup
 
-setup(
-    name="pc-to-adf",
-    version="2.0.0",
-    author="Benjamín Riquelme - Entix SpA",
-    author_email="contacto@entix.cl",
-    description="Herramienta CLI y Web para migrar PowerCenter a Azure Data Factory",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/entix/powercenter-to-adf",
-    packages=find_packages(),
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "Topic :: Software Development :: Code Generators",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-    ],
-    python_requires=">=3.8",
-    install_requires=[
-        "lxml>=4.9.0",
-        "jsonschema>=4.17.0",
-        "python-dotenv>=1.0.0",
-        "rich>=13.0.0",
-    ],
-    extras_require={
-        "dev": [
-            "pytest>=7.3.0",
-            "black>=23.0.0",
-            "pylint>=2.17.0",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "pc-to-adf=src.main:main",
-        ],
-    },
-    include_package_data=True,
-    package_data={
-        "": ["config/*.json"],
-    },
-)
+setup()
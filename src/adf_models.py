@@ -0,0 +1,187 @@
+"""
+Modelos pydantic de un dataflow de Azure Data Factory
+Espejo de ADF_DATAFLOW_SCHEMA (adf_validator) para validarlo con pydantic-core
+"""
+
+from typing import Any, List, Literal, Union
+
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, model_validator
+from typing_extensions import Annotated
+
+
+class _ADFModel(BaseModel):
+    """Base: sin coerción de tipos (como JSON Schema) y campos extra permitidos"""
+    model_config = ConfigDict(strict=True, extra='allow')
+
+
+class DatasetReference(_ADFModel):
+    """Referencia a un dataset"""
+    referenceName: Any
+    type: Literal['DatasetReference']
+
+
+class Dependency(_ADFModel):
+    """Elemento de dependsOn"""
+    activity: str
+    dependencyConditions: List[str]
+
+
+DependsOn = Annotated[List[Dependency], Field(min_length=1)]
+
+
+class Expression(_ADFModel):
+    """Expresión de ADF ({'value': ..., 'type': ...})"""
+    value: Any
+    type: Any
+
+
+class Source(_ADFModel):
+    """Source del dataflow"""
+    name: str
+    dataset: DatasetReference
+
+
+class Sink(_ADFModel):
+    """Sink del dataflow"""
+    name: str
+    dataset: DatasetReference
+    dependsOn: DependsOn
+
+
+class DerivedColumnColumn(_ADFModel):
+    """Columna de un DerivedColumn"""
+    name: Any
+    value: Expression
+
+
+class DerivedColumnProps(_ADFModel):
+    columns: List[DerivedColumnColumn]
+
+
+class FilterProps(_ADFModel):
+    condition: Expression
+
+
+class AggregateProps(_ADFModel):
+    aggregates: Any
+
+
+class JoinProps(_ADFModel):
+    joinType: str
+    leftInput: Any
+    rightInput: Any
+    joinConditions: Any
+
+
+class SortProps(_ADFModel):
+    sortColumns: Any
+
+
+class ConditionalSplitProps(_ADFModel):
+    conditions: Any
+
+
+class LookupProps(_ADFModel):
+    lookupDataset: Any
+
+
+class AlterRowProps(_ADFModel):
+    """Requiere al menos una condición de AlterRow"""
+
+    @model_validator(mode='before')
+    @classmethod
+    def _require_condition(cls, data: Any) -> Any:
+        if isinstance(data, dict) and not any(
+            c in data for c in ('insertCondition', 'updateCondition', 'deleteCondition', 'upsertCondition')
+        ):
+            raise ValueError("AlterRow sin condición")
+        return data
+
+
+class Transformation(_ADFModel):
+    """Transformation de un tipo sin typeProperties conocidas"""
+    name: str
+    type: str
+    dependsOn: DependsOn
+    typeProperties: Any
+
+
+class DerivedColumn(Transformation):
+    typeProperties: DerivedColumnProps
+
+
+class Filter(Transformation):
+    typeProperties: FilterProps
+
+
+class Aggregate(Transformation):
+    typeProperties: AggregateProps
+
+
+class Join(Transformation):
+    typeProperties: JoinProps
+
+
+class Sort(Transformation):
+    typeProperties: SortProps
+
+
+class ConditionalSplit(Transformation):
+    typeProperties: ConditionalSplitProps
+
+
+class Lookup(Transformation):
+    typeProperties: LookupProps
+
+
+class AlterRow(Transformation):
+    typeProperties: AlterRowProps
+
+
+# Modelo por valor de 'type'; cualquier otro tipo usa Transformation
+_TRANSFORMATION_MODELS = {
+    'derivedColumn': DerivedColumn,
+    'filter': Filter,
+    'aggregate': Aggregate,
+    'join': Join,
+    'sort': Sort,
+    'conditionalSplit': ConditionalSplit,
+    'lookup': Lookup,
+    'alterRow': AlterRow
+}
+
+
+def _transformation_tag(value: Any) -> str:
+    """Discriminador: el type si tiene modelo propio, 'other' si no"""
+    trans_type = value.get('type') if isinstance(value, dict) else getattr(value, 'type', None)
+    return trans_type if type(trans_type) is str and trans_type in _TRANSFORMATION_MODELS else 'other'
+
+
+AnyTransformation = Annotated[
+    Union[
+        tuple(Annotated[model, Tag(tag)] for tag, model in _TRANSFORMATION_MODELS.items())
+        + (Annotated[Transformation, Tag('other')],)
+    ],
+    Discriminator(_transformation_tag)
+]
+
+
+class TypeProperties(_ADFModel):
+    """properties.typeProperties del dataflow"""
+    sources: List[Source]
+    transformations: List[AnyTransformation]
+    sinks: List[Sink]
+    scriptLines: Any
+
+
+class Properties(_ADFModel):
+    """properties del dataflow"""
+    type: Literal['MappingDataFlow']
+    typeProperties: TypeProperties
+
+
+class DataFlow(_ADFModel):
+    """Dataflow completo de ADF"""
+    name: str
+    type: Literal['Microsoft.DataFactory/factories/dataflows']
+    properties: Properties
@@ -3,16 +3,345 @@ Validador de esquemas de Azure Data Factory
 Valida que los JSONs generados cumplan con el esquema oficial de ADF
 """
 
+import hashlib
+import json
 import logging
-from typing import Dict, Any, List, Tuple
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Any, Callable, List, Optional, Tuple, Union
+
+try:
+    import fastjsonschema
+except ImportError:  # Dependencia opcional (extra "fast")
+    fastjsonschema = None
+
+try:
+    import orjson
+except ImportError:  # Dependencia opcional (extra "fast")
+    orjson = None
+
+try:
+    import jsonschema_rs
+except ImportError:  # Dependencia opcional (extra "rust")
+    jsonschema_rs = None
+
+try:
+    from pydantic import ValidationError as PydanticValidationError
+    from .adf_models import DataFlow
+except ImportError:  # Dependencia opcional (extra "pydantic")
+    DataFlow = None
+
+from .utils import hash_json
 
 logger = logging.getLogger('pc-to-adf.adf_validator')
 
+# Por debajo de este número de dataflows no compensa arrancar procesos
+BULK_PROCESS_MIN_FLOWS = 32
+
+# Resultados de validación recordados por contenido del dataflow
+VALIDATION_CACHE_SIZE = 256
+
+
+def _if_type(trans_type: str, props_schema: Dict[str, Any]) -> Dict[str, Any]:
+    """Sub-esquema que aplica props_schema a typeProperties si type == trans_type"""
+    return {
+        'if': {'properties': {'type': {'const': trans_type}}},
+        'then': {'properties': {'typeProperties': props_schema}}
+    }
+
+
+def _props_requiring(*fields: str) -> Dict[str, Any]:
+    """Sub-esquema de typeProperties con los campos requeridos indicados"""
+    return {'type': 'object', 'required': list(fields)}
+
+
+# Esquema JSON de un dataflow de ADF. Para datos JSON (dict, list y str
+# exactos) cubre todas las validaciones estructurales de ADFSchemaValidator
+# (campos requeridos, tipos y valores fijos); las referencias entre steps y
+# los warnings se revisan aparte. Los backends compilados aceptan además
+# tuplas y subclases, que la validación detallada rechaza: ver _exact_json_types.
+ADF_DATAFLOW_SCHEMA: Dict[str, Any] = {
+    'type': 'object',
+    'required': ['name', 'properties', 'type'],
+    'properties': {
+        'name': {'type': 'string'},
+        'type': {'const': 'Microsoft.DataFactory/factories/dataflows'},
+        'properties': {
+            'type': 'object',
+            'required': ['type', 'typeProperties'],
+            'properties': {
+                'type': {'const': 'MappingDataFlow'},
+                'typeProperties': {
+                    'type': 'object',
+                    'required': ['sources', 'transformations', 'sinks', 'scriptLines'],
+                    'properties': {
+                        'sources': {'type': 'array', 'items': {'$ref': '#/definitions/source'}},
+                        'transformations': {
+                            'type': 'array',
+                            'items': {'$ref': '#/definitions/transformation'}
+                        },
+                        'sinks': {'type': 'array', 'items': {'$ref': '#/definitions/sink'}}
+                    }
+                }
+            }
+        }
+    },
+    'definitions': {
+        'datasetReference': {
+            'type': 'object',
+            'required': ['referenceName', 'type'],
+            'properties': {'type': {'const': 'DatasetReference'}}
+        },
+        'dependsOn': {
+            'type': 'array',
+            'minItems': 1,
+            'items': {
+                'type': 'object',
+                'required': ['activity', 'dependencyConditions'],
+                'properties': {
+                    'activity': {'type': 'string'},
+                    'dependencyConditions': {'type': 'array', 'items': {'type': 'string'}}
+                }
+            }
+        },
+        'source': {
+            'type': 'object',
+            'required': ['name', 'dataset'],
+            'properties': {
+                'name': {'type': 'string'},
+                'dataset': {'$ref': '#/definitions/datasetReference'}
+            }
+        },
+        'sink': {
+            'type': 'object',
+            'required': ['name', 'dataset', 'dependsOn'],
+            'properties': {
+                'name': {'type': 'string'},
+                'dataset': {'$ref': '#/definitions/datasetReference'},
+                'dependsOn': {'$ref': '#/definitions/dependsOn'}
+            }
+        },
+        'expression': {'type': 'object', 'required': ['value', 'type']},
+        'transformation': {
+            'type': 'object',
+            'required': ['name', 'type', 'dependsOn', 'typeProperties'],
+            'properties': {
+                'name': {'type': 'string'},
+                'type': {'type': 'string'},
+                'dependsOn': {'$ref': '#/definitions/dependsOn'}
+            },
+            'allOf': [
+                _if_type('derivedColumn', {
+                    'type': 'object',
+                    'required': ['columns'],
+                    'properties': {
+                        'columns': {
+                            'type': 'array',
+                            'items': {
+                                'type': 'object',
+                                'required': ['name', 'value'],
+                                'properties': {'value': {'$ref': '#/definitions/expression'}}
+                            }
+                        }
+                    }
+                }),
+                _if_type('filter', {
+                    'type': 'object',
+                    'required': ['condition'],
+                    'properties': {'condition': {'$ref': '#/definitions/expression'}}
+                }),
+                _if_type('aggregate', _props_requiring('aggregates')),
+                _if_type('join', {
+                    'type': 'object',
+                    'required': ['joinType', 'leftInput', 'rightInput', 'joinConditions'],
+                    'properties': {'joinType': {'type': 'string'}}
+                }),
+                _if_type('sort', _props_requiring('sortColumns')),
+                _if_type('conditionalSplit', _props_requiring('conditions')),
+                _if_type('lookup', _props_requiring('lookupDataset')),
+                _if_type('alterRow', {
+                    'type': 'object',
+                    'anyOf': [
+                        {'required': ['insertCondition']},
+                        {'required': ['updateCondition']},
+                        {'required': ['deleteCondition']},
+                        {'required': ['upsertCondition']}
+                    ]
+                })
+            ]
+        }
+    }
+}
+
+# Backends disponibles para la comprobación compilada del esquema, por
+# orden de preferencia. 'python' usa solo la validación detallada.
+SCHEMA_BACKENDS = ('jsonschema_rs', 'fastjsonschema', 'pydantic', 'python')
+
+
+def _compile_schema_check(backend: str) -> Optional[Callable[[Any], bool]]:
+    """
+    Compila ADF_DATAFLOW_SCHEMA con el backend indicado.
+
+    Args:
+        backend: Uno de SCHEMA_BACKENDS
+
+    Returns:
+        Función dataflow -> bool (cumple el esquema), o None si el backend
+        es 'python' o no está instalado
+    """
+    if backend == 'jsonschema_rs' and jsonschema_rs is not None:
+        is_valid = jsonschema_rs.validator_for(ADF_DATAFLOW_SCHEMA).is_valid
+
+        def check(dataflow: Any) -> bool:
+            try:
+                return is_valid(dataflow)
+            except ValueError as e:
+                # Valores que no convierte a JSON (ej. claves de una subclase de str)
+                logger.debug(f"Dataflow no convertible por jsonschema_rs ({e}); validación detallada")
+                return False
+
+        return check
+
+    if backend == 'fastjsonschema' and fastjsonschema is not None:
+        validate = fastjsonschema.compile(ADF_DATAFLOW_SCHEMA)
+
+        def check(dataflow: Any) -> bool:
+            try:
+                validate(dataflow)
+            except fastjsonschema.JsonSchemaException as e:
+                logger.debug(f"Dataflow no cumple el esquema ({e.message}); validación detallada")
+                return False
+            return True
+
+        return check
+
+    if backend == 'pydantic' and DataFlow is not None:
+        def check(dataflow: Any) -> bool:
+            try:
+                DataFlow.model_validate(dataflow)
+            except PydanticValidationError as e:
+                logger.debug(f"Dataflow no cumple el esquema ({e.error_count()} errores); validación detallada")
+                return False
+            return True
+
+        return check
+
+    return None
+
+
+def _select_schema_check() -> Optional[Callable[[Any], bool]]:
+    """
+    Elige el backend según ADF_VALIDATOR_BACKEND ('auto' por defecto: el
+    más rápido instalado).
+    """
+    backend = os.environ.get('ADF_VALIDATOR_BACKEND', 'auto').strip().lower()
+
+    if backend in SCHEMA_BACKENDS:
+        check = _compile_schema_check(backend)
+        if check is not None or backend == 'python':
+            return check
+        logger.warning(f"Backend de validación '{backend}' no instalado; se usa el disponible")
+    elif backend != 'auto':
+        logger.warning(f"ADF_VALIDATOR_BACKEND desconocido: '{backend}'")
+
+    for candidate in SCHEMA_BACKENDS:
+        check = _compile_schema_check(candidate)
+        if check is not None:
+            return check
+    return None
+
+
+# Comprobación compilada una sola vez al importar el módulo (None si no hay backend)
+_COMPILED_SCHEMA = _select_schema_check()
+
+# Campos requeridos por nivel. Se guardan como vistas de claves de dict:
+# conservan el orden (para los mensajes) y admiten operaciones de conjunto.
+_TOP_LEVEL_FIELDS = {'name': str, 'properties': dict, 'type': str}
+_PROPERTIES_FIELDS = {'type': str, 'typeProperties': dict}
+_TYPE_PROPERTIES_REQUIRED = dict.fromkeys(('sources', 'transformations', 'sinks', 'scriptLines')).keys()
+_STEP_LIST_FIELDS = {'sources': list, 'transformations': list, 'sinks': list}
+_TRANSFORMATION_FIELDS = {'type': str, 'typeProperties': dict}
+_DERIVED_COLUMN_FIELDS = {'columns': list}
+_COLUMN_FIELDS = {'value': dict}
+_FILTER_FIELDS = {'condition': dict}
+_SOURCE_REQUIRED = dict.fromkeys(('name', 'dataset')).keys()
+_TRANSFORMATION_REQUIRED = dict.fromkeys(('name', 'type', 'dependsOn', 'typeProperties')).keys()
+_SINK_REQUIRED = dict.fromkeys(('name', 'dataset', 'dependsOn')).keys()
+_DATASET_REFERENCE_REQUIRED = dict.fromkeys(('referenceName', 'type')).keys()
+_JOIN_REQUIRED = dict.fromkeys(('joinType', 'leftInput', 'rightInput', 'joinConditions')).keys()
+
+# Valores estándar de ADF. Son tuplas cortas: para tan pocos elementos la
+# búsqueda lineal es tan rápida como un set y admite valores no hashables.
+_VALID_DEP_CONDITIONS = ('Succeeded', 'Failed', 'Skipped', 'Completed')
+_VALID_JOIN_TYPES = ('inner', 'left', 'right', 'outer', 'cross')
+_VALID_ALTER_ROW_CONDITIONS = ('insertCondition', 'updateCondition', 'deleteCondition', 'upsertCondition')
+_ALTER_ROW_CONDITION_KEYS = frozenset(_VALID_ALTER_ROW_CONDITIONS)
+
+# Centinela de dict.get para distinguir "sin nombre" de un nombre None
+_MISSING = object()
+
+# Plantillas de mensajes, formateadas solo cuando se reporta un problema
+_ERR_INVALID_JSON = "JSON inválido: {}"
+_ERR_MISSING_TOP = "Falta campo requerido: '{}'"
+_ERR_BAD_TYPE_TOP = "Campo '{}' debe ser de tipo {}, pero es {}"
+_ERR_BAD_DATAFLOW_TYPE = "Campo 'type' debe ser 'Microsoft.DataFactory/factories/dataflows', pero es '{}'"
+_ERR_MISSING_PROPERTIES = "Falta campo requerido en properties: '{}'"
+_ERR_BAD_TYPE_PROPERTIES = "Campo properties.{} debe ser de tipo {}"
+_ERR_BAD_PROPERTIES_TYPE = "Campo properties.type debe ser 'MappingDataFlow', pero es '{}'"
+_ERR_MISSING_TYPE_PROPERTIES = "Falta campo requerido en typeProperties: '{}'"
+_ERR_NOT_LIST_TYPE_PROPERTIES = "Campo typeProperties.{} debe ser una lista"
+_ERR_SOURCE_MISSING = "Source #{}: Falta campo '{}'"
+_ERR_TRANSFORMATION_MISSING = "Transformation '{}': Falta campo '{}'"
+_ERR_SINK_MISSING = "Sink '{}': Falta campo '{}'"
+_ERR_DATASET_MISSING = "{}: Dataset falta campo '{}'"
+_ERR_DATASET_BAD_TYPE = "{}: Dataset type debe ser 'DatasetReference', pero es '{}'"
+_ERR_DEPENDS_ON_EMPTY = "{}: dependsOn no puede estar vacío"
+_ERR_DEP_NO_ACTIVITY = "{}: Dependencia sin campo 'activity'"
+_ERR_DEP_NO_CONDITIONS = "{}: Dependencia sin campo 'dependencyConditions'"
+_ERR_DEP_UNKNOWN_ACTIVITY = "{}: Dependencia a actividad inexistente '{}'"
+_ERR_DERIVED_NO_COLUMNS = "DerivedColumn '{}': Falta campo 'columns'"
+_ERR_DERIVED_COLUMN_NO_NAME = "DerivedColumn '{}': Columna sin nombre"
+_ERR_DERIVED_COLUMN_NO_VALUE = "DerivedColumn '{}': Columna sin valor"
+_ERR_DERIVED_VALUE_NOT_OBJECT = "DerivedColumn '{}': Valor de columna debe ser objeto"
+_ERR_DERIVED_VALUE_FIELDS = "DerivedColumn '{}': Valor de columna debe tener 'value' y 'type'"
+_ERR_FILTER_NO_CONDITION = "Filter '{}': Falta campo 'condition'"
+_ERR_FILTER_CONDITION_NOT_OBJECT = "Filter '{}': Condition debe ser objeto"
+_ERR_FILTER_CONDITION_FIELDS = "Filter '{}': Condition debe tener 'value' y 'type'"
+_ERR_AGGREGATE_NO_AGGREGATES = "Aggregate '{}': Falta campo 'aggregates'"
+_ERR_JOIN_MISSING = "Join '{}': Falta campo '{}'"
+_ERR_ALTER_ROW_NO_CONDITION = (
+    "AlterRow '{}': Debe tener al menos una condición "
+    f"({', '.join(_VALID_ALTER_ROW_CONDITIONS)})"
+)
+_WARN_NO_SOURCES = "No hay sources definidos"
+_WARN_NO_SINKS = "No hay sinks definidos"
+_WARN_DEP_CONDITION = "{}: Condición de dependencia '{}' no es estándar"
+_WARN_AGGREGATE_NO_GROUP_BY = "Aggregate '{}': No tiene groupBy (posible agregación total)"
+_WARN_JOIN_TYPE = "Join '{}': joinType '{}' no es estándar"
+_CTX_TRANSFORMATION = "Transformation '{}'"
+_CTX_SOURCE = "Source '{}'"
+_CTX_SINK = "Sink '{}'"
+
+
+def _missing_fields(obj: Any, required) -> List[str]:
+    """
+    Campos de required ausentes en obj, en orden.
+    Para dicts completos basta una comparación de conjuntos.
+    """
+    if type(obj) is dict and obj.keys() >= required:
+        return []
+    return [field for field in required if field not in obj]
+
 
 class ADFSchemaValidator:
     """
     Validador de esquemas de Azure Data Factory.
     Garantiza que los JSONs generados sean 100% compatibles con ADF.
+
+    Las validaciones son funciones del módulo sin estado; la clase sólo
+    conserva los resultados de la última llamada en errors/warnings.
     """
 
     def __init__(self):
@@ -30,344 +359,465 @@ class ADFSchemaValidator:
         Returns:
             Tupla (es_válido, lista_errores, lista_warnings)
         """
-        self.errors = []
-        self.warnings = []
+        # validate_dataflow entrega listas nuevas en cada llamada, así que
+        # se pueden devolver sin copiar: la siguiente llamada no las modifica
+        is_valid, self.errors, self.warnings = validate_dataflow(dataflow)
+        return (is_valid, self.errors, self.warnings)
+
+
+def _validate(
+    dataflow: Dict[str, Any],
+    errors: List[str],
+    warnings: List[str],
+    exact_types: Optional[bool] = None
+) -> None:
+    """
+    Valida un dataflow acumulando los resultados en errors/warnings.
+    exact_types es el resultado de _exact_json_types si el llamador ya lo calculó.
+    """
+    # Camino rápido: si el esquema compilado acepta el dataflow, sólo
+    # quedan por revisar las referencias entre steps y los warnings
+    if _COMPILED_SCHEMA is not None:
+        if exact_types is None:
+            exact_types = _exact_json_types(dataflow)
+        if exact_types and _COMPILED_SCHEMA(dataflow):
+            _validate_references(dataflow['properties']['typeProperties'], errors, warnings)
+            return
 
-        # Validación nivel superior
-        self._validate_top_level(dataflow)
+    # Validación nivel superior
+    _validate_top_level(dataflow, errors)
 
-        # Validación de properties
-        if 'properties' in dataflow:
-            self._validate_properties(dataflow['properties'])
+    # Validación de properties
+    if 'properties' in dataflow:
+        _validate_properties(dataflow['properties'], errors)
 
-        # Validación de typeProperties
-        if 'properties' in dataflow and 'typeProperties' in dataflow['properties']:
-            self._validate_type_properties(dataflow['properties']['typeProperties'])
+    # Validación de typeProperties
+    if 'properties' in dataflow and 'typeProperties' in dataflow['properties']:
+        _validate_type_properties(dataflow['properties']['typeProperties'], errors, warnings)
 
-        is_valid = len(self.errors) == 0
-        return (is_valid, self.errors.copy(), self.warnings.copy())
 
-    def _validate_top_level(self, dataflow: Dict[str, Any]) -> None:
-        """Valida campos del nivel superior"""
-        # Campos requeridos
-        required_fields = {
-            'name': str,
-            'properties': dict,
-            'type': str
-        }
+def _exact_json_types(dataflow: Any) -> bool:
+    """
+    Indica si los valores que la validación detallada revisa por tipo exacto
+    (type(x) is dict/list/str) lo tienen, o están ausentes. Solo entonces el
+    resultado depende únicamente del contenido JSON: el esquema compilado da
+    lo mismo con cualquier backend y el caché por digest es válido.
+    """
+    if type(dataflow) is not dict or not _fields_have_types(dataflow, _TOP_LEVEL_FIELDS):
+        return False
+    properties = dataflow.get('properties', {})
+    if not _fields_have_types(properties, _PROPERTIES_FIELDS):
+        return False
+    type_props = properties.get('typeProperties', {})
+    if not _fields_have_types(type_props, _STEP_LIST_FIELDS):
+        return False
+
+    # El nombre de un source solo se registra si el source es un dict exacto
+    if not all(type(source) is dict for source in type_props.get('sources', ())):
+        return False
+
+    for trans in type_props.get('transformations', ()):
+        if type(trans) is not dict or not _fields_have_types(trans, _TRANSFORMATION_FIELDS):
+            return False
+        props = trans.get('typeProperties', {})
+        trans_type = trans.get('type')
+        if trans_type == 'derivedColumn':
+            if not _fields_have_types(props, _DERIVED_COLUMN_FIELDS) or not all(
+                type(col) is dict and _fields_have_types(col, _COLUMN_FIELDS)
+                for col in props.get('columns', ())
+            ):
+                return False
+        elif trans_type == 'filter' and not _fields_have_types(props, _FILTER_FIELDS):
+            return False
+    return True
+
+
+def _fields_have_types(obj: Dict[str, Any], field_types: Dict[str, type]) -> bool:
+    """Indica si cada campo presente de field_types tiene exactamente su tipo"""
+    return all(field not in obj or type(obj[field]) is expected for field, expected in field_types.items())
+
+
+def _validate_references(
+    type_props: Dict[str, Any],
+    errors: List[str],
+    warnings: List[str]
+) -> None:
+    """
+    Revisa dependencias y warnings de un typeProperties que ya cumple
+    ADF_DATAFLOW_SCHEMA (los campos requeridos están garantizados).
+    """
+    sources = type_props['sources']
+    if not sources:
+        warnings.append(_WARN_NO_SOURCES)
+
+    all_steps = {s['name'] for s in sources}
+
+    for trans in type_props['transformations']:
+        trans_name = trans['name']
+        _validate_depends_on(trans['dependsOn'], all_steps, _CTX_TRANSFORMATION.format(trans_name), errors, warnings)
+
+        props = trans['typeProperties']
+        if trans['type'] == 'aggregate' and 'groupBy' not in props:
+            warnings.append(_WARN_AGGREGATE_NO_GROUP_BY.format(trans_name))
+        elif trans['type'] == 'join' and props['joinType'] not in _VALID_JOIN_TYPES:
+            warnings.append(_WARN_JOIN_TYPE.format(trans_name, props['joinType']))
+
+        all_steps.add(trans_name)
+
+    sinks = type_props['sinks']
+    if not sinks:
+        warnings.append(_WARN_NO_SINKS)
+
+    for sink in sinks:
+        _validate_depends_on(sink['dependsOn'], all_steps, _CTX_SINK.format(sink['name']), errors, warnings)
+
+
+def _validate_top_level(dataflow: Dict[str, Any], errors: List[str]) -> None:
+    """Valida campos del nivel superior"""
+    # Campos requeridos
+    missing = _missing_fields(dataflow, _TOP_LEVEL_FIELDS.keys())
+
+    for field, expected_type in _TOP_LEVEL_FIELDS.items():
+        if field in missing:
+            errors.append(_ERR_MISSING_TOP.format(field))
+        elif type(dataflow[field]) is not expected_type:
+            errors.append(_ERR_BAD_TYPE_TOP.format(
+                field, expected_type.__name__, type(dataflow[field]).__name__
+            ))
+
+    # Validar type específico
+    if 'type' in dataflow and dataflow['type'] != 'Microsoft.DataFactory/factories/dataflows':
+        errors.append(_ERR_BAD_DATAFLOW_TYPE.format(dataflow['type']))
+
+
+def _validate_properties(properties: Dict[str, Any], errors: List[str]) -> None:
+    """Valida el objeto properties"""
+    # Campos requeridos
+    missing = _missing_fields(properties, _PROPERTIES_FIELDS.keys())
+
+    for field, expected_type in _PROPERTIES_FIELDS.items():
+        if field in missing:
+            errors.append(_ERR_MISSING_PROPERTIES.format(field))
+        elif type(properties[field]) is not expected_type:
+            errors.append(_ERR_BAD_TYPE_PROPERTIES.format(field, expected_type.__name__))
+
+    # Validar type específico
+    if 'type' in properties and properties['type'] != 'MappingDataFlow':
+        errors.append(_ERR_BAD_PROPERTIES_TYPE.format(properties['type']))
+
+
+def _validate_type_properties(
+    type_props: Dict[str, Any],
+    errors: List[str],
+    warnings: List[str]
+) -> None:
+    """Valida el objeto typeProperties"""
+    # Campos requeridos
+    missing = _missing_fields(type_props, _TYPE_PROPERTIES_REQUIRED)
+
+    for field in _TYPE_PROPERTIES_REQUIRED:
+        if field in missing:
+            errors.append(_ERR_MISSING_TYPE_PROPERTIES.format(field))
+        elif field != 'scriptLines' and type(type_props[field]) is not list:
+            errors.append(_ERR_NOT_LIST_TYPE_PROPERTIES.format(field))
+
+    # Una sola pasada: cada lista agrega sus nombres a los steps disponibles
+    # antes de validar la siguiente
+    all_steps: set = set()
+
+    # Validar sources
+    if 'sources' in type_props:
+        _validate_sources(type_props['sources'], all_steps, errors, warnings)
+
+    # Validar transformations
+    if 'transformations' in type_props:
+        _validate_transformations(type_props['transformations'], all_steps, errors, warnings)
+
+    # Validar sinks
+    if 'sinks' in type_props:
+        _validate_sinks(type_props['sinks'], all_steps, errors, warnings)
+
+
+def _validate_sources(
+    sources: List[Dict[str, Any]],
+    all_steps: set,
+    errors: List[str],
+    warnings: List[str]
+) -> None:
+    """Valida la lista de sources y agrega sus nombres a all_steps"""
+    if not sources:
+        warnings.append(_WARN_NO_SOURCES)
+        return
+
+    for idx, source in enumerate(sources):
+        name = source.get('name', _MISSING) if type(source) is dict else _MISSING
+
+        # Campos requeridos (los ausentes se reutilizan en vez de volver a
+        # consultar cada clave)
+        missing = _missing_fields(source, _SOURCE_REQUIRED)
+        for field in missing:
+            errors.append(_ERR_SOURCE_MISSING.format(idx + 1, field))
+
+        # Validar dataset
+        if 'dataset' not in missing:
+            _validate_dataset_reference(source['dataset'], _CTX_SOURCE.format(idx if name is _MISSING else name), errors)
+
+        # Agregar a steps disponibles
+        if name is not _MISSING:
+            all_steps.add(name)
+
+
+def _validate_transformations(
+    transformations: List[Dict[str, Any]],
+    all_steps: set,
+    errors: List[str],
+    warnings: List[str]
+) -> None:
+    """Valida la lista de transformations y agrega sus nombres a all_steps"""
+    for idx, trans in enumerate(transformations):
+        if (name := trans.get('name', _MISSING)) is _MISSING:
+            trans_name = f"#{idx + 1}"
+        else:
+            trans_name = name
 
-        for field, expected_type in required_fields.items():
-            if field not in dataflow:
-                self.errors.append(f"Falta campo requerido: '{field}'")
-            elif not isinstance(dataflow[field], expected_type):
-                self.errors.append(
-                    f"Campo '{field}' debe ser de tipo {expected_type.__name__}, "
-                    f"pero es {type(dataflow[field]).__name__}"
-                )
-
-        # Validar type específico
-        if 'type' in dataflow:
-            expected_type = 'Microsoft.DataFactory/factories/dataflows'
-            if dataflow['type'] != expected_type:
-                self.errors.append(
-                    f"Campo 'type' debe ser '{expected_type}', "
-                    f"pero es '{dataflow['type']}'"
-                )
-
-    def _validate_properties(self, properties: Dict[str, Any]) -> None:
-        """Valida el objeto properties"""
         # Campos requeridos
-        required_fields = {
-            'type': str,
-            'typeProperties': dict
-        }
+        missing = _missing_fields(trans, _TRANSFORMATION_REQUIRED)
+        for field in missing:
+            errors.append(_ERR_TRANSFORMATION_MISSING.format(trans_name, field))
+
+        # Validar dependsOn
+        if 'dependsOn' not in missing:
+            _validate_depends_on(
+                trans['dependsOn'], all_steps, _CTX_TRANSFORMATION.format(trans_name), errors, warnings
+            )
+
+        # Validar typeProperties según tipo
+        if 'type' not in missing and 'typeProperties' not in missing:
+            validate_props = _TRANS_DISPATCH.get(trans['type'])
+            if validate_props:
+                validate_props(trans['typeProperties'], trans_name, errors, warnings)
+
+        # Agregar a steps disponibles
+        if name is not _MISSING:
+            all_steps.add(name)
+
+
+def _validate_sinks(
+    sinks: List[Dict[str, Any]],
+    all_steps: set,
+    errors: List[str],
+    warnings: List[str]
+) -> None:
+    """Valida la lista de sinks"""
+    if not sinks:
+        warnings.append(_WARN_NO_SINKS)
+        return
+
+    for idx, sink in enumerate(sinks):
+        if (sink_name := sink.get('name', _MISSING)) is _MISSING:
+            sink_name = f"#{idx + 1}"
 
-        for field, expected_type in required_fields.items():
-            if field not in properties:
-                self.errors.append(f"Falta campo requerido en properties: '{field}'")
-            elif not isinstance(properties[field], expected_type):
-                self.errors.append(
-                    f"Campo properties.{field} debe ser de tipo {expected_type.__name__}"
-                )
-
-        # Validar type específico
-        if 'type' in properties:
-            expected_type = 'MappingDataFlow'
-            if properties['type'] != expected_type:
-                self.errors.append(
-                    f"Campo properties.type debe ser '{expected_type}', "
-                    f"pero es '{properties['type']}'"
-                )
-
-    def _validate_type_properties(self, type_props: Dict[str, Any]) -> None:
-        """Valida el objeto typeProperties"""
         # Campos requeridos
-        required_fields = ['sources', 'transformations', 'sinks', 'scriptLines']
-
-        for field in required_fields:
-            if field not in type_props:
-                self.errors.append(f"Falta campo requerido en typeProperties: '{field}'")
-            elif field != 'scriptLines' and not isinstance(type_props[field], list):
-                self.errors.append(f"Campo typeProperties.{field} debe ser una lista")
-
-        # Validar sources
-        if 'sources' in type_props:
-            self._validate_sources(type_props['sources'])
-
-        # Validar transformations
-        if 'transformations' in type_props:
-            self._validate_transformations(
-                type_props['transformations'],
-                type_props.get('sources', [])
-            )
+        missing = _missing_fields(sink, _SINK_REQUIRED)
+        for field in missing:
+            errors.append(_ERR_SINK_MISSING.format(sink_name, field))
 
-        # Validar sinks
-        if 'sinks' in type_props:
-            all_steps = self._get_all_step_names(
-                type_props.get('sources', []),
-                type_props.get('transformations', [])
-            )
-            self._validate_sinks(type_props['sinks'], all_steps)
+        # Validar dataset
+        if 'dataset' not in missing:
+            _validate_dataset_reference(sink['dataset'], _CTX_SINK.format(sink_name), errors)
+
+        # Validar dependsOn
+        if 'dependsOn' not in missing:
+            _validate_depends_on(sink['dependsOn'], all_steps, _CTX_SINK.format(sink_name), errors, warnings)
+
+
+def _validate_dataset_reference(dataset: Dict[str, Any], context: str, errors: List[str]) -> None:
+    """Valida una referencia a dataset"""
+    for field in _missing_fields(dataset, _DATASET_REFERENCE_REQUIRED):
+        errors.append(_ERR_DATASET_MISSING.format(context, field))
+
+    if 'type' in dataset and dataset['type'] != 'DatasetReference':
+        errors.append(_ERR_DATASET_BAD_TYPE.format(context, dataset['type']))
 
-    def _validate_sources(self, sources: List[Dict[str, Any]]) -> None:
-        """Valida la lista de sources"""
-        if not sources:
-            self.warnings.append("No hay sources definidos")
-            return
 
-        for idx, source in enumerate(sources):
-            # Campos requeridos
-            required_fields = ['name', 'dataset']
+def _validate_depends_on(
+    depends_on: List[Dict[str, Any]],
+    available_steps: set,
+    context: str,
+    errors: List[str],
+    warnings: List[str]
+) -> None:
+    """Valida dependencias"""
+    if not depends_on:
+        errors.append(_ERR_DEPENDS_ON_EMPTY.format(context))
+        return
 
-            for field in required_fields:
-                if field not in source:
-                    self.errors.append(f"Source #{idx + 1}: Falta campo '{field}'")
+    for dep in depends_on:
+        # Campos requeridos
+        if 'activity' not in dep:
+            errors.append(_ERR_DEP_NO_ACTIVITY.format(context))
+            continue
+
+        if 'dependencyConditions' not in dep:
+            errors.append(_ERR_DEP_NO_CONDITIONS.format(context))
+
+        # Validar que la actividad existe
+        if dep['activity'] not in available_steps:
+            errors.append(_ERR_DEP_UNKNOWN_ACTIVITY.format(context, dep['activity']))
+
+        # Validar dependencyConditions
+        if 'dependencyConditions' in dep:
+            for cond in dep['dependencyConditions']:
+                if cond not in _VALID_DEP_CONDITIONS:
+                    warnings.append(_WARN_DEP_CONDITION.format(context, cond))
+
+
+def _validate_derived_column_props(
+    props: Dict[str, Any], name: str, errors: List[str], warnings: List[str]
+) -> None:
+    """Valida typeProperties de DerivedColumn"""
+    if 'columns' not in props:
+        errors.append(_ERR_DERIVED_NO_COLUMNS.format(name))
+        return
+
+    for col in props['columns']:
+        if 'name' not in col:
+            errors.append(_ERR_DERIVED_COLUMN_NO_NAME.format(name))
+        if 'value' not in col:
+            errors.append(_ERR_DERIVED_COLUMN_NO_VALUE.format(name))
+        elif type(col['value']) is not dict:
+            errors.append(_ERR_DERIVED_VALUE_NOT_OBJECT.format(name))
+        elif 'value' not in col['value'] or 'type' not in col['value']:
+            errors.append(_ERR_DERIVED_VALUE_FIELDS.format(name))
+
+
+def _validate_filter_props(
+    props: Dict[str, Any], name: str, errors: List[str], warnings: List[str]
+) -> None:
+    """Valida typeProperties de Filter"""
+    if 'condition' not in props:
+        errors.append(_ERR_FILTER_NO_CONDITION.format(name))
+        return
+
+    cond = props['condition']
+    if type(cond) is not dict:
+        errors.append(_ERR_FILTER_CONDITION_NOT_OBJECT.format(name))
+    elif 'value' not in cond or 'type' not in cond:
+        errors.append(_ERR_FILTER_CONDITION_FIELDS.format(name))
+
+
+def _validate_aggregate_props(
+    props: Dict[str, Any], name: str, errors: List[str], warnings: List[str]
+) -> None:
+    """Valida typeProperties de Aggregate"""
+    if 'groupBy' not in props:
+        warnings.append(_WARN_AGGREGATE_NO_GROUP_BY.format(name))
+
+    if 'aggregates' not in props:
+        errors.append(_ERR_AGGREGATE_NO_AGGREGATES.format(name))
+
+
+def _validate_join_props(
+    props: Dict[str, Any], name: str, errors: List[str], warnings: List[str]
+) -> None:
+    """Valida typeProperties de Join"""
+    for field in _missing_fields(props, _JOIN_REQUIRED):
+        errors.append(_ERR_JOIN_MISSING.format(name, field))
+
+    if 'joinType' in props:
+        if props['joinType'] not in _VALID_JOIN_TYPES:
+            warnings.append(_WARN_JOIN_TYPE.format(name, props['joinType']))
+
+
+def _make_required_field_validator(label: str, field: str):
+    """
+    Genera el validador de un tipo cuyo único requisito es un campo.
 
-            # Validar dataset
-            if 'dataset' in source:
-                self._validate_dataset_reference(source['dataset'], f"Source '{source.get('name', idx)}'")
+    Args:
+        label: Nombre del tipo en los mensajes (ej: 'Sort')
+        field: Campo requerido en typeProperties
+
+    Returns:
+        Función con la firma de los validadores de _TRANS_DISPATCH
+    """
+    # Mensaje resuelto al generar el validador; solo falta el nombre del step
+    message = f"{label} '{{}}': Falta campo '{field}'"
 
-    def _validate_transformations(
-        self,
-        transformations: List[Dict[str, Any]],
-        sources: List[Dict[str, Any]]
+    def validate(
+        props: Dict[str, Any], name: str, errors: List[str], warnings: List[str]
     ) -> None:
-        """Valida la lista de transformations"""
-        all_steps = {s['name'] for s in sources}
-
-        for idx, trans in enumerate(transformations):
-            trans_name = trans.get('name', f"#{idx + 1}")
-
-            # Campos requeridos
-            required_fields = ['name', 'type', 'dependsOn', 'typeProperties']
-
-            for field in required_fields:
-                if field not in trans:
-                    self.errors.append(f"Transformation '{trans_name}': Falta campo '{field}'")
-
-            # Validar dependsOn
-            if 'dependsOn' in trans:
-                self._validate_depends_on(trans['dependsOn'], all_steps, f"Transformation '{trans_name}'")
-
-            # Validar typeProperties según tipo
-            if 'type' in trans and 'typeProperties' in trans:
-                self._validate_transformation_type_properties(
-                    trans['type'],
-                    trans['typeProperties'],
-                    trans_name
-                )
-
-            # Agregar a steps disponibles
-            if 'name' in trans:
-                all_steps.add(trans['name'])
-
-    def _validate_sinks(self, sinks: List[Dict[str, Any]], all_steps: set) -> None:
-        """Valida la lista de sinks"""
-        if not sinks:
-            self.warnings.append("No hay sinks definidos")
-            return
+        if field not in props:
+            errors.append(message.format(name))
 
-        for idx, sink in enumerate(sinks):
-            sink_name = sink.get('name', f"#{idx + 1}")
+    validate.__doc__ = f"Valida typeProperties de {label}"
+    return validate
 
-            # Campos requeridos
-            required_fields = ['name', 'dataset', 'dependsOn']
 
-            for field in required_fields:
-                if field not in sink:
-                    self.errors.append(f"Sink '{sink_name}': Falta campo '{field}'")
+_validate_sort_props = _make_required_field_validator('Sort', 'sortColumns')
+_validate_conditional_split_props = _make_required_field_validator('ConditionalSplit', 'conditions')
+_validate_lookup_props = _make_required_field_validator('Lookup', 'lookupDataset')
 
-            # Validar dataset
-            if 'dataset' in sink:
-                self._validate_dataset_reference(sink['dataset'], f"Sink '{sink_name}'")
 
-            # Validar dependsOn
-            if 'dependsOn' in sink:
-                self._validate_depends_on(sink['dependsOn'], all_steps, f"Sink '{sink_name}'")
+def _validate_alter_row_props(
+    props: Dict[str, Any], name: str, errors: List[str], warnings: List[str]
+) -> None:
+    """Valida typeProperties de AlterRow"""
+    if type(props) is dict:
+        has_condition = not _ALTER_ROW_CONDITION_KEYS.isdisjoint(props)
+    else:
+        has_condition = any(c in props for c in _VALID_ALTER_ROW_CONDITIONS)
 
-    def _validate_dataset_reference(self, dataset: Dict[str, Any], context: str) -> None:
-        """Valida una referencia a dataset"""
-        required_fields = ['referenceName', 'type']
+    if not has_condition:
+        errors.append(_ERR_ALTER_ROW_NO_CONDITION.format(name))
 
-        for field in required_fields:
-            if field not in dataset:
-                self.errors.append(f"{context}: Dataset falta campo '{field}'")
 
-        if 'type' in dataset and dataset['type'] != 'DatasetReference':
-            self.errors.append(
-                f"{context}: Dataset type debe ser 'DatasetReference', "
-                f"pero es '{dataset['type']}'"
-            )
+# Validadores de typeProperties por tipo de transformación (construido una vez)
+_TRANS_DISPATCH = {
+    'derivedColumn': _validate_derived_column_props,
+    'filter': _validate_filter_props,
+    'aggregate': _validate_aggregate_props,
+    'join': _validate_join_props,
+    'sort': _validate_sort_props,
+    'conditionalSplit': _validate_conditional_split_props,
+    'lookup': _validate_lookup_props,
+    'alterRow': _validate_alter_row_props
+}
 
-    def _validate_depends_on(
-        self,
-        depends_on: List[Dict[str, Any]],
-        available_steps: set,
-        context: str
-    ) -> None:
-        """Valida dependencias"""
-        if not depends_on:
-            self.errors.append(f"{context}: dependsOn no puede estar vacío")
-            return
 
-        for dep in depends_on:
-            # Campos requeridos
-            if 'activity' not in dep:
-                self.errors.append(f"{context}: Dependencia sin campo 'activity'")
-                continue
-
-            if 'dependencyConditions' not in dep:
-                self.errors.append(f"{context}: Dependencia sin campo 'dependencyConditions'")
-
-            # Validar que la actividad existe
-            if dep['activity'] not in available_steps:
-                self.errors.append(
-                    f"{context}: Dependencia a actividad inexistente '{dep['activity']}'"
-                )
-
-            # Validar dependencyConditions
-            if 'dependencyConditions' in dep:
-                valid_conditions = ['Succeeded', 'Failed', 'Skipped', 'Completed']
-                for cond in dep['dependencyConditions']:
-                    if cond not in valid_conditions:
-                        self.warnings.append(
-                            f"{context}: Condición de dependencia '{cond}' no es estándar"
-                        )
-
-    def _validate_transformation_type_properties(
-        self,
-        trans_type: str,
-        type_props: Dict[str, Any],
-        trans_name: str
-    ) -> None:
-        """Valida typeProperties según el tipo de transformación"""
-        validation_methods = {
-            'derivedColumn': self._validate_derived_column_props,
-            'filter': self._validate_filter_props,
-            'aggregate': self._validate_aggregate_props,
-            'join': self._validate_join_props,
-            'sort': self._validate_sort_props,
-            'conditionalSplit': self._validate_conditional_split_props,
-            'lookup': self._validate_lookup_props,
-            'alterRow': self._validate_alter_row_props
-        }
+# Decodificador para JSON recibido como bytes (orjson si está instalado;
+# json.loads no acepta memoryview)
+_loads_bytes = orjson.loads if orjson is not None else (lambda buf: json.loads(bytes(buf)))
 
-        method = validation_methods.get(trans_type)
-        if method:
-            method(type_props, trans_name)
+# Resultados de validación por digest (LRU): str de hash_json para dicts,
+# bytes de blake2b para JSON serializado. La clave es de tamaño fijo: el
+# caché no retiene los dataflows validados.
+_results_by_digest: 'OrderedDict[Union[str, bytes], Tuple[bool, Tuple[str, ...], Tuple[str, ...]]]' = OrderedDict()
+_results_lock = threading.Lock()
 
-    def _validate_derived_column_props(self, props: Dict[str, Any], name: str) -> None:
-        """Valida typeProperties de DerivedColumn"""
-        if 'columns' not in props:
-            self.errors.append(f"DerivedColumn '{name}': Falta campo 'columns'")
-            return
 
-        for col in props['columns']:
-            if 'name' not in col:
-                self.errors.append(f"DerivedColumn '{name}': Columna sin nombre")
-            if 'value' not in col:
-                self.errors.append(f"DerivedColumn '{name}': Columna sin valor")
-            elif not isinstance(col['value'], dict):
-                self.errors.append(f"DerivedColumn '{name}': Valor de columna debe ser objeto")
-            elif 'value' not in col['value'] or 'type' not in col['value']:
-                self.errors.append(
-                    f"DerivedColumn '{name}': Valor de columna debe tener 'value' y 'type'"
-                )
-
-    def _validate_filter_props(self, props: Dict[str, Any], name: str) -> None:
-        """Valida typeProperties de Filter"""
-        if 'condition' not in props:
-            self.errors.append(f"Filter '{name}': Falta campo 'condition'")
-            return
+def _cached_result(digest: Union[str, bytes]) -> Optional[Tuple[bool, List[str], List[str]]]:
+    """Resultado recordado para digest (listas nuevas), o None si no está"""
+    with _results_lock:
+        cached = _results_by_digest.get(digest)
+        if cached is None:
+            return None
+        _results_by_digest.move_to_end(digest)
+    is_valid, errors, warnings = cached
+    return (is_valid, list(errors), list(warnings))
 
-        cond = props['condition']
-        if not isinstance(cond, dict):
-            self.errors.append(f"Filter '{name}': Condition debe ser objeto")
-        elif 'value' not in cond or 'type' not in cond:
-            self.errors.append(f"Filter '{name}': Condition debe tener 'value' y 'type'")
-
-    def _validate_aggregate_props(self, props: Dict[str, Any], name: str) -> None:
-        """Valida typeProperties de Aggregate"""
-        if 'groupBy' not in props:
-            self.warnings.append(f"Aggregate '{name}': No tiene groupBy (posible agregación total)")
-
-        if 'aggregates' not in props:
-            self.errors.append(f"Aggregate '{name}': Falta campo 'aggregates'")
-
-    def _validate_join_props(self, props: Dict[str, Any], name: str) -> None:
-        """Valida typeProperties de Join"""
-        required = ['joinType', 'leftInput', 'rightInput', 'joinConditions']
-        for field in required:
-            if field not in props:
-                self.errors.append(f"Join '{name}': Falta campo '{field}'")
-
-        if 'joinType' in props:
-            valid_types = ['inner', 'left', 'right', 'outer', 'cross']
-            if props['joinType'] not in valid_types:
-                self.warnings.append(
-                    f"Join '{name}': joinType '{props['joinType']}' no es estándar"
-                )
-
-    def _validate_sort_props(self, props: Dict[str, Any], name: str) -> None:
-        """Valida typeProperties de Sort"""
-        if 'sortColumns' not in props:
-            self.errors.append(f"Sort '{name}': Falta campo 'sortColumns'")
-
-    def _validate_conditional_split_props(self, props: Dict[str, Any], name: str) -> None:
-        """Valida typeProperties de ConditionalSplit"""
-        if 'conditions' not in props:
-            self.errors.append(f"ConditionalSplit '{name}': Falta campo 'conditions'")
-
-    def _validate_lookup_props(self, props: Dict[str, Any], name: str) -> None:
-        """Valida typeProperties de Lookup"""
-        if 'lookupDataset' not in props:
-            self.errors.append(f"Lookup '{name}': Falta campo 'lookupDataset'")
-
-    def _validate_alter_row_props(self, props: Dict[str, Any], name: str) -> None:
-        """Valida typeProperties de AlterRow"""
-        valid_conditions = ['insertCondition', 'updateCondition', 'deleteCondition', 'upsertCondition']
-        has_condition = any(c in props for c in valid_conditions)
-
-        if not has_condition:
-            self.errors.append(
-                f"AlterRow '{name}': Debe tener al menos una condición "
-                f"({', '.join(valid_conditions)})"
-            )
 
-    def _get_all_step_names(
-        self,
-        sources: List[Dict[str, Any]],
-        transformations: List[Dict[str, Any]]
-    ) -> set:
-        """Obtiene todos los nombres de steps disponibles"""
-        all_steps = {s['name'] for s in sources if 'name' in s}
-        all_steps.update(t['name'] for t in transformations if 'name' in t)
-        return all_steps
+def _remember_result(digest: Union[str, bytes], is_valid: bool, errors: List[str], warnings: List[str]) -> None:
+    """Guarda un resultado, descartando el usado hace más tiempo si se llena"""
+    with _results_lock:
+        _results_by_digest[digest] = (is_valid, tuple(errors), tuple(warnings))
+        if len(_results_by_digest) > VALIDATION_CACHE_SIZE:
+            _results_by_digest.popitem(last=False)
 
 
 def validate_dataflow(dataflow: Dict[str, Any]) -> Tuple[bool, List[str], List[str]]:
     """
     Función de conveniencia para validar dataflows.
+    Revalidar un dataflow con el mismo contenido reutiliza el resultado.
 
     Args:
         dataflow: Diccionario con el dataflow a validar
@@ -375,5 +825,82 @@ def validate_dataflow(dataflow: Dict[str, Any]) -> Tuple[bool, List[str], List[s
     Returns:
         Tupla (es_válido, lista_errores, lista_warnings)
     """
-    validator = ADFSchemaValidator()
-    return validator.validate_dataflow(dataflow)
+    # El resultado solo depende del contenido JSON si los tipos revisados son
+    # exactos (un OrderedDict no equivale a un dict). hash_json da None si no
+    # es serializable. En ambos casos se valida sin caché.
+    exact_types = _exact_json_types(dataflow)
+    digest = hash_json(dataflow) if exact_types else None
+    if digest is not None:
+        cached = _cached_result(digest)
+        if cached is not None:
+            return cached
+
+    # Se valida el objeto del llamador, no una copia decodificada
+    errors: List[str] = []
+    warnings: List[str] = []
+    _validate(dataflow, errors, warnings, exact_types)
+    is_valid = len(errors) == 0
+
+    if digest is not None:
+        _remember_result(digest, is_valid, errors, warnings)
+    return (is_valid, errors, warnings)
+
+
+def validate_dataflow_bytes(buf: Union[bytes, bytearray, memoryview]) -> Tuple[bool, List[str], List[str]]:
+    """
+    Valida un dataflow que todavía está serializado como JSON.
+    Evita pasar por un dict intermedio del llamador; los mismos bytes
+    revalidados reutilizan el resultado sin volver a decodificarlos.
+
+    Args:
+        buf: Contenido JSON del dataflow (UTF-8)
+
+    Returns:
+        Tupla (es_válido, lista_errores, lista_warnings)
+    """
+    # El digest se calcula sobre buf sin copiarlo
+    digest = hashlib.blake2b(buf, digest_size=16).digest()
+    cached = _cached_result(digest)
+    if cached is not None:
+        return cached
+
+    try:
+        dataflow = _loads_bytes(buf)
+    except ValueError as e:
+        return (False, [_ERR_INVALID_JSON.format(e)], [])
+
+    # JSON recién decodificado: todos los tipos son exactos
+    errors: List[str] = []
+    warnings: List[str] = []
+    _validate(dataflow, errors, warnings, exact_types=True)
+    is_valid = len(errors) == 0
+
+    _remember_result(digest, is_valid, errors, warnings)
+    return (is_valid, errors, warnings)
+
+
+def validate_dataflows_bulk(
+    dataflows: List[Dict[str, Any]],
+    max_workers: Optional[int] = None
+) -> List[Tuple[bool, List[str], List[str]]]:
+    """
+    Valida muchos dataflows independientes, repartidos entre procesos.
+
+    Args:
+        dataflows: Lista de dataflows a validar
+        max_workers: Procesos a usar (por defecto, uno por CPU)
+
+    Returns:
+        Lista de tuplas (es_válido, lista_errores, lista_warnings), en el
+        mismo orden que dataflows
+    """
+    # Lotes pequeños: el arranque del pool cuesta más que validarlos aquí
+    if len(dataflows) < BULK_PROCESS_MIN_FLOWS:
+        return [validate_dataflow(dataflow) for dataflow in dataflows]
+
+    workers = max_workers or os.cpu_count() or 1
+    chunksize = max(1, len(dataflows) // (workers * 4))
+    logger.debug(f"Validando {len(dataflows)} dataflows con {workers} procesos")
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(validate_dataflow, dataflows, chunksize=chunksize))
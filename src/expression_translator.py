@@ -3,12 +3,323 @@ Traductor de expresiones de PowerCenter a Azure Data Factory
 Mapeo completo y validación de funciones, operadores y sintaxis
 """
 
+import os
 import re
 import logging
-from typing import Dict, List, Tuple
+from typing import Dict, List, Pattern, Tuple
+
+try:
+    import re2
+except ImportError:  # Dependencia opcional (extra "re2")
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:  # Dependencia opcional (extra "ahocorasick")
+    ahocorasick = None
 
 logger = logging.getLogger('pc-to-adf.expression_translator')
 
+# Motor para los patrones de función: 're' (por defecto) o 're2' (google-re2,
+# tiempo lineal garantizado; más lento en expresiones cortas por el costo de
+# cada llamada desde Python)
+EXPRESSION_REGEX_BACKEND = os.environ.get('EXPRESSION_REGEX_BACKEND', 're').strip().lower()
+if EXPRESSION_REGEX_BACKEND == 're2' and re2 is None:
+    logger.warning("EXPRESSION_REGEX_BACKEND=re2 pero google-re2 no está instalado; se usa re")
+    EXPRESSION_REGEX_BACKEND = 're'
+
+# Traducciones recordadas por instancia (los mappings repiten mucho las mismas
+# expresiones, ej: IIF(ISNULL(IN_X), 0, IN_X) en cada puerto)
+TRANSLATION_CACHE_SIZE = 4096
+
+# Patrones fijos, compilados una sola vez al importar el módulo
+_IN_OUT_PREFIX_RE = re.compile(r'\b(IN|OUT)_')
+# Referencia simple a una columna (ej: CUSTOMER_ID); no tiene nada que traducir
+# salvo que sea un operador (AND/OR/NOT) o contenga SYSDATE
+_IDENTIFIER_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+_IDENTIFIER_KEYWORDS = frozenset(('AND', 'OR', 'NOT'))
+_DECODE_OPEN_RE = re.compile(r'DECODE\s*\(', re.IGNORECASE)
+_ADD_TO_DATE_OPEN_RE = re.compile(r'ADD_(TO_)?DATE\s*\(', re.IGNORECASE)
+# Alias ADD_toDate( -> ADD_TO_DATE( (se normaliza antes de traducir)
+_ADD_TODATE_ALIAS_RE = re.compile(r'ADD_toDate(?=\s*\()', re.IGNORECASE)
+_GET_DATE_PART_OPEN_RE = re.compile(r'GET_DATE_PART\s*\(', re.IGNORECASE)
+_TIME_UNIT_LITERAL_RE = re.compile(r'^[\'"]([A-Z]+)[\'"]$', re.IGNORECASE)
+_DATE_PART_LITERAL_RE = re.compile(r'^[\'"]([A-Z]+)[\'"]$')
+# Unidad de GET_DATE_PART -> función ADF (el orden es el de aplicación de los patrones)
+_DATE_PART_FUNCTIONS = {
+    'DD': 'dayOfMonth',
+    'MM': 'month',
+    'YYYY': 'year',
+    'YY': 'year',
+    'Y': 'year',
+    'DDD': 'dayOfYear',
+    'WW': 'weekOfYear',
+    'HH': 'hour',
+    'MI': 'minute',
+    'SS': 'second'
+}
+# Unidad de ADD_TO_DATE -> función ADF
+_TIME_UNIT_FUNCTIONS = {
+    'DD': 'addDays',
+    'MM': 'addMonths',
+    'YYYY': 'addYears',
+    'YY': 'addYears',
+    'Y': 'addYears',
+    'HH': 'addHours',
+    'MI': 'addMinutes',
+    'SS': 'addSeconds'
+}
+# Concatenación: operandos ('string', "string", variable, función()) separados por ||
+_CONCAT_RE = re.compile(
+    r"(['\"].*?['\"]|[\w\.]+(?:\([^)]*\))?)\s*\|\|\s*(['\"].*?['\"]|[\w\.]+(?:\([^)]*\))?)"
+)
+# Nombre de función literal al inicio de cada patrón de función
+_PATTERN_KEYWORD_RE = re.compile(r'[A-Za-z_]+')
+# Literal fijo entre comillas dentro de un patrón de función (ej: la unidad 'DD')
+_PATTERN_LITERAL_RE = re.compile(r'\[\\\'"\]([A-Z][A-Z/-]*)\[\\\'"\]')
+# Caracteres que cambian el estado al recorrer argumentos (el resto se copia tal cual)
+_ARG_DELIMITER_RE = re.compile(r'[(),\'"]')
+_PAREN_RE = re.compile(r'[()]')
+# Fin del operando derecho de una comparación (además del final de la expresión)
+_COMPARISON_TERMINATORS = ('&&', '||', ',', ')')
+
+
+def _build_function_patterns() -> List[Tuple[Pattern, str]]:
+    """
+    Construye los patrones de funciones con orden específico.
+    Retorna lista de tuplas (patrón_compilado, reemplazo).
+    El orden es crítico para evitar conflictos.
+    """
+    patterns = [
+        # ===== FUNCIONES DE FECHA =====
+
+        # GET_DATE_PART: Extracción de partes de fecha (un patrón por unidad)
+        # Patrón mejorado para capturar argumentos con paréntesis anidados
+        *[
+            (rf'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]{unit}[\'"]\s*\)', rf'{func}(\1)')
+            for unit, func in _DATE_PART_FUNCTIONS.items()
+        ],
+
+        # ADD_TO_DATE: Operaciones aritméticas con fechas
+        # (translate() ya normalizó el alias ADD_toDate a ADD_TO_DATE)
+        *[
+            (rf'ADD_TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]{unit}[\'"]\s*,\s*([^)]+?)\s*\)', rf'{func}(\1, \2)')
+            for unit, func in _TIME_UNIT_FUNCTIONS.items()
+        ],
+
+        # LAST_DAY: Último día del mes
+        (r'LAST_DAY\s*\(\s*([^)]+?)\s*\)', r'lastDayOfMonth(\1)'),
+
+        # TO_CHAR para formatos de fecha
+        # CRÍTICO: TO_CHAR(date, 'DAY') en PowerCenter devuelve el NOMBRE del día ('Monday')
+        # pero dayOfWeek() en ADF devuelve un NÚMERO (1=Sunday, 2=Monday, ..., 7=Saturday)
+        # Necesitamos mapear el número a nombres usando case()
+        (r'TO_CHAR\s*\(\s*([^,]+?)\s*,\s*[\'"]DAY[\'"]\s*\)',
+         r"case(dayOfWeek(\1), 1, 'Sunday', 2, 'Monday', 3, 'Tuesday', 4, 'Wednesday', 5, 'Thursday', 6, 'Friday', 7, 'Saturday')"),
+        (r'TO_CHAR\s*\(\s*([^,]+?)\s*,\s*[\'"]MONTH[\'"]\s*\)', r"toString(\1, 'MMMM')"),
+        (r'TO_CHAR\s*\(\s*([^,]+?)\s*,\s*[\'"]DDD[\'"]\s*\)', r'dayOfYear(\1)'),
+        (r'TO_CHAR\s*\(\s*([^,]+?)\s*,\s*[\'"]([^\'\"]+?)[\'"]\s*\)', r"toString(\1, '\2')"),
+
+        # TO_DATE: Conversión de string a fecha
+        (r'TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]MM/DD/YYYY[\'"]\s*\)', r"toDate(\1, 'MM/dd/yyyy')"),
+        (r'TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]DD/MM/YYYY[\'"]\s*\)', r"toDate(\1, 'dd/MM/yyyy')"),
+        (r'TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]YYYY-MM-DD[\'"]\s*\)', r"toDate(\1, 'yyyy-MM-dd')"),
+        (r'TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]([^\'\"]+?)[\'"]\s*\)', r"toDate(\1, '\2')"),
+        (r'TO_DATE\s*\(\s*([^)]+?)\s*\)', r'toDate(\1)'),
+
+        # SYSDATE y funciones de fecha actuales
+        (r'SYSDATE\s*\(\s*\)', r'currentTimestamp()'),
+        (r'SYSDATE', r'currentTimestamp()'),
+        (r'CURRENT_DATE\s*\(\s*\)', r'currentDate()'),
+        (r'CURRENT_TIMESTAMP\s*\(\s*\)', r'currentTimestamp()'),
+
+        # ===== FUNCIONES DE STRING =====
+
+        # SUBSTR: Substring con índices
+        (r'SUBSTR\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'substring(\1, \2, \3)'),
+        (r'SUBSTR\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'substring(\1, \2)'),
+
+        # INSTR: Búsqueda de substring
+        (r'INSTR\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'indexOf(\1, \2)'),
+
+        # REPLACE_CHAR: Reemplazo de caracteres
+        (r'REPLACE_CHAR\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'replace(\1, \2, \3)'),
+        (r'REPLACE\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'replace(\1, \2, \3)'),
+
+        # CONCAT: Concatenación
+        (r'CONCAT\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'concat(\1, \2)'),
+
+        # TRIM, LTRIM, RTRIM
+        (r'LTRIM\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'ltrim(\1, \2)'),
+        (r'LTRIM\s*\(\s*([^)]+?)\s*\)', r'ltrim(\1)'),
+        (r'RTRIM\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'rtrim(\1, \2)'),
+        (r'RTRIM\s*\(\s*([^)]+?)\s*\)', r'rtrim(\1)'),
+        (r'TRIM\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'trim(\1, \2)'),
+        (r'TRIM\s*\(\s*([^)]+?)\s*\)', r'trim(\1)'),
+
+        # UPPER, LOWER
+        (r'UPPER\s*\(\s*([^)]+?)\s*\)', r'upper(\1)'),
+        (r'LOWER\s*\(\s*([^)]+?)\s*\)', r'lower(\1)'),
+
+        # LENGTH
+        (r'LENGTH\s*\(\s*([^)]+?)\s*\)', r'length(\1)'),
+
+        # LPAD, RPAD
+        (r'LPAD\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'lpad(\1, \2, \3)'),
+        (r'RPAD\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'rpad(\1, \2, \3)'),
+
+        # ===== FUNCIONES DE CONVERSIÓN =====
+
+        # TO_INTEGER, TO_DECIMAL, TO_FLOAT
+        (r'TO_INTEGER\s*\(\s*([^)]+?)\s*\)', r'toInteger(\1)'),
+        (r'TO_DECIMAL\s*\(\s*([^)]+?)\s*\)', r'toDecimal(\1)'),
+        (r'TO_FLOAT\s*\(\s*([^)]+?)\s*\)', r'toFloat(\1)'),
+        (r'TO_CHAR\s*\(\s*([^)]+?)\s*\)', r'toString(\1)'),
+
+        # ===== FUNCIONES CONDICIONALES =====
+
+        # IIF: Condicional ternario
+        (r'IIF\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'iif(\1, \2, \3)'),
+
+        # DECODE: Case statement (complejo, requerirá procesamiento adicional)
+        # Por ahora se deja para case()
+
+        # ===== FUNCIONES DE AGREGACIÓN =====
+
+        # Estas se mantienen iguales pero en minúsculas
+        (r'SUM\s*\(\s*([^)]+?)\s*\)', r'sum(\1)'),
+        (r'AVG\s*\(\s*([^)]+?)\s*\)', r'avg(\1)'),
+        (r'COUNT\s*\(\s*([^)]+?)\s*\)', r'count(\1)'),
+        (r'COUNT\s*\(\s*\*\s*\)', r'count()'),
+        (r'MIN\s*\(\s*([^)]+?)\s*\)', r'min(\1)'),
+        (r'MAX\s*\(\s*([^)]+?)\s*\)', r'max(\1)'),
+        (r'FIRST\s*\(\s*([^)]+?)\s*\)', r'first(\1)'),
+        (r'LAST\s*\(\s*([^)]+?)\s*\)', r'last(\1)'),
+
+        # ===== FUNCIONES MATEMÁTICAS =====
+
+        (r'ROUND\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'round(\1, \2)'),
+        (r'ROUND\s*\(\s*([^)]+?)\s*\)', r'round(\1)'),
+        (r'CEIL\s*\(\s*([^)]+?)\s*\)', r'ceil(\1)'),
+        (r'FLOOR\s*\(\s*([^)]+?)\s*\)', r'floor(\1)'),
+        (r'ABS\s*\(\s*([^)]+?)\s*\)', r'abs(\1)'),
+        (r'POWER\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'power(\1, \2)'),
+        (r'SQRT\s*\(\s*([^)]+?)\s*\)', r'sqrt(\1)'),
+
+        # ===== FUNCIONES NULL =====
+
+        (r'ISNULL\s*\(\s*([^)]+?)\s*\)', r'isNull(\1)'),
+        (r'IS_NULL\s*\(\s*([^)]+?)\s*\)', r'isNull(\1)'),
+        (r'NVL\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'coalesce(\1, \2)'),
+        (r'COALESCE\s*\(\s*([^)]+?)\s*\)', r'coalesce(\1)'),
+    ]
+
+    return [(re.compile(pattern, re.IGNORECASE), replacement) for pattern, replacement in patterns]
+
+
+def _build_operator_mappings() -> List[Tuple[Pattern, str]]:
+    """
+    Construye los mapeos de operadores (patrones compilados).
+    El orden es crítico para evitar conflictos.
+    """
+    mappings = [
+        # Operadores lógicos (deben procesarse ANTES que otros)
+        (r'\bAND\b', r'&&'),
+        (r'\bOR\b', r'||'),
+        (r'\bNOT\b', r'!'),
+
+        # Operador de concatenación (IMPORTANTE: PowerCenter usa ||)
+        # Pero || ya se usó para OR lógico, necesitamos contexto
+        # En PowerCenter: 'string1' || 'string2' es concatenación
+        # En ADF: concat(string1, string2)
+        # Este es complejo, se maneja en _handle_concatenation()
+
+        # Operadores de comparación
+        (r'<>', r'!='),
+        (r'===', r'=='),  # PowerCenter strict equal
+
+        # El = simple solo se convierte en contexto de comparación
+        # NO en asignaciones
+    ]
+
+    return [(re.compile(pattern), replacement) for pattern, replacement in mappings]
+
+
+def _build_forbidden_functions() -> List[str]:
+    """
+    Lista de funciones que NO deben aparecer en el resultado final.
+    Si aparecen, significa que la traducción falló.
+
+    Nota: Se validan como llamadas a función (con paréntesis), no como parte de nombres de variables.
+    """
+    return [
+        'GET_DATE_PART(',
+        'ADD_TO_DATE(',
+        'ADD_toDate(',
+        'LAST_DAY(',
+        'TO_CHAR(',
+        'TO_DATE(',
+        'REPLACE_CHAR(',
+        'INSTR(',
+        'DECODE(',           # CRÍTICO: DECODE debe traducirse a case()
+        ' AND ',
+        ' OR ',
+        ' NOT ',
+    ]
+
+
+def _build_automaton(words):
+    """
+    Construye un autómata Aho-Corasick para buscar todas las palabras
+    en una sola pasada.
+
+    Args:
+        words: Palabras a buscar (en mayúsculas)
+
+    Returns:
+        Autómata de pyahocorasick cuyo valor por palabra son sus índices
+        en words, o None si pyahocorasick no está instalado
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for index, word in enumerate(words):
+        automaton.add_word(word, automaton.get(word, ()) + (index,))
+    automaton.make_automaton()
+    return automaton
+
+
+# Patrones y listas compartidos por todas las instancias (se construyen una
+# sola vez al importar el módulo)
+_FUNCTION_PATTERNS = _build_function_patterns()
+# Palabras (en mayúsculas) que cada patrón necesita para coincidir: el nombre
+# de función y, si lo tiene, el literal entre comillas (ej: GET_DATE_PART + DD).
+# Sin ellas el patrón no se ejecuta, así que los .+? / [^,]+? no recorren el
+# resto del texto buscando una unidad que no está.
+_PATTERN_KEYWORDS = [
+    frozenset(
+        [_PATTERN_KEYWORD_RE.match(pattern.pattern).group(0).upper()]
+        + _PATTERN_LITERAL_RE.findall(pattern.pattern)
+    )
+    for pattern, _ in _FUNCTION_PATTERNS
+]
+_DISTINCT_KEYWORDS = list(dict.fromkeys(word for words in _PATTERN_KEYWORDS for word in words))
+_KEYWORD_AUTOMATON = _build_automaton(_DISTINCT_KEYWORDS)
+# Con re2 solo se usa en texto ASCII: su IGNORECASE no equipara
+# letras como 'ı' con 'I', y el texto no ASCII sigue con re
+if EXPRESSION_REGEX_BACKEND == 're2':
+    _ASCII_FUNCTION_PATTERNS = [
+        (re2.compile('(?i)' + pattern.pattern), replacement)
+        for pattern, replacement in _FUNCTION_PATTERNS
+    ]
+else:
+    _ASCII_FUNCTION_PATTERNS = _FUNCTION_PATTERNS
+_OPERATOR_MAPPINGS = _build_operator_mappings()
+_FORBIDDEN_FUNCTIONS = _build_forbidden_functions()
+_FORBIDDEN_UPPER = [forbidden.upper() for forbidden in _FORBIDDEN_FUNCTIONS]
+_FORBIDDEN_AUTOMATON = _build_automaton(_FORBIDDEN_UPPER)
+
 
 class ExpressionTranslator:
     """
@@ -18,201 +329,62 @@ class ExpressionTranslator:
 
     def __init__(self):
         """Inicializa el traductor con todos los mapeos de funciones"""
-        self.function_patterns = self._initialize_function_patterns()
-        self.operator_mappings = self._initialize_operator_mappings()
-        self.forbidden_functions = self._initialize_forbidden_functions()
-
-    def _initialize_function_patterns(self) -> List[Tuple[str, str]]:
-        """
-        Inicializa patrones de funciones con orden específico.
-        Retorna lista de tuplas (patrón_regex, reemplazo).
-        El orden es crítico para evitar conflictos.
+        self.function_patterns = _FUNCTION_PATTERNS
+        self._pattern_keywords = _PATTERN_KEYWORDS
+        self._distinct_keywords = _DISTINCT_KEYWORDS
+        self._keyword_automaton = _KEYWORD_AUTOMATON
+        self._ascii_function_patterns = _ASCII_FUNCTION_PATTERNS
+        self.operator_mappings = _OPERATOR_MAPPINGS
+        self.forbidden_functions = _FORBIDDEN_FUNCTIONS
+        self._forbidden_upper = _FORBIDDEN_UPPER
+        self._forbidden_automaton = _FORBIDDEN_AUTOMATON
+        # Expresión original -> traducción (solo traducciones válidas)
+        self._cache: Dict[str, str] = {}
+
+    def _present_keywords(self, text: str):
         """
-        return [
-            # ===== FUNCIONES DE FECHA =====
-
-            # GET_DATE_PART: Extracción de partes de fecha
-            # Patrón mejorado para capturar argumentos con paréntesis anidados
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]DD[\'"]\s*\)', r'dayOfMonth(\1)'),
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]MM[\'"]\s*\)', r'month(\1)'),
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]YYYY[\'"]\s*\)', r'year(\1)'),
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]YY[\'"]\s*\)', r'year(\1)'),
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]Y[\'"]\s*\)', r'year(\1)'),
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]DDD[\'"]\s*\)', r'dayOfYear(\1)'),
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]WW[\'"]\s*\)', r'weekOfYear(\1)'),
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]HH[\'"]\s*\)', r'hour(\1)'),
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]MI[\'"]\s*\)', r'minute(\1)'),
-            (r'GET_DATE_PART\s*\(\s*(.+?)\s*,\s*[\'"]SS[\'"]\s*\)', r'second(\1)'),
-
-            # ADD_TO_DATE / ADD_toDate: Operaciones aritméticas con fechas
-            (r'ADD_TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]DD[\'"]\s*,\s*([^)]+?)\s*\)', r'addDays(\1, \2)'),
-            (r'ADD_TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]MM[\'"]\s*,\s*([^)]+?)\s*\)', r'addMonths(\1, \2)'),
-            (r'ADD_TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]YYYY[\'"]\s*,\s*([^)]+?)\s*\)', r'addYears(\1, \2)'),
-            (r'ADD_TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]YY[\'"]\s*,\s*([^)]+?)\s*\)', r'addYears(\1, \2)'),
-            (r'ADD_TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]Y[\'"]\s*,\s*([^)]+?)\s*\)', r'addYears(\1, \2)'),
-            (r'ADD_TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]HH[\'"]\s*,\s*([^)]+?)\s*\)', r'addHours(\1, \2)'),
-            (r'ADD_TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]MI[\'"]\s*,\s*([^)]+?)\s*\)', r'addMinutes(\1, \2)'),
-            (r'ADD_TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]SS[\'"]\s*,\s*([^)]+?)\s*\)', r'addSeconds(\1, \2)'),
-
-            # Variantes con ADD_toDate (sin guión bajo)
-            (r'ADD_toDate\s*\(\s*([^,]+?)\s*,\s*[\'"]DD[\'"]\s*,\s*([^)]+?)\s*\)', r'addDays(\1, \2)'),
-            (r'ADD_toDate\s*\(\s*([^,]+?)\s*,\s*[\'"]MM[\'"]\s*,\s*([^)]+?)\s*\)', r'addMonths(\1, \2)'),
-            (r'ADD_toDate\s*\(\s*([^,]+?)\s*,\s*[\'"]YYYY[\'"]\s*,\s*([^)]+?)\s*\)', r'addYears(\1, \2)'),
-            (r'ADD_toDate\s*\(\s*([^,]+?)\s*,\s*[\'"]YY[\'"]\s*,\s*([^)]+?)\s*\)', r'addYears(\1, \2)'),
-            (r'ADD_toDate\s*\(\s*([^,]+?)\s*,\s*[\'"]Y[\'"]\s*,\s*([^)]+?)\s*\)', r'addYears(\1, \2)'),
-
-            # LAST_DAY: Último día del mes
-            (r'LAST_DAY\s*\(\s*([^)]+?)\s*\)', r'lastDayOfMonth(\1)'),
-
-            # TO_CHAR para formatos de fecha
-            # CRÍTICO: TO_CHAR(date, 'DAY') en PowerCenter devuelve el NOMBRE del día ('Monday')
-            # pero dayOfWeek() en ADF devuelve un NÚMERO (1=Sunday, 2=Monday, ..., 7=Saturday)
-            # Necesitamos mapear el número a nombres usando case()
-            (r'TO_CHAR\s*\(\s*([^,]+?)\s*,\s*[\'"]DAY[\'"]\s*\)',
-             r"case(dayOfWeek(\1), 1, 'Sunday', 2, 'Monday', 3, 'Tuesday', 4, 'Wednesday', 5, 'Thursday', 6, 'Friday', 7, 'Saturday')"),
-            (r'TO_CHAR\s*\(\s*([^,]+?)\s*,\s*[\'"]MONTH[\'"]\s*\)', r"toString(\1, 'MMMM')"),
-            (r'TO_CHAR\s*\(\s*([^,]+?)\s*,\s*[\'"]DDD[\'"]\s*\)', r'dayOfYear(\1)'),
-            (r'TO_CHAR\s*\(\s*([^,]+?)\s*,\s*[\'"]([^\'\"]+?)[\'"]\s*\)', r"toString(\1, '\2')"),
-
-            # TO_DATE: Conversión de string a fecha
-            (r'TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]MM/DD/YYYY[\'"]\s*\)', r"toDate(\1, 'MM/dd/yyyy')"),
-            (r'TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]DD/MM/YYYY[\'"]\s*\)', r"toDate(\1, 'dd/MM/yyyy')"),
-            (r'TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]YYYY-MM-DD[\'"]\s*\)', r"toDate(\1, 'yyyy-MM-dd')"),
-            (r'TO_DATE\s*\(\s*([^,]+?)\s*,\s*[\'"]([^\'\"]+?)[\'"]\s*\)', r"toDate(\1, '\2')"),
-            (r'TO_DATE\s*\(\s*([^)]+?)\s*\)', r'toDate(\1)'),
-
-            # SYSDATE y funciones de fecha actuales
-            (r'SYSDATE\s*\(\s*\)', r'currentTimestamp()'),
-            (r'SYSDATE', r'currentTimestamp()'),
-            (r'CURRENT_DATE\s*\(\s*\)', r'currentDate()'),
-            (r'CURRENT_TIMESTAMP\s*\(\s*\)', r'currentTimestamp()'),
-
-            # ===== FUNCIONES DE STRING =====
-
-            # SUBSTR: Substring con índices
-            (r'SUBSTR\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'substring(\1, \2, \3)'),
-            (r'SUBSTR\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'substring(\1, \2)'),
-
-            # INSTR: Búsqueda de substring
-            (r'INSTR\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'indexOf(\1, \2)'),
-
-            # REPLACE_CHAR: Reemplazo de caracteres
-            (r'REPLACE_CHAR\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'replace(\1, \2, \3)'),
-            (r'REPLACE\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'replace(\1, \2, \3)'),
-
-            # CONCAT: Concatenación
-            (r'CONCAT\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'concat(\1, \2)'),
-
-            # TRIM, LTRIM, RTRIM
-            (r'LTRIM\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'ltrim(\1, \2)'),
-            (r'LTRIM\s*\(\s*([^)]+?)\s*\)', r'ltrim(\1)'),
-            (r'RTRIM\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'rtrim(\1, \2)'),
-            (r'RTRIM\s*\(\s*([^)]+?)\s*\)', r'rtrim(\1)'),
-            (r'TRIM\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'trim(\1, \2)'),
-            (r'TRIM\s*\(\s*([^)]+?)\s*\)', r'trim(\1)'),
-
-            # UPPER, LOWER
-            (r'UPPER\s*\(\s*([^)]+?)\s*\)', r'upper(\1)'),
-            (r'LOWER\s*\(\s*([^)]+?)\s*\)', r'lower(\1)'),
-
-            # LENGTH
-            (r'LENGTH\s*\(\s*([^)]+?)\s*\)', r'length(\1)'),
-
-            # LPAD, RPAD
-            (r'LPAD\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'lpad(\1, \2, \3)'),
-            (r'RPAD\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'rpad(\1, \2, \3)'),
-
-            # ===== FUNCIONES DE CONVERSIÓN =====
-
-            # TO_INTEGER, TO_DECIMAL, TO_FLOAT
-            (r'TO_INTEGER\s*\(\s*([^)]+?)\s*\)', r'toInteger(\1)'),
-            (r'TO_DECIMAL\s*\(\s*([^)]+?)\s*\)', r'toDecimal(\1)'),
-            (r'TO_FLOAT\s*\(\s*([^)]+?)\s*\)', r'toFloat(\1)'),
-            (r'TO_CHAR\s*\(\s*([^)]+?)\s*\)', r'toString(\1)'),
-
-            # ===== FUNCIONES CONDICIONALES =====
-
-            # IIF: Condicional ternario
-            (r'IIF\s*\(\s*([^,]+?)\s*,\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'iif(\1, \2, \3)'),
-
-            # DECODE: Case statement (complejo, requerirá procesamiento adicional)
-            # Por ahora se deja para case()
-
-            # ===== FUNCIONES DE AGREGACIÓN =====
-
-            # Estas se mantienen iguales pero en minúsculas
-            (r'SUM\s*\(\s*([^)]+?)\s*\)', r'sum(\1)'),
-            (r'AVG\s*\(\s*([^)]+?)\s*\)', r'avg(\1)'),
-            (r'COUNT\s*\(\s*([^)]+?)\s*\)', r'count(\1)'),
-            (r'COUNT\s*\(\s*\*\s*\)', r'count()'),
-            (r'MIN\s*\(\s*([^)]+?)\s*\)', r'min(\1)'),
-            (r'MAX\s*\(\s*([^)]+?)\s*\)', r'max(\1)'),
-            (r'FIRST\s*\(\s*([^)]+?)\s*\)', r'first(\1)'),
-            (r'LAST\s*\(\s*([^)]+?)\s*\)', r'last(\1)'),
-
-            # ===== FUNCIONES MATEMÁTICAS =====
-
-            (r'ROUND\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'round(\1, \2)'),
-            (r'ROUND\s*\(\s*([^)]+?)\s*\)', r'round(\1)'),
-            (r'CEIL\s*\(\s*([^)]+?)\s*\)', r'ceil(\1)'),
-            (r'FLOOR\s*\(\s*([^)]+?)\s*\)', r'floor(\1)'),
-            (r'ABS\s*\(\s*([^)]+?)\s*\)', r'abs(\1)'),
-            (r'POWER\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'power(\1, \2)'),
-            (r'SQRT\s*\(\s*([^)]+?)\s*\)', r'sqrt(\1)'),
-
-            # ===== FUNCIONES NULL =====
-
-            (r'ISNULL\s*\(\s*([^)]+?)\s*\)', r'isNull(\1)'),
-            (r'IS_NULL\s*\(\s*([^)]+?)\s*\)', r'isNull(\1)'),
-            (r'NVL\s*\(\s*([^,]+?)\s*,\s*([^)]+?)\s*\)', r'coalesce(\1, \2)'),
-            (r'COALESCE\s*\(\s*([^)]+?)\s*\)', r'coalesce(\1)'),
-        ]
+        Palabras de los patrones (nombres de función y literales) que aparecen en el texto.
+
+        Args:
+            text: Expresión a revisar
 
-    def _initialize_operator_mappings(self) -> List[Tuple[str, str]]:
+        Returns:
+            Set de palabras (en mayúsculas) presentes, o None si el texto no es
+            ASCII (IGNORECASE equipara letras como 'ı' con 'I' que upper() no
+            convierte, así que se deben probar todos los patrones)
         """
-        Inicializa mapeos de operadores.
-        El orden es crítico para evitar conflictos.
+        if not text.isascii():
+            return None
+
+        upper = text.upper()
+        if self._keyword_automaton is not None:
+            return {
+                self._distinct_keywords[index]
+                for _, indexes in self._keyword_automaton.iter(upper)
+                for index in indexes
+            }
+        return {keyword for keyword in self._distinct_keywords if keyword in upper}
+
+    def _find_forbidden(self, text_upper: str) -> List[str]:
         """
-        return [
-            # Operadores lógicos (deben procesarse ANTES que otros)
-            (r'\bAND\b', r'&&'),
-            (r'\bOR\b', r'||'),
-            (r'\bNOT\b', r'!'),
-
-            # Operador de concatenación (IMPORTANTE: PowerCenter usa ||)
-            # Pero || ya se usó para OR lógico, necesitamos contexto
-            # En PowerCenter: 'string1' || 'string2' es concatenación
-            # En ADF: concat(string1, string2)
-            # Este es complejo, se maneja en _handle_concatenation()
-
-            # Operadores de comparación
-            (r'<>', r'!='),
-            (r'===', r'=='),  # PowerCenter strict equal
-
-            # El = simple solo se convierte en contexto de comparación
-            # NO en asignaciones
-        ]
+        Busca funciones prohibidas en un texto ya convertido a mayúsculas.
 
-    def _initialize_forbidden_functions(self) -> List[str]:
-        """
-        Lista de funciones que NO deben aparecer en el resultado final.
-        Si aparecen, significa que la traducción falló.
+        Args:
+            text_upper: Texto en mayúsculas
 
-        Nota: Se validan como llamadas a función (con paréntesis), no como parte de nombres de variables.
+        Returns:
+            Funciones prohibidas presentes, en el orden de forbidden_functions
         """
+        if self._forbidden_automaton is not None:
+            found = set()
+            for _, indexes in self._forbidden_automaton.iter(text_upper):
+                found.update(indexes)
+            return [self.forbidden_functions[index] for index in sorted(found)]
+
         return [
-            'GET_DATE_PART(',
-            'ADD_TO_DATE(',
-            'ADD_toDate(',
-            'LAST_DAY(',
-            'TO_CHAR(',
-            'TO_DATE(',
-            'REPLACE_CHAR(',
-            'INSTR(',
-            'DECODE(',           # CRÍTICO: DECODE debe traducirse a case()
-            ' AND ',
-            ' OR ',
-            ' NOT ',
+            forbidden
+            for forbidden, forbidden_upper in zip(self.forbidden_functions, self._forbidden_upper)
+            if forbidden_upper in text_upper
         ]
 
     def translate(self, expression: str) -> str:
@@ -231,21 +403,33 @@ class ExpressionTranslator:
         if not expression or not expression.strip():
             return expression
 
-        translated = expression.strip()
+        cached = self._cache.get(expression)
+        if cached is not None:
+            return cached
 
         # 0. Normalizar expresión: eliminar saltos de línea y espacios múltiples
         # Esto es crítico para expresiones anidadas como:
         # toString(
         # GET_DATE_PART(
         # (ADD_toDate(...)),'DD'))
-        translated = re.sub(r'\s+', ' ', translated)  # Reemplazar múltiples espacios/saltos por un espacio
-        translated = translated.strip()
+        # split() usa los mismos espacios que \s y además quita los extremos
+        translated = ' '.join(expression.split())  # Reemplazar múltiples espacios/saltos por un espacio
 
         # 0.5. CRÍTICO: Eliminar prefijos IN_ y OUT_ de PowerCenter
         # PowerCenter usa IN_ para input ports y OUT_ para output ports
         # ADF no tiene este concepto, solo nombres de columnas
         # Ejemplo: IN_FIRSTNAME → FIRSTNAME, OUT_TOTAL → TOTAL
-        translated = re.sub(r'\b(IN|OUT)_', '', translated)
+        if 'IN_' in translated or 'OUT_' in translated:
+            translated = _IN_OUT_PREFIX_RE.sub('', translated)
+
+        # Camino rápido: la mayoría de los puertos son columnas simples
+        if (_IDENTIFIER_RE.fullmatch(translated)
+                and translated not in _IDENTIFIER_KEYWORDS
+                and 'SYSDATE' not in translated.upper()):
+            return translated
+
+        # 0.6. Normalizar el alias ADD_toDate a ADD_TO_DATE (un solo juego de patrones)
+        translated = _ADD_TODATE_ALIAS_RE.sub('ADD_TO_DATE', translated)
 
         # 1. Procesar funciones especiales (manejan paréntesis anidados)
         # NOTA: _translate_decode() maneja || y operadores internamente en cada argumento
@@ -254,13 +438,37 @@ class ExpressionTranslator:
         translated = self._translate_get_date_part(translated)
 
         # 2. Aplicar traducciones de funciones iterativamente hasta que no haya cambios
-        # Esto maneja funciones anidadas correctamente
+        # Esto maneja funciones anidadas correctamente. Cada patrón solo puede
+        # coincidir donde aparecen su nombre de función (y su literal), así que
+        # se omiten los que no aparecen en el texto, y el ciclo completo si no
+        # aparece nada (columnas simples, el caso más común). Las palabras
+        # presentes solo se recalculan cuando un patrón cambia el texto.
+        # Una pasada sin cambios solo necesita llegar hasta el último patrón
+        # que cambió el texto en la pasada anterior: los siguientes ya se
+        # aplicaron sin cambios sobre este mismo texto.
+        present = self._present_keywords(translated)
+        last_change = len(self._pattern_keywords)
         max_iterations = 10
         for iteration in range(max_iterations):
+            if present is not None and not present:
+                break
             previous = translated
-
-            for pattern, replacement in self.function_patterns:
-                translated = re.sub(pattern, replacement, translated, flags=re.IGNORECASE)
+            patterns = self.function_patterns if present is None else self._ascii_function_patterns
+            pass_last_change = -1
+
+            for index, (keywords, (pattern, replacement)) in enumerate(zip(self._pattern_keywords, patterns)):
+                if pass_last_change < 0 and index > last_change:
+                    break
+                if present is not None and not keywords <= present:
+                    continue
+                result = pattern.sub(replacement, translated)
+                if result != translated:
+                    # El reemplazo puede formar nombres nuevos (ej: ADD_ + toDate)
+                    translated = result
+                    present = self._present_keywords(translated)
+                    pass_last_change = index
+
+            last_change = pass_last_change
 
             # Si no hubo cambios, salir
             if translated == previous:
@@ -273,7 +481,7 @@ class ExpressionTranslator:
 
         # 4. Aplicar traducciones de operadores (si no fueron aplicados en DECODE)
         for pattern, replacement in self.operator_mappings:
-            translated = re.sub(pattern, replacement, translated)
+            translated = pattern.sub(replacement, translated)
 
         # 5. Convertir = a == en contextos de comparación (si no fue aplicado en DECODE)
         translated = self._convert_comparison_operators(translated)
@@ -281,8 +489,30 @@ class ExpressionTranslator:
         # 5. Validar que no queden funciones prohibidas
         self._validate_translation(translated, expression)
 
+        if len(self._cache) >= TRANSLATION_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[expression] = translated
         return translated
 
+    def translate_many(self, expressions: List[str]) -> List[str]:
+        """
+        Traduce una lista de expresiones (ej: todas las columnas de una
+        transformación), traduciendo una sola vez cada expresión distinta.
+
+        Args:
+            expressions: Expresiones en sintaxis PowerCenter
+
+        Returns:
+            Expresiones traducidas, en el mismo orden
+
+        Raises:
+            ValueError: Si alguna expresión contiene funciones no válidas después de traducción
+        """
+        translations = dict.fromkeys(expressions)
+        for expression in translations:
+            translations[expression] = self.translate(expression)
+        return [translations[expression] for expression in expressions]
+
     def _translate_decode(self, expression: str) -> str:
         """
         Traduce DECODE de PowerCenter a case() de ADF.
@@ -297,11 +527,14 @@ class ExpressionTranslator:
         - DECODE(TRUE, amount > 1000, 'High', amount > 500, 'Medium', 'Low')
           → case(true(), amount > 1000, 'High', amount > 500, 'Medium', 'Low')
         """
-        # Procesar iterativamente todas las ocurrencias de DECODE
+        # Procesar todas las ocurrencias de DECODE de izquierda a derecha.
+        # Lo anterior a cada DECODE ya no cambia: se guarda en translated_parts
+        # y la búsqueda sigue sobre el resto (case(...) con sus argumentos)
+        translated_parts = []
         max_iterations = 20
         for _ in range(max_iterations):
             # Buscar DECODE (case insensitive)
-            match = re.search(r'DECODE\s*\(', expression, re.IGNORECASE)
+            match = _DECODE_OPEN_RE.search(expression)
             if not match:
                 break  # No hay más DECODE
 
@@ -309,21 +542,12 @@ class ExpressionTranslator:
             paren_start = match.end() - 1  # Índice del '(' de apertura
 
             # Encontrar el paréntesis de cierre balanceado
-            paren_count = 1
-            i = paren_start + 1
-            while i < len(expression) and paren_count > 0:
-                if expression[i] == '(':
-                    paren_count += 1
-                elif expression[i] == ')':
-                    paren_count -= 1
-                i += 1
-
-            if paren_count != 0:
+            paren_end = self._find_closing_paren(expression, paren_start)
+
+            if paren_end < 0:
                 # Paréntesis no balanceados, no podemos procesar
                 break
 
-            paren_end = i - 1  # Índice del ')' de cierre
-
             # Extraer contenido dentro de los paréntesis
             content = expression[paren_start + 1:paren_end]
 
@@ -342,7 +566,7 @@ class ExpressionTranslator:
                 arg = self._handle_concatenation(arg)
                 # 2. Convertir operadores lógicos (AND, OR, NOT)
                 for pattern, replacement in self.operator_mappings:
-                    arg = re.sub(pattern, replacement, arg)
+                    arg = pattern.sub(replacement, arg)
                 # 3. Convertir = a == en comparaciones
                 arg = self._convert_comparison_operators(arg)
                 processed_args.append(arg)
@@ -361,55 +585,38 @@ class ExpressionTranslator:
             case_expr = f"case({', '.join(args)})"
 
             # Reemplazar en la expresión
-            expression = expression[:start_idx] + case_expr + expression[paren_end + 1:]
+            translated_parts.append(expression[:start_idx])
+            expression = case_expr + expression[paren_end + 1:]
 
-        return expression
+        translated_parts.append(expression)
+        return ''.join(translated_parts)
 
     def _translate_add_to_date(self, expression: str) -> str:
         """
-        Traduce ADD_TO_DATE y ADD_toDate manejando correctamente paréntesis anidados.
+        Traduce ADD_TO_DATE manejando correctamente paréntesis anidados.
 
-        ADD_TO_DATE(date_arg, 'DD', num_arg) o ADD_toDate(date_arg, 'DD', num_arg)
+        ADD_TO_DATE(date_arg, 'DD', num_arg) (translate() ya normalizó el alias ADD_toDate)
         """
-        # Mapeo de unidades de tiempo
-        time_unit_map = {
-            'DD': 'addDays',
-            'MM': 'addMonths',
-            'YYYY': 'addYears',
-            'YY': 'addYears',
-            'Y': 'addYears',
-            'HH': 'addHours',
-            'MI': 'addMinutes',
-            'SS': 'addSeconds'
-        }
-
-        # Procesar iterativamente todas las ocurrencias (ambas variantes)
+        # Procesar todas las ocurrencias de izquierda a derecha;
+        # lo anterior a cada reemplazo ya no cambia (ver _translate_decode)
+        translated_parts = []
         max_iterations = 20
         for _ in range(max_iterations):
-            # Buscar ADD_TO_DATE o ADD_toDate (case insensitive)
-            match = re.search(r'ADD_(TO_)?DATE\s*\(|ADD_toDate\s*\(', expression, re.IGNORECASE)
+            # Buscar ADD_TO_DATE (case insensitive)
+            match = _ADD_TO_DATE_OPEN_RE.search(expression)
             if not match:
-                break  # No hay más ADD_TO_DATE/ADD_toDate
+                break  # No hay más ADD_TO_DATE
 
             start_idx = match.start()
             paren_start = match.end() - 1  # Índice del '(' de apertura
 
             # Encontrar el paréntesis de cierre balanceado
-            paren_count = 1
-            i = paren_start + 1
-            while i < len(expression) and paren_count > 0:
-                if expression[i] == '(':
-                    paren_count += 1
-                elif expression[i] == ')':
-                    paren_count -= 1
-                i += 1
-
-            if paren_count != 0:
+            paren_end = self._find_closing_paren(expression, paren_start)
+
+            if paren_end < 0:
                 # Paréntesis no balanceados
                 break
 
-            paren_end = i - 1  # Índice del ')' de cierre
-
             # Extraer contenido dentro de los paréntesis
             content = expression[paren_start + 1:paren_end]
 
@@ -425,7 +632,7 @@ class ExpressionTranslator:
             num_arg = args[2].strip()
 
             # El segundo argumento debe ser un string literal como 'DD' o "MM"
-            unit_match = re.match(r'^[\'"]([A-Z]+)[\'"]$', unit_arg, re.IGNORECASE)
+            unit_match = _TIME_UNIT_LITERAL_RE.match(unit_arg)
             if not unit_match:
                 # No es un literal válido
                 break
@@ -433,7 +640,7 @@ class ExpressionTranslator:
             time_unit = unit_match.group(1).upper()
 
             # Obtener función ADF correspondiente
-            adf_func = time_unit_map.get(time_unit)
+            adf_func = _TIME_UNIT_FUNCTIONS.get(time_unit)
             if not adf_func:
                 # Unidad de tiempo no reconocida
                 break
@@ -442,9 +649,11 @@ class ExpressionTranslator:
             replacement = f"{adf_func}({date_arg}, {num_arg})"
 
             # Reemplazar en la expresión
-            expression = expression[:start_idx] + replacement + expression[paren_end + 1:]
+            translated_parts.append(expression[:start_idx])
+            expression = replacement + expression[paren_end + 1:]
 
-        return expression
+        translated_parts.append(expression)
+        return ''.join(translated_parts)
 
     def _split_function_args(self, text: str) -> list:
         """
@@ -457,37 +666,36 @@ class ExpressionTranslator:
             Lista de argumentos
         """
         args = []
-        current_arg = []
+        arg_start = 0
         paren_depth = 0
         in_single_quote = False
         in_double_quote = False
 
-        for char in text:
+        # Solo se visitan comillas, paréntesis y comas; los tramos entre
+        # separadores se copian con un slice
+        for match in _ARG_DELIMITER_RE.finditer(text):
+            char = match.group()
             # Manejar comillas
-            if char == "'" and not in_double_quote:
-                in_single_quote = not in_single_quote
-                current_arg.append(char)
-            elif char == '"' and not in_single_quote:
-                in_double_quote = not in_double_quote
-                current_arg.append(char)
-            # Manejar paréntesis
-            elif char == '(' and not in_single_quote and not in_double_quote:
-                paren_depth += 1
-                current_arg.append(char)
-            elif char == ')' and not in_single_quote and not in_double_quote:
-                paren_depth -= 1
-                current_arg.append(char)
-            # Manejar comas
-            elif char == ',' and paren_depth == 0 and not in_single_quote and not in_double_quote:
-                # Separador de argumentos
-                args.append(''.join(current_arg))
-                current_arg = []
-            else:
-                current_arg.append(char)
+            if char == "'":
+                if not in_double_quote:
+                    in_single_quote = not in_single_quote
+            elif char == '"':
+                if not in_single_quote:
+                    in_double_quote = not in_double_quote
+            # Manejar paréntesis y comas
+            elif not in_single_quote and not in_double_quote:
+                if char == '(':
+                    paren_depth += 1
+                elif char == ')':
+                    paren_depth -= 1
+                elif paren_depth == 0:
+                    # Separador de argumentos
+                    args.append(text[arg_start:match.start()])
+                    arg_start = match.end()
 
         # Agregar último argumento
-        if current_arg:
-            args.append(''.join(current_arg))
+        if arg_start < len(text):
+            args.append(text[arg_start:])
 
         return args
 
@@ -497,25 +705,13 @@ class ExpressionTranslator:
 
         GET_DATE_PART(arg, 'DD') donde arg puede contener paréntesis.
         """
-        # Mapeo de partes de fecha
-        date_part_map = {
-            'DD': 'dayOfMonth',
-            'MM': 'month',
-            'YYYY': 'year',
-            'YY': 'year',
-            'Y': 'year',
-            'DDD': 'dayOfYear',
-            'WW': 'weekOfYear',
-            'HH': 'hour',
-            'MI': 'minute',
-            'SS': 'second'
-        }
-
-        # Procesar iterativamente todas las ocurrencias
+        # Procesar todas las ocurrencias de izquierda a derecha;
+        # lo anterior a cada reemplazo ya no cambia (ver _translate_decode)
+        translated_parts = []
         max_iterations = 20
         for _ in range(max_iterations):
             # Buscar GET_DATE_PART (case insensitive)
-            match = re.search(r'GET_DATE_PART\s*\(', expression, re.IGNORECASE)
+            match = _GET_DATE_PART_OPEN_RE.search(expression)
             if not match:
                 break  # No hay más GET_DATE_PART
 
@@ -523,21 +719,12 @@ class ExpressionTranslator:
             paren_start = match.end() - 1  # Índice del '(' de apertura
 
             # Encontrar el paréntesis de cierre balanceado
-            paren_count = 1
-            i = paren_start + 1
-            while i < len(expression) and paren_count > 0:
-                if expression[i] == '(':
-                    paren_count += 1
-                elif expression[i] == ')':
-                    paren_count -= 1
-                i += 1
-
-            if paren_count != 0:
+            paren_end = self._find_closing_paren(expression, paren_start)
+
+            if paren_end < 0:
                 # Paréntesis no balanceados, no podemos procesar
                 break
 
-            paren_end = i - 1  # Índice del ')' de cierre
-
             # Extraer contenido dentro de los paréntesis
             content = expression[paren_start + 1:paren_end]
 
@@ -554,7 +741,7 @@ class ExpressionTranslator:
             arg2 = content[comma_idx + 1:].strip()
 
             # El segundo argumento debe ser un string literal como 'DD' o "MM"
-            arg2_match = re.match(r'^[\'"]([A-Z]+)[\'"]$', arg2)
+            arg2_match = _DATE_PART_LITERAL_RE.match(arg2)
             if not arg2_match:
                 # No es un literal válido
                 break
@@ -562,7 +749,7 @@ class ExpressionTranslator:
             date_part = arg2_match.group(1).upper()
 
             # Obtener función ADF correspondiente
-            adf_func = date_part_map.get(date_part)
+            adf_func = _DATE_PART_FUNCTIONS.get(date_part)
             if not adf_func:
                 # Parte de fecha no reconocida
                 break
@@ -571,9 +758,32 @@ class ExpressionTranslator:
             replacement = f"{adf_func}({arg1})"
 
             # Reemplazar en la expresión
-            expression = expression[:start_idx] + replacement + expression[paren_end + 1:]
+            translated_parts.append(expression[:start_idx])
+            expression = replacement + expression[paren_end + 1:]
 
-        return expression
+        translated_parts.append(expression)
+        return ''.join(translated_parts)
+
+    def _find_closing_paren(self, text: str, open_idx: int) -> int:
+        """
+        Encuentra el paréntesis que cierra el abierto en open_idx.
+
+        Args:
+            text: Texto donde buscar
+            open_idx: Índice del '(' de apertura
+
+        Returns:
+            Índice del ')' de cierre, o -1 si los paréntesis no están balanceados
+        """
+        paren_count = 1
+        for match in _PAREN_RE.finditer(text, open_idx + 1):
+            if match.group() == '(':
+                paren_count += 1
+            else:
+                paren_count -= 1
+                if paren_count == 0:
+                    return match.start()
+        return -1
 
     def _find_last_arg_separator(self, text: str) -> int:
         """
@@ -624,19 +834,18 @@ class ExpressionTranslator:
         # Patrón para detectar concatenación: operandos separados por ||
         # Evitar confusión con || lógico (ya traducido a &&)
 
-        # Buscar patrones del tipo: algo || algo
+        # Buscar patrones del tipo: algo || algo (_CONCAT_RE)
         # donde algo puede ser: 'string', "string", variable, función()
-        pattern = r"(['\"].*?['\"]|[\w\.]+(?:\([^)]*\))?)\s*\|\|\s*(['\"].*?['\"]|[\w\.]+(?:\([^)]*\))?)"
 
         # Reemplazar iterativamente hasta que no haya más ||
+        # (cada pasada anida un nivel: a || b || c -> concat(concat(a, b), c))
         max_iterations = 20
         iteration = 0
 
         while '||' in expression and iteration < max_iterations:
-            # Verificar si el || está en contexto de concatenación
-            if re.search(pattern, expression):
-                expression = re.sub(pattern, r'concat(\1, \2)', expression)
-            else:
+            # Una sola pasada: subn indica si el || estaba en contexto de concatenación
+            expression, replaced = _CONCAT_RE.subn(r'concat(\1, \2)', expression)
+            if not replaced:
                 break
             iteration += 1
 
@@ -648,14 +857,81 @@ class ExpressionTranslator:
         NO convierte en asignaciones de columnas.
 
         Regla: Si = está entre dos operandos (no al inicio de línea), convertir a ==
+
+        Recorre la expresión saltando de un '=' al siguiente, sin regex ni
+        backtracking: el operando izquierdo es el tramo sin espacios ni =!<>
+        anterior al '=' y el derecho llega hasta &&, ||, ',', ')' o el final.
         """
-        # Patrón: algo = algo (pero no ==)
-        # Buscar = que NO esté precedido o seguido por =, !, <, >
-        pattern = r'([^\s=!<>]+)\s*=\s*([^\s=][^=]*?)(?=\s*(?:&&|\|\||,|\)|$))'
+        equals = expression.find('=')
+        if equals < 0:
+            return expression
 
-        expression = re.sub(pattern, r'\1 == \2', expression)
+        length = len(expression)
+        parts = []
+        pos = 0
+        while equals >= 0:
+            # Operando izquierdo: tramo sin espacios ni =!<> justo antes del '='
+            end = equals
+            while end > pos and expression[end - 1].isspace():
+                end -= 1
+            start = end
+            while start > pos and not expression[start - 1].isspace() and expression[start - 1] not in '=!<>':
+                start -= 1
+
+            # Operando derecho: empieza sin espacio ni '='
+            right = equals + 1
+            while right < length and expression[right].isspace():
+                right += 1
+            right_end = self._comparison_operand_end(expression, right) if start < end else -1
+
+            if right_end < 0:
+                equals = expression.find('=', equals + 1)
+                continue
+
+            parts.append(expression[pos:end])
+            parts.append(' == ')
+            parts.append(expression[right:right_end])
+            pos = right_end
+            equals = expression.find('=', pos)
+
+        if not parts:
+            return expression
+        parts.append(expression[pos:])
+        return ''.join(parts)
 
-        return expression
+    @staticmethod
+    def _comparison_operand_end(expression: str, start: int) -> int:
+        """
+        Busca el fin del operando derecho de una comparación.
+
+        Args:
+            expression: Expresión completa
+            start: Posición donde empieza el operando
+
+        Returns:
+            Posición donde termina el operando, o -1 si no es una comparación
+        """
+        length = len(expression)
+        if start >= length or expression[start] == '=':
+            return -1
+
+        # El operando no puede cruzar otro '=': el terminador debe aparecer antes
+        limit = expression.find('=', start + 1)
+        if limit < 0:
+            limit = length
+        terminator = limit
+        for token in _COMPARISON_TERMINATORS:
+            found = expression.find(token, start + 1, terminator)
+            if found >= 0:
+                terminator = found
+        if terminator == limit and limit < length:
+            return -1
+
+        # Los espacios previos al terminador no forman parte del operando
+        end = terminator
+        while end > start + 1 and expression[end - 1].isspace():
+            end -= 1
+        return end
 
     def _validate_translation(self, translated: str, original: str) -> None:
         """
@@ -668,16 +944,15 @@ class ExpressionTranslator:
         Raises:
             ValueError: Si contiene funciones prohibidas
         """
-        translated_upper = translated.upper()
-
-        for forbidden in self.forbidden_functions:
-            # Buscar case-insensitive
-            if forbidden.upper() in translated_upper:
-                raise ValueError(
-                    f"Expresión traducida contiene función/operador no válido: '{forbidden.strip()}'\n"
-                    f"Original: {original}\n"
-                    f"Traducida: {translated}"
-                )
+        # Buscar case-insensitive
+        found = self._find_forbidden(translated.upper())
+        if found:
+            forbidden = found[0]
+            raise ValueError(
+                f"Expresión traducida contiene función/operador no válido: '{forbidden.strip()}'\n"
+                f"Original: {original}\n"
+                f"Traducida: {translated}"
+            )
 
     def validate_adf_expression(self, expression: str) -> Tuple[bool, List[str]]:
         """
@@ -692,10 +967,8 @@ class ExpressionTranslator:
         errors = []
 
         # Verificar funciones prohibidas (case-insensitive)
-        expression_upper = expression.upper()
-        for forbidden in self.forbidden_functions:
-            if forbidden.upper() in expression_upper:
-                errors.append(f"Contiene función/operador no válido: '{forbidden.strip()}'")
+        for forbidden in self._find_forbidden(expression.upper()):
+            errors.append(f"Contiene función/operador no válido: '{forbidden.strip()}'")
 
         # Verificar paréntesis balanceados
         if expression.count('(') != expression.count(')'):
@@ -731,6 +1004,19 @@ def translate_expression(expression: str) -> str:
     return _translator.translate(expression)
 
 
+def translate_expressions(expressions: List[str]) -> List[str]:
+    """
+    Función de conveniencia para traducir varias expresiones.
+
+    Args:
+        expressions: Expresiones en sintaxis PowerCenter
+
+    Returns:
+        Expresiones traducidas a sintaxis ADF, en el mismo orden
+    """
+    return _translator.translate_many(expressions)
+
+
 def validate_adf_expression(expression: str) -> Tuple[bool, List[str]]:
     """
     Función de conveniencia para validar expresiones ADF.
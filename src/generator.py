@@ -4,19 +4,237 @@ Crea pipelines, dataflows y genera reportes de migración
 100% compatible con el esquema oficial de ADF
 """
 
+import copy
 import json
 import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Callable, Deque, List, Optional, Tuple
 from datetime import datetime
 
-from jsonschema import validate, ValidationError as JsonSchemaValidationError
+from jsonschema import ValidationError as JsonSchemaValidationError
+from jsonschema.validators import validator_for
 
-from .utils import save_json, format_timestamp, calculate_migration_stats
-from .expression_translator import translate_expression, validate_adf_expression
+try:
+    import fastjsonschema
+except ImportError:  # Dependencia opcional (extra "fast")
+    fastjsonschema = None
+
+from .utils import save_json, load_json, serialize_json, stream_json, write_files, hash_json, format_timestamp, calculate_migration_stats
+from .expression_translator import translate_expression, translate_expressions, validate_adf_expression
 
 logger = logging.getLogger('pc-to-adf.generator')
 
+# Errores de validación de esquema (jsonschema y, si está instalado, fastjsonschema)
+_SCHEMA_VALIDATION_ERRORS = (JsonSchemaValidationError,) + (
+    (fastjsonschema.JsonSchemaValueException,) if fastjsonschema is not None else ()
+)
+
+# Número de pasos (sources + transformations + sinks) a partir del cual el
+# dataflow (y el reporte, contando transformations) se escribe por fragmentos
+# en lugar de codificarlo completo en memoria
+STREAM_DATAFLOW_THRESHOLD = 500
+
+# Partes fijas de la actividad ExecuteDataFlow, compartidas por todos los
+# pipelines (solo se serializan: no modificarlas)
+_PIPELINE_POLICY = {
+    'timeout': '1.00:00:00',
+    'retry': 0,
+    'retryIntervalInSeconds': 30,
+    'secureOutput': False,
+    'secureInput': False
+}
+_PIPELINE_COMPUTE = {
+    'coreCount': 8,
+    'computeType': 'General'
+}
+
+# Condiciones de dependencia de todos los pasos (compartida: solo se serializa)
+_SUCCEEDED = ['Succeeded']
+
+# Tipos de la estructura traducida que ya van en sources, no en transformations
+_SOURCE_TRANSFORMATION_TYPES = frozenset(('Source Qualifier', 'source', 'Source'))
+
+# Lista de elementos con 'expression' por tipo de transformación (Filter usa 'condition')
+_EXPRESSION_LISTS = {
+    'DerivedColumn': 'columns',
+    'Aggregate': 'aggregates',
+    'ConditionalSplit': 'conditions'
+}
+
+# Máximo de dataflows construidos que se recuerdan por estructura traducida
+DATAFLOW_CACHE_SIZE = 256
+
+# Últimos objetos escritos que validate_json puede usar sin releer el archivo
+# (los tres de un generate_all)
+LAST_WRITTEN_CACHE_SIZE = 3
+
+# Por debajo de este número de mappings no compensa arrancar procesos
+PARALLEL_MIN_MAPPINGS = 8
+
+
+def _depends_on(*steps: str) -> List[Dict[str, Any]]:
+    """
+    Construye el dependsOn de ADF: cada paso con la condición Succeeded.
+
+    Args:
+        steps: Nombres de los pasos de los que se depende
+
+    Returns:
+        Lista de dependencias
+    """
+    return [{'activity': step, 'dependencyConditions': _SUCCEEDED} for step in steps]
+
+
+def _annotation_for(moment: datetime) -> str:
+    """Anotación de origen de los pipelines generados en una fecha"""
+    return f"Migrado desde PowerCenter - {moment.strftime('%Y-%m-%d')}"
+
+
+def _build_join(
+    trans: Dict[str, Any],
+    recent_steps: Deque[str]
+) -> Dict[str, Any]:
+    """
+    Construye transformación Join con estructura completa de ADF.
+    Requiere dos inputs (left y right): los dos últimos pasos emitidos.
+    """
+    if len(recent_steps) < 2:
+        raise ValueError(f"Join '{trans['name']}' requiere al menos 2 inputs previos")
+
+    left_input, right_input = recent_steps
+
+    # Convertir join conditions
+    join_conditions = [
+        {
+            'leftColumn': cond.get('leftColumn', ''),
+            'operator': '==',
+            'rightColumn': cond.get('rightColumn', '')
+        }
+        for cond in trans.get('joinConditions', ())
+    ]
+
+    return {
+        'name': trans['name'],
+        'type': 'join',
+        'dependsOn': _depends_on(left_input, right_input),
+        'typeProperties': {
+            'joinType': trans.get('joinType', 'inner'),
+            'leftInput': left_input,
+            'rightInput': right_input,
+            'joinConditions': join_conditions
+        }
+    }
+
+
+def _build_sort(
+    trans: Dict[str, Any],
+    previous_step: str
+) -> Dict[str, Any]:
+    """
+    Construye transformación Sort con estructura completa de ADF.
+    """
+    return {
+        'name': trans['name'],
+        'type': 'sort',
+        'dependsOn': _depends_on(previous_step),
+        'typeProperties': {
+            'sortColumns': trans.get('orderBy', []),
+            'distinct': trans.get('distinct', False)
+        }
+    }
+
+
+def _build_lookup(
+    trans: Dict[str, Any],
+    previous_step: str
+) -> Dict[str, Any]:
+    """
+    Construye transformación Lookup con estructura completa de ADF.
+    """
+    lookup_conditions = [
+        {
+            'leftColumn': cond.get('leftColumn', ''),
+            'operator': '==',
+            'rightColumn': cond.get('rightColumn', '')
+        }
+        for cond in trans.get('lookupConditions', ())
+    ]
+
+    type_props = {
+        'lookupDataset': {
+            'referenceName': trans.get('lookupDataset', 'ds_lookup'),
+            'type': 'DatasetReference'
+        },
+        'lookupConditions': lookup_conditions,
+        'multiple': False
+    }
+
+    return {
+        'name': trans['name'],
+        'type': 'lookup',
+        'dependsOn': _depends_on(previous_step),
+        'typeProperties': type_props
+    }
+
+
+def _build_alter_row(
+    trans: Dict[str, Any],
+    previous_step: str
+) -> Dict[str, Any]:
+    """
+    Construye transformación AlterRow con estructura completa de ADF.
+    """
+    action = trans.get('action', 'insert')
+
+    type_props = {}
+
+    # Agregar condiciones según la acción
+    if action == 'insert':
+        type_props['insertCondition'] = {
+            'value': trans.get('condition', 'true'),
+            'type': 'Expression'
+        }
+    elif action == 'update':
+        type_props['updateCondition'] = {
+            'value': trans.get('condition', 'true'),
+            'type': 'Expression'
+        }
+    elif action == 'delete':
+        type_props['deleteCondition'] = {
+            'value': trans.get('condition', 'true'),
+            'type': 'Expression'
+        }
+    elif action == 'upsert':
+        type_props['upsertCondition'] = {
+            'value': trans.get('condition', 'true'),
+            'type': 'Expression'
+        }
+
+    return {
+        'name': trans['name'],
+        'type': 'alterRow',
+        'dependsOn': _depends_on(previous_step),
+        'typeProperties': type_props
+    }
+
+
+def _build_generic_transformation(
+    trans: Dict[str, Any],
+    previous_step: str
+) -> Dict[str, Any]:
+    """
+    Construye transformación genérica con estructura básica de ADF.
+    """
+    return {
+        'name': trans['name'],
+        'type': trans['type'].lower(),
+        'dependsOn': _depends_on(previous_step),
+        'typeProperties': {}
+    }
+
 
 class ADFGenerator:
     """
@@ -25,21 +243,132 @@ class ADFGenerator:
     Garantiza compatibilidad 100% con el esquema oficial de ADF.
     """
 
-    def __init__(self, output_dir: str = './output'):
+    def __init__(
+        self,
+        output_dir: str = './output',
+        schema: Optional[Dict] = None,
+        validate_structure: bool = True
+    ):
         """
         Inicializa el generador.
 
         Args:
             output_dir: Directorio donde se guardarán los archivos generados
+            schema: Esquema JSON por defecto para validate_json (se compila aquí,
+                una sola vez, p. ej. adf_validator.ADF_DATAFLOW_SCHEMA)
+            validate_structure: Si False, no se revisa la estructura de cada
+                dataflow generado (el generador crea él mismo esas claves; útil
+                en migraciones por lotes)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        logger.info(f"Generador inicializado. Output: {self.output_dir}")
+        self._output_dir_str = str(self.output_dir)
+        logger.info("Generador inicializado. Output: %s", self.output_dir)
 
         self.generated_files: List[str] = []
         self.validation_errors: List[str] = []
         self.validation_warnings: List[str] = []
 
+        # Instante fijado por set_batch_timestamp para todos los mappings de un lote
+        self._batch_moment: Optional[datetime] = None
+        # Instante fijado por generate_all (o el del lote) para que sus archivos
+        # compartan anotación y sufijo de timestamp (None: usar el actual)
+        self._run_moment: Optional[datetime] = None
+        self._run_annotation: Optional[str] = None
+        self._run_timestamp: Optional[str] = None
+        # Escrituras diferidas por generate_all (ruta, JSON serializado); None: escribir al momento
+        self._pending_writes: Optional[List[Tuple[str, bytes]]] = None
+        # Dataflows ya construidos: hash de la estructura traducida ->
+        # (properties, warnings emitidos, errores emitidos)
+        self._dataflow_cache: Dict[str, Tuple[Dict[str, Any], List[str], List[str]]] = {}
+        # Expresiones del dataflow en construcción ya traducidas y validadas:
+        # original -> (traducida, es_válida, errores)
+        self._expression_results: Dict[str, Tuple[str, bool, List[str]]] = {}
+        # Últimos objetos escritos por ruta, para no releerlos en validate_json
+        self._last_written: Dict[str, Dict[str, Any]] = {}
+        # Validadores construidos por esquema: id(schema) -> (schema, validador)
+        self._compiled_validators: Dict[int, Tuple[Dict, Callable[[Any], Any]]] = {}
+
+        # Constructor por tipo de transformación, llamado como builder(trans, input):
+        # métodos los que traducen expresiones, funciones del módulo el resto
+        # (los tipos no listados usan _build_generic_transformation)
+        self._transformation_builders: Dict[str, Callable[[Dict[str, Any], Any], Dict[str, Any]]] = {
+            'DerivedColumn': self._build_derived_column,
+            'Filter': self._build_filter,
+            'Aggregate': self._build_aggregate,
+            'Join': _build_join,
+            'Sort': _build_sort,
+            'ConditionalSplit': self._build_conditional_split,
+            'Lookup': _build_lookup,
+            'AlterRow': _build_alter_row
+        }
+
+        self.validate_structure = validate_structure
+        self.schema = schema
+        if schema:
+            self._schema_validator(schema)
+
+    def _set_run_moment(self, moment: Optional[datetime]) -> None:
+        """Fija (o libera con None) el instante y sus cadenas derivadas"""
+        self._run_moment = moment
+        if moment is None:
+            self._run_annotation = self._run_timestamp = None
+        else:
+            self._run_annotation = _annotation_for(moment)
+            self._run_timestamp = format_timestamp(moment)
+
+    def set_batch_timestamp(self, moment: Optional[datetime] = None) -> None:
+        """
+        Fija la fecha y el sufijo de timestamp para todas las generaciones siguientes.
+
+        Útil al migrar muchos mappings: el reloj se consulta una vez por lote.
+
+        Args:
+            moment: Instante del lote (por defecto, el actual)
+        """
+        self._batch_moment = moment or datetime.now()
+        self._set_run_moment(self._batch_moment)
+
+    def clear_batch_timestamp(self) -> None:
+        """Vuelve a resolver la fecha en cada generación"""
+        self._batch_moment = None
+        self._set_run_moment(None)
+
+    def _output_path(self, filename: str) -> str:
+        """Ruta de un archivo de salida dentro de output_dir"""
+        return os.path.join(self._output_dir_str, filename)
+
+    def _annotation(self) -> str:
+        """Anotación de origen del pipeline (la de generate_all o la del lote)"""
+        return self._run_annotation or _annotation_for(datetime.now())
+
+    def _file_timestamp(self) -> str:
+        """Sufijo de timestamp para nombres de archivo (el de generate_all o el del lote)"""
+        return self._run_timestamp or format_timestamp()
+
+    def _save_output(self, data: Dict[str, Any], filepath: str, stream: bool = False) -> None:
+        """
+        Guarda un JSON de salida, o lo deja serializado en la cola de generate_all.
+
+        Args:
+            data: Diccionario a guardar
+            filepath: Ruta del archivo de salida
+            stream: Si True, lo escribe al momento por fragmentos (sin encolar
+                ni recordarlo para validate_json); puede contener generadores
+        """
+        if stream:
+            stream_json(data, filepath)
+            return
+
+        if len(self._last_written) >= LAST_WRITTEN_CACHE_SIZE:
+            self._last_written.pop(next(iter(self._last_written)))
+        self._last_written[filepath] = data
+
+        if self._pending_writes is None:
+            save_json(data, filepath)
+        else:
+            self._pending_writes.append((filepath, serialize_json(data)))
+
     def _normalize_dataset_name(self, name: str, is_source: bool = False) -> str:
         """
         Normaliza el nombre de un dataset según la convención de infraestructura Azure.
@@ -70,35 +399,18 @@ class ADFGenerator:
         Returns:
             Set con nombres de sources válidos
         """
-        valid_sources = set()
-        sources = {s['name'] for s in translated_structure.get('sources', [])}
-        transformations = translated_structure.get('transformations', [])
-        sinks = translated_structure.get('sinks', [])
+        source_records = translated_structure.get('sources', ())
+        if not source_records:
+            return set()
 
         # Si no hay transformations ni sinks, todos los sources son inválidos
-        if not transformations and not sinks:
+        if not translated_structure.get('transformations') and not translated_structure.get('sinks'):
             logger.warning("No hay transformaciones ni sinks en el flujo. Todos los sources son huérfanos.")
-            return valid_sources
-
-        # Construir grafo de dependencias hacia adelante (quién usa a quién)
-        # Si una transformación o sink existe, rastrear hacia atrás qué sources contribuyen
-        referenced_components = set()
-
-        # Agregar todos los nombres de transformaciones como componentes válidos
-        for trans in transformations:
-            referenced_components.add(trans['name'])
+            return set()
 
-        # Si hay transformaciones, los sources que alimentan la primera transformación son válidos
-        # (asumimos flujo secuencial básico)
-        if transformations:
-            # Marcar todos los sources como válidos si hay al menos una transformación
-            # porque el flujo secuencial conecta sources -> primera transformation
-            valid_sources.update(sources)
-        elif sinks:
-            # Si solo hay sinks sin transformaciones, los sources son válidos
-            valid_sources.update(sources)
-
-        return valid_sources
+        # Flujo secuencial básico: los sources alimentan la primera transformación
+        # o, si no hay transformaciones, directamente a los sinks
+        return {s['name'] for s in source_records}
 
     def generate_pipeline(
         self,
@@ -115,7 +427,7 @@ class ADFGenerator:
         Returns:
             Ruta al archivo generado
         """
-        logger.info(f"Generando pipeline: {name}")
+        logger.info("Generando pipeline: %s", name)
 
         pipeline = {
             'name': f"pipeline_{name}",
@@ -126,40 +438,31 @@ class ADFGenerator:
                         'name': 'ExecuteDataFlow',
                         'type': 'ExecuteDataFlow',
                         'dependsOn': [],
-                        'policy': {
-                            'timeout': '1.00:00:00',
-                            'retry': 0,
-                            'retryIntervalInSeconds': 30,
-                            'secureOutput': False,
-                            'secureInput': False
-                        },
+                        'policy': _PIPELINE_POLICY,
                         'typeProperties': {
                             'dataFlow': {
                                 'referenceName': f"dataflow_{name}",
                                 'type': 'DataFlowReference'
                             },
-                            'compute': {
-                                'coreCount': 8,
-                                'computeType': 'General'
-                            }
+                            'compute': _PIPELINE_COMPUTE
                         }
                     }
                 ],
                 'annotations': [
-                    f"Migrado desde PowerCenter - {datetime.now().strftime('%Y-%m-%d')}"
+                    self._annotation()
                 ]
             }
         }
 
         # Guardar archivo
-        filename = f"pipeline_{name}_{format_timestamp()}.json"
-        filepath = self.output_dir / filename
-        save_json(pipeline, str(filepath))
+        filename = f"pipeline_{name}_{self._file_timestamp()}.json"
+        filepath = self._output_path(filename)
+        self._save_output(pipeline, filepath)
 
-        self.generated_files.append(str(filepath))
-        logger.info(f"Pipeline generado: {filepath}")
+        self.generated_files.append(filepath)
+        logger.info("Pipeline generado: %s", filepath)
 
-        return str(filepath)
+        return filepath
 
     def generate_dataflow(
         self,
@@ -179,7 +482,69 @@ class ADFGenerator:
         Raises:
             ValueError: Si la estructura no es válida
         """
-        logger.info(f"Generando dataflow: {name}")
+        logger.info("Generando dataflow: %s", name)
+
+        # Mappings con la misma estructura traducida producen el mismo dataflow
+        # salvo el nombre: reutilizar el ya construido y validado
+        cache_key = hash_json(translated_structure)
+        cached = self._dataflow_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            properties, warnings, errors = cached
+            logger.debug("Reutilizando dataflow ya construido para: %s", name)
+            self.validation_warnings.extend(warnings)
+            self.validation_errors.extend(errors)
+            dataflow = {
+                'name': f"dataflow_{name}",
+                'properties': properties,
+                'type': 'Microsoft.DataFactory/factories/dataflows'
+            }
+        else:
+            warnings_start = len(self.validation_warnings)
+            errors_start = len(self.validation_errors)
+            dataflow = self._build_dataflow(name, translated_structure)
+            if cache_key is not None:
+                if len(self._dataflow_cache) >= DATAFLOW_CACHE_SIZE:
+                    self._dataflow_cache.clear()
+                self._dataflow_cache[cache_key] = (
+                    copy.deepcopy(dataflow['properties']),
+                    self.validation_warnings[warnings_start:],
+                    self.validation_errors[errors_start:]
+                )
+
+        # Guardar archivo
+        filename = f"dataflow_{name}_{self._file_timestamp()}.json"
+        filepath = self._output_path(filename)
+        type_properties = dataflow['properties']['typeProperties']
+        step_count = sum(len(type_properties[key]) for key in ('sources', 'transformations', 'sinks'))
+        self._save_output(dataflow, filepath, stream=step_count >= STREAM_DATAFLOW_THRESHOLD)
+
+        self.generated_files.append(filepath)
+        logger.info("Dataflow generado: %s", filepath)
+
+        return filepath
+
+    def _build_dataflow(
+        self,
+        name: str,
+        translated_structure: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Construye y valida el dataflow de ADF a partir de la estructura traducida.
+
+        Args:
+            name: Nombre del dataflow
+            translated_structure: Estructura traducida del mapping
+
+        Returns:
+            Diccionario del dataflow
+
+        Raises:
+            ValueError: Si la estructura no es válida
+        """
+        # Traducir de una vez todas las expresiones del mapping
+        self._expression_results = self._translate_all_expressions(
+            translated_structure.get('transformations', ())
+        )
 
         # Construir sources (sin dependsOn) con validación de topología
         sources = []
@@ -188,7 +553,7 @@ class ADFGenerator:
         # CRÍTICO: Validar topología - verificar que sources tengan conexiones válidas
         valid_sources = self._validate_source_topology(translated_structure)
 
-        for source in translated_structure.get('sources', []):
+        for source in translated_structure.get('sources', ()):
             source_name = source['name']
 
             # Validar que no sea duplicado
@@ -220,11 +585,15 @@ class ADFGenerator:
 
         # Construir transformations con dependsOn y typeProperties
         transformations = []
-        all_step_names = {s['name'] for s in sources}  # Nombres de todos los pasos anteriores
+        # Los dos últimos pasos emitidos (sources y luego transformations), inputs de un Join
+        recent_steps = deque((s['name'] for s in sources), maxlen=2)
+        builders = self._transformation_builders
+        previous_record_name = None  # Nombre del registro anterior (aunque se haya saltado)
 
-        for idx, trans in enumerate(translated_structure.get('transformations', [])):
+        for idx, trans in enumerate(translated_structure.get('transformations', ())):
             trans_name = trans['name']
             trans_type = trans['type']
+            record_before, previous_record_name = previous_record_name, trans_name
 
             # CRÍTICO: Validar que NO sea un source disfrazado de transformation
             if trans_name in source_names:
@@ -239,7 +608,7 @@ class ADFGenerator:
                 continue
 
             # Validar que no sea tipo 'Source Qualifier' sin transformaciones reales
-            if trans_type in ['Source Qualifier', 'source', 'Source']:
+            if trans_type in _SOURCE_TRANSFORMATION_TYPES:
                 logger.warning(
                     f"Saltando transformación de tipo '{trans_type}': {trans_name} "
                     "(ya debe estar en sources)"
@@ -248,42 +617,27 @@ class ADFGenerator:
 
             # Determinar dependencia (paso anterior)
             if idx == 0:
-                # Primera transformación depende de sources
-                if len(sources) == 1:
-                    previous_step = sources[0]['name']
-                else:
-                    # Si hay múltiples sources, necesitamos saber cuál usar
-                    # Por ahora, usar el primero
-                    previous_step = sources[0]['name']
+                # Primera transformación depende de sources; con múltiples
+                # sources, por ahora, del primero
+                previous_step = sources[0]['name']
             else:
                 # Depende de la transformación anterior
-                previous_step = translated_structure['transformations'][idx - 1]['name']
+                previous_step = record_before
 
             # Construir transformación según tipo
             try:
-                if trans_type == 'DerivedColumn':
-                    trans_def = self._build_derived_column(trans, previous_step)
-                elif trans_type == 'Filter':
-                    trans_def = self._build_filter(trans, previous_step)
-                elif trans_type == 'Aggregate':
-                    trans_def = self._build_aggregate(trans, previous_step)
+                builder = builders.get(trans_type)
+                if builder is None:
+                    logger.warning(f"Tipo de transformación no soportado: {trans_type}")
+                    trans_def = _build_generic_transformation(trans, previous_step)
                 elif trans_type == 'Join':
                     # Join necesita dos inputs
-                    trans_def = self._build_join(trans, all_step_names)
-                elif trans_type == 'Sort':
-                    trans_def = self._build_sort(trans, previous_step)
-                elif trans_type == 'ConditionalSplit':
-                    trans_def = self._build_conditional_split(trans, previous_step)
-                elif trans_type == 'Lookup':
-                    trans_def = self._build_lookup(trans, previous_step)
-                elif trans_type == 'AlterRow':
-                    trans_def = self._build_alter_row(trans, previous_step)
+                    trans_def = builder(trans, recent_steps)
                 else:
-                    logger.warning(f"Tipo de transformación no soportado: {trans_type}")
-                    trans_def = self._build_generic_transformation(trans, previous_step)
+                    trans_def = builder(trans, previous_step)
 
                 transformations.append(trans_def)
-                all_step_names.add(trans_name)
+                recent_steps.append(trans_name)
 
             except Exception as e:
                 error_msg = f"Error construyendo transformación '{trans_name}': {e}"
@@ -292,9 +646,10 @@ class ADFGenerator:
                 raise ValueError(error_msg)
 
         # Construir sinks con dependsOn
-        sinks = []
-        for sink in translated_structure.get('sinks', []):
+        sink_records = translated_structure.get('sinks', ())
+        if sink_records:
             # Último paso de transformación o source si no hay transformaciones
+            # (el mismo para todos los sinks)
             if transformations:
                 last_step = transformations[-1]['name']
             elif sources:
@@ -302,20 +657,17 @@ class ADFGenerator:
             else:
                 raise ValueError("No hay sources ni transformations para conectar al sink")
 
-            sink_def = {
+        sinks = [
+            {
                 'name': sink['name'],
                 'dataset': {
                     'referenceName': self._normalize_dataset_name(sink['name'], is_source=False),
                     'type': 'DatasetReference'
                 },
-                'dependsOn': [
-                    {
-                        'activity': last_step,
-                        'dependencyConditions': ['Succeeded']
-                    }
-                ]
+                'dependsOn': _depends_on(last_step)
             }
-            sinks.append(sink_def)
+            for sink in sink_records
+        ]
 
         # Estructura completa del dataflow (esquema oficial de ADF)
         dataflow = {
@@ -334,17 +686,10 @@ class ADFGenerator:
         }
 
         # Validar estructura antes de guardar
-        self._validate_dataflow_structure(dataflow)
-
-        # Guardar archivo
-        filename = f"dataflow_{name}_{format_timestamp()}.json"
-        filepath = self.output_dir / filename
-        save_json(dataflow, str(filepath))
-
-        self.generated_files.append(str(filepath))
-        logger.info(f"Dataflow generado: {filepath}")
+        if self.validate_structure:
+            self._validate_dataflow_structure(dataflow)
 
-        return str(filepath)
+        return dataflow
 
     def generate_report(
         self,
@@ -363,50 +708,92 @@ class ADFGenerator:
         Returns:
             Ruta al archivo de reporte generado
         """
-        logger.info(f"Generando reporte de migración: {name}")
+        logger.info("Generando reporte de migración: %s", name)
+
+        # Leer cada lista de la estructura una sola vez
+        transformations = translated_structure.get('transformations', ())
+        warnings = translated_structure.get('warnings', [])
+        errors = translated_structure.get('errors', [])
+
+        # Detalle por transformación. En reportes grandes se escribe por
+        # fragmentos y el detalle se genera a medida que se escribe
+        migrated_trans = len(transformations)
+        stream = migrated_trans >= STREAM_DATAFLOW_THRESHOLD
+        transformations_migrated = (
+            {
+                'name': t['name'],
+                'type': t['type'],
+                'status': 'migrated'
+            }
+            for t in transformations
+        )
+        if not stream:
+            transformations_migrated = list(transformations_migrated)
 
         # Calcular estadísticas
         total_trans = len(original_metadata.transformations) if original_metadata else 0
-        migrated_trans = len(translated_structure.get('transformations', []))
-        warnings = len(translated_structure.get('warnings', []))
-        errors = len(translated_structure.get('errors', []))
 
-        stats = calculate_migration_stats(total_trans, migrated_trans, warnings, errors)
+        stats = calculate_migration_stats(total_trans, migrated_trans, len(warnings), len(errors))
 
         # Construir reporte
         report = {
             'mapping_name': name,
-            'migration_date': datetime.now().isoformat(),
+            'migration_date': (self._run_moment or datetime.now()).isoformat(),
             'statistics': stats,
             'components': {
-                'sources': len(translated_structure.get('sources', [])),
+                'sources': len(translated_structure.get('sources', ())),
                 'transformations': migrated_trans,
-                'sinks': len(translated_structure.get('sinks', []))
+                'sinks': len(translated_structure.get('sinks', ()))
             },
-            'warnings': translated_structure.get('warnings', []),
-            'errors': translated_structure.get('errors', []),
+            'warnings': warnings,
+            'errors': errors,
             'details': {
-                'transformations_migrated': [
-                    {
-                        'name': t['name'],
-                        'type': t['type'],
-                        'status': 'migrated'
-                    }
-                    for t in translated_structure.get('transformations', [])
-                ]
+                'transformations_migrated': transformations_migrated
             },
             'recommendations': self._generate_recommendations(translated_structure)
         }
 
         # Guardar reporte
-        filename = f"migration_report_{name}_{format_timestamp()}.json"
-        filepath = self.output_dir / filename
-        save_json(report, str(filepath))
+        filename = f"migration_report_{name}_{self._file_timestamp()}.json"
+        filepath = self._output_path(filename)
+        self._save_output(report, filepath, stream=stream)
+
+        self.generated_files.append(filepath)
+        logger.info("Reporte generado: %s", filepath)
+
+        return filepath
 
-        self.generated_files.append(str(filepath))
-        logger.info(f"Reporte generado: {filepath}")
+    def _schema_validator(self, schema: Dict) -> Callable[[Any], Any]:
+        """
+        Retorna el validador de un esquema, construido una sola vez.
+
+        Usa fastjsonschema si está instalado y soporta el esquema; si no, un
+        validador de jsonschema (del draft declarado por el esquema).
+
+        Args:
+            schema: Esquema JSON
 
-        return str(filepath)
+        Returns:
+            Función que lanza una excepción de validación si los datos no cumplen
+
+        Raises:
+            jsonschema.SchemaError: Si el esquema no es válido
+        """
+        cached = self._compiled_validators.get(id(schema))
+        if cached is None or cached[0] is not schema:
+            validator = None
+            if fastjsonschema is not None:
+                try:
+                    validator = fastjsonschema.compile(schema, use_default=False)
+                except fastjsonschema.JsonSchemaDefinitionException as e:
+                    logger.debug("fastjsonschema no soporta el esquema (%s); se usa jsonschema", e)
+            if validator is None:
+                validator_class = validator_for(schema)
+                validator_class.check_schema(schema)
+                validator = validator_class(schema).validate
+            cached = (schema, validator)
+            self._compiled_validators[id(schema)] = cached
+        return cached[1]
 
     def validate_json(self, json_file: str, schema: Optional[Dict] = None) -> bool:
         """
@@ -414,27 +801,30 @@ class ADFGenerator:
 
         Args:
             json_file: Ruta al archivo JSON
-            schema: Esquema JSON opcional para validación
+            schema: Esquema JSON opcional para validación (por defecto, el del generador)
 
         Returns:
             True si es válido, False en caso contrario
         """
-        logger.info(f"Validando JSON: {json_file}")
+        schema = schema or self.schema
+        logger.info("Validando JSON: %s", json_file)
 
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            # Si el archivo se acaba de generar, validar el objeto escrito
+            data = self._last_written.pop(json_file, None)
+            if data is None:
+                data = load_json(json_file)
 
             if schema:
-                validate(instance=data, schema=schema)
+                self._schema_validator(schema)(data)
 
-            logger.info(f"JSON válido: {json_file}")
+            logger.info("JSON válido: %s", json_file)
             return True
 
         except json.JSONDecodeError as e:
             logger.error(f"Error de formato JSON en {json_file}: {e}")
             return False
-        except JsonSchemaValidationError as e:
+        except _SCHEMA_VALIDATION_ERRORS as e:
             logger.error(f"Error de validación de esquema en {json_file}: {e}")
             return False
         except Exception as e:
@@ -458,17 +848,124 @@ class ADFGenerator:
         Returns:
             Diccionario con rutas a todos los archivos generados
         """
-        logger.info(f"Generando todos los archivos para: {name}")
+        logger.info("Generando todos los archivos para: %s", name)
 
-        files = {
-            'pipeline': self.generate_pipeline(name, translated_structure),
-            'dataflow': self.generate_dataflow(name, translated_structure),
-            'report': self.generate_report(name, translated_structure, original_metadata)
-        }
+        # Resolver la fecha una sola vez para los tres archivos (o usar la del lote)
+        self._set_run_moment(self._batch_moment or datetime.now())
+        # Serializar los tres archivos y escribirlos juntos al final (también
+        # los ya generados si uno falla, como cuando se escribían uno a uno)
+        self._pending_writes = []
+        try:
+            files = {
+                'pipeline': self.generate_pipeline(name, translated_structure),
+                'dataflow': self.generate_dataflow(name, translated_structure),
+                'report': self.generate_report(name, translated_structure, original_metadata)
+            }
+        finally:
+            pending, self._pending_writes = self._pending_writes, None
+            self._set_run_moment(self._batch_moment)
+            write_files(pending)
 
-        logger.info(f"Generación completada. {len(files)} archivos creados.")
+        logger.info("Generación completada. %s archivos creados.", len(files))
         return files
 
+    def generate_many(
+        self,
+        items: List[Tuple[str, Dict[str, Any], Optional[Any]]],
+        max_workers: Optional[int] = None
+    ) -> List[Dict[str, str]]:
+        """
+        Genera los archivos de muchos mappings independientes, repartidos entre procesos.
+
+        Args:
+            items: Tuplas (nombre, estructura traducida, metadata original o None)
+            max_workers: Procesos a usar (por defecto, uno por CPU)
+
+        Returns:
+            Lista con el resultado de generate_all de cada mapping, en el mismo orden
+
+        Raises:
+            ValueError: Si la estructura de algún mapping no es válida
+        """
+        # Lotes pequeños: el arranque del pool cuesta más que generarlos aquí
+        if len(items) < PARALLEL_MIN_MAPPINGS:
+            return [self.generate_all(name, translated, metadata) for name, translated, metadata in items]
+
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(items) // (workers * 4))
+        logger.debug("Generando %s mappings con %s procesos", len(items), workers)
+
+        tasks = [
+            (self._output_dir_str, self.validate_structure, self._batch_moment, name, translated, metadata)
+            for name, translated, metadata in items
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_generate_all_worker, tasks, chunksize=chunksize))
+
+        # Incorporar lo generado por los procesos, en orden
+        all_files = []
+        for files, warnings, errors in results:
+            all_files.append(files)
+            self.generated_files.extend(files.values())
+            self.validation_warnings.extend(warnings)
+            self.validation_errors.extend(errors)
+        return all_files
+
+    def _translate_all_expressions(
+        self,
+        transformations: List[Dict[str, Any]]
+    ) -> Dict[str, Tuple[str, bool, List[str]]]:
+        """
+        Traduce y valida en un solo lote las expresiones de las transformaciones,
+        una vez por expresión distinta.
+
+        Args:
+            transformations: Transformaciones de la estructura traducida
+
+        Returns:
+            Diccionario expresión original -> (traducida, es_válida, errores); vacío
+            si alguna falla (cada constructor la traducirá y reportará su error)
+        """
+        expressions = []
+        try:
+            for trans in transformations:
+                trans_type = trans.get('type')
+                if trans_type == 'Filter':
+                    expressions.append(trans.get('condition', 'true'))
+                elif trans_type in _EXPRESSION_LISTS:
+                    items = trans.get(_EXPRESSION_LISTS[trans_type], ())
+                    expressions.extend(item.get('expression', '') for item in items)
+
+            unique = list(dict.fromkeys(e for e in expressions if isinstance(e, str)))
+            translated = translate_expressions(unique)
+        except Exception as e:
+            logger.debug("Traducción en lote no disponible (%s); se traduce por transformación", e)
+            return {}
+
+        return {
+            expression: (translated_expr,) + tuple(validate_adf_expression(translated_expr))
+            for expression, translated_expr in zip(unique, translated)
+        }
+
+    def _translate_checked(self, expression: str) -> Tuple[str, bool, List[str]]:
+        """
+        Traduce y valida una expresión, usando el lote ya traducido si la contiene.
+
+        Args:
+            expression: Expresión en sintaxis PowerCenter
+
+        Returns:
+            Tupla (expresión traducida, es_válida, lista_de_errores)
+        """
+        if isinstance(expression, str):
+            result = self._expression_results.get(expression)
+            if result is not None:
+                return result
+
+        translated_expr = translate_expression(expression)
+        is_valid, errors = validate_adf_expression(translated_expr)
+        return translated_expr, is_valid, errors
+
     def _build_derived_column(
         self,
         trans: Dict[str, Any],
@@ -478,12 +975,11 @@ class ADFGenerator:
         Construye transformación DerivedColumn con estructura completa de ADF.
         """
         columns = []
-        for col in trans.get('columns', []):
+        for col in trans.get('columns', ()):
             expression = col.get('expression', '')
 
             # Traducir y validar expresión
-            translated_expr = translate_expression(expression)
-            is_valid, errors = validate_adf_expression(translated_expr)
+            translated_expr, is_valid, errors = self._translate_checked(expression)
 
             if not is_valid:
                 warning = f"Expresión inválida en columna '{col['name']}': {errors}"
@@ -501,12 +997,7 @@ class ADFGenerator:
         return {
             'name': trans['name'],
             'type': 'derivedColumn',
-            'dependsOn': [
-                {
-                    'activity': previous_step,
-                    'dependencyConditions': ['Succeeded']
-                }
-            ],
+            'dependsOn': _depends_on(previous_step),
             'typeProperties': {
                 'columns': columns
             }
@@ -523,8 +1014,7 @@ class ADFGenerator:
         condition = trans.get('condition', 'true')
 
         # Traducir y validar condición
-        translated_condition = translate_expression(condition)
-        is_valid, errors = validate_adf_expression(translated_condition)
+        translated_condition, is_valid, errors = self._translate_checked(condition)
 
         if not is_valid:
             warning = f"Condición inválida en filtro '{trans['name']}': {errors}"
@@ -534,12 +1024,7 @@ class ADFGenerator:
         return {
             'name': trans['name'],
             'type': 'filter',
-            'dependsOn': [
-                {
-                    'activity': previous_step,
-                    'dependencyConditions': ['Succeeded']
-                }
-            ],
+            'dependsOn': _depends_on(previous_step),
             'typeProperties': {
                 'condition': {
                     'value': translated_condition,
@@ -557,12 +1042,11 @@ class ADFGenerator:
         Construye transformación Aggregate con estructura completa de ADF.
         """
         aggregates = []
-        for agg in trans.get('aggregates', []):
+        for agg in trans.get('aggregates', ()):
             expression = agg.get('expression', '')
 
             # Traducir y validar expresión
-            translated_expr = translate_expression(expression)
-            is_valid, errors = validate_adf_expression(translated_expr)
+            translated_expr, is_valid, errors = self._translate_checked(expression)
 
             if not is_valid:
                 warning = f"Expresión de agregación inválida '{agg['name']}': {errors}"
@@ -580,90 +1064,13 @@ class ADFGenerator:
         return {
             'name': trans['name'],
             'type': 'aggregate',
-            'dependsOn': [
-                {
-                    'activity': previous_step,
-                    'dependencyConditions': ['Succeeded']
-                }
-            ],
+            'dependsOn': _depends_on(previous_step),
             'typeProperties': {
                 'groupBy': trans.get('groupBy', []),
                 'aggregates': aggregates
             }
         }
 
-    def _build_join(
-        self,
-        trans: Dict[str, Any],
-        all_steps: set
-    ) -> Dict[str, Any]:
-        """
-        Construye transformación Join con estructura completa de ADF.
-        Requiere dos inputs (left y right).
-        """
-        # Determinar left y right inputs
-        # Por defecto, usar los dos últimos steps disponibles
-        available_steps = list(all_steps)
-
-        if len(available_steps) < 2:
-            raise ValueError(f"Join '{trans['name']}' requiere al menos 2 inputs previos")
-
-        left_input = available_steps[-2]
-        right_input = available_steps[-1]
-
-        # Convertir join conditions
-        join_conditions = []
-        for cond in trans.get('joinConditions', []):
-            join_conditions.append({
-                'leftColumn': cond.get('leftColumn', ''),
-                'operator': '==',
-                'rightColumn': cond.get('rightColumn', '')
-            })
-
-        return {
-            'name': trans['name'],
-            'type': 'join',
-            'dependsOn': [
-                {
-                    'activity': left_input,
-                    'dependencyConditions': ['Succeeded']
-                },
-                {
-                    'activity': right_input,
-                    'dependencyConditions': ['Succeeded']
-                }
-            ],
-            'typeProperties': {
-                'joinType': trans.get('joinType', 'inner'),
-                'leftInput': left_input,
-                'rightInput': right_input,
-                'joinConditions': join_conditions
-            }
-        }
-
-    def _build_sort(
-        self,
-        trans: Dict[str, Any],
-        previous_step: str
-    ) -> Dict[str, Any]:
-        """
-        Construye transformación Sort con estructura completa de ADF.
-        """
-        return {
-            'name': trans['name'],
-            'type': 'sort',
-            'dependsOn': [
-                {
-                    'activity': previous_step,
-                    'dependencyConditions': ['Succeeded']
-                }
-            ],
-            'typeProperties': {
-                'sortColumns': trans.get('orderBy', []),
-                'distinct': trans.get('distinct', False)
-            }
-        }
-
     def _build_conditional_split(
         self,
         trans: Dict[str, Any],
@@ -673,12 +1080,11 @@ class ADFGenerator:
         Construye transformación ConditionalSplit con estructura completa de ADF.
         """
         conditions = []
-        for cond in trans.get('conditions', []):
+        for cond in trans.get('conditions', ()):
             expression = cond.get('expression', '')
 
             # Traducir y validar expresión
-            translated_expr = translate_expression(expression)
-            is_valid, errors = validate_adf_expression(translated_expr)
+            translated_expr, is_valid, errors = self._translate_checked(expression)
 
             if not is_valid:
                 warning = f"Condición inválida en '{cond['name']}': {errors}"
@@ -696,127 +1102,19 @@ class ADFGenerator:
         return {
             'name': trans['name'],
             'type': 'conditionalSplit',
-            'dependsOn': [
-                {
-                    'activity': previous_step,
-                    'dependencyConditions': ['Succeeded']
-                }
-            ],
+            'dependsOn': _depends_on(previous_step),
             'typeProperties': {
                 'conditions': conditions,
                 'defaultOutput': trans.get('defaultStream', 'default')
             }
         }
 
-    def _build_lookup(
-        self,
-        trans: Dict[str, Any],
-        previous_step: str
-    ) -> Dict[str, Any]:
-        """
-        Construye transformación Lookup con estructura completa de ADF.
-        """
-        lookup_conditions = []
-        for cond in trans.get('lookupConditions', []):
-            lookup_conditions.append({
-                'leftColumn': cond.get('leftColumn', ''),
-                'operator': '==',
-                'rightColumn': cond.get('rightColumn', '')
-            })
-
-        type_props = {
-            'lookupDataset': {
-                'referenceName': trans.get('lookupDataset', 'ds_lookup'),
-                'type': 'DatasetReference'
-            },
-            'lookupConditions': lookup_conditions,
-            'multiple': False
-        }
-
-        return {
-            'name': trans['name'],
-            'type': 'lookup',
-            'dependsOn': [
-                {
-                    'activity': previous_step,
-                    'dependencyConditions': ['Succeeded']
-                }
-            ],
-            'typeProperties': type_props
-        }
-
-    def _build_alter_row(
-        self,
-        trans: Dict[str, Any],
-        previous_step: str
-    ) -> Dict[str, Any]:
-        """
-        Construye transformación AlterRow con estructura completa de ADF.
-        """
-        action = trans.get('action', 'insert')
-
-        type_props = {}
-
-        # Agregar condiciones según la acción
-        if action == 'insert':
-            type_props['insertCondition'] = {
-                'value': trans.get('condition', 'true'),
-                'type': 'Expression'
-            }
-        elif action == 'update':
-            type_props['updateCondition'] = {
-                'value': trans.get('condition', 'true'),
-                'type': 'Expression'
-            }
-        elif action == 'delete':
-            type_props['deleteCondition'] = {
-                'value': trans.get('condition', 'true'),
-                'type': 'Expression'
-            }
-        elif action == 'upsert':
-            type_props['upsertCondition'] = {
-                'value': trans.get('condition', 'true'),
-                'type': 'Expression'
-            }
-
-        return {
-            'name': trans['name'],
-            'type': 'alterRow',
-            'dependsOn': [
-                {
-                    'activity': previous_step,
-                    'dependencyConditions': ['Succeeded']
-                }
-            ],
-            'typeProperties': type_props
-        }
-
-    def _build_generic_transformation(
-        self,
-        trans: Dict[str, Any],
-        previous_step: str
-    ) -> Dict[str, Any]:
-        """
-        Construye transformación genérica con estructura básica de ADF.
-        """
-        return {
-            'name': trans['name'],
-            'type': trans['type'].lower(),
-            'dependsOn': [
-                {
-                    'activity': previous_step,
-                    'dependencyConditions': ['Succeeded']
-                }
-            ],
-            'typeProperties': {}
-        }
-
     def _validate_dataflow_structure(self, dataflow: Dict[str, Any]) -> None:
         """
         Valida que el dataflow tenga la estructura correcta de ADF.
 
         Raises:
-            ValueError: Si la estructura no es válida
+            ValueError: Si la estructura no es válida o las dependencias forman un ciclo
         """
         # Validar campos requeridos nivel superior
         required_keys = ['name', 'properties', 'type']
@@ -852,32 +1150,59 @@ class ADFGenerator:
             if key not in type_props:
                 raise ValueError(f"Falta campo requerido en typeProperties: {key}")
 
-        # Validar dependencias
-        all_steps = {s['name'] for s in type_props['sources']}
-
-        for trans in type_props['transformations']:
-            if 'dependsOn' not in trans:
-                raise ValueError(f"Transformación '{trans['name']}' no tiene dependsOn")
-
-            for dep in trans['dependsOn']:
-                if dep['activity'] not in all_steps:
-                    raise ValueError(
-                        f"Dependencia inválida en '{trans['name']}': "
-                        f"'{dep['activity']}' no existe"
-                    )
-
-            all_steps.add(trans['name'])
-
-        for sink in type_props['sinks']:
-            if 'dependsOn' not in sink:
-                raise ValueError(f"Sink '{sink['name']}' no tiene dependsOn")
-
-            for dep in sink['dependsOn']:
-                if dep['activity'] not in all_steps:
-                    raise ValueError(
-                        f"Dependencia inválida en sink '{sink['name']}': "
-                        f"'{dep['activity']}' no existe"
-                    )
+        # Validar dependencias: grafo paso -> dependientes, en una sola pasada.
+        # Cada paso es un nodo propio (por posición): un sink puede llamarse
+        # igual que un source o una transformación sin que se confundan.
+        sources = type_props['sources']
+        transformations = type_props['transformations']
+        sinks = type_props['sinks']
+        names = [s['name'] for s in sources]
+        names.extend(trans['name'] for trans in transformations)
+        # Solo sources y transformaciones producen datos a los que depender
+        producers: Dict[str, List[int]] = {}
+        for node, name in enumerate(names):
+            producers.setdefault(name, []).append(node)
+        names.extend(sink['name'] for sink in sinks)
+        indegree = [0] * len(names)
+        dependents: Dict[int, List[int]] = {}
+
+        node = len(sources)
+        for steps, kind, label in ((transformations, 'Transformación', ''), (sinks, 'Sink', 'sink ')):
+            for step in steps:
+                name = step['name']
+                if 'dependsOn' not in step:
+                    raise ValueError(f"{kind} '{name}' no tiene dependsOn")
+
+                for dep in step['dependsOn']:
+                    activity = dep['activity']
+                    # Con nombres repetidos se usan los pasos declarados antes; si no
+                    # hay, los posteriores. Un paso nunca depende de sí mismo.
+                    candidates = producers.get(activity, ())
+                    upstream = ([other for other in candidates if other < node]
+                                or [other for other in candidates if other > node])
+                    if not upstream:
+                        raise ValueError(
+                            f"Dependencia inválida en {label}'{name}': "
+                            f"'{activity}' no existe"
+                        )
+                    for other in upstream:
+                        dependents.setdefault(other, []).append(node)
+                    indegree[node] += len(upstream)
+                node += 1
+
+        # Orden topológico (Kahn): los pasos que quedan sin procesar forman un ciclo
+        ready = deque(node for node, degree in enumerate(indegree) if not degree)
+        processed = 0
+        while ready:
+            processed += 1
+            for dependent in dependents.get(ready.popleft(), ()):
+                indegree[dependent] -= 1
+                if not indegree[dependent]:
+                    ready.append(dependent)
+
+        if processed != len(names):
+            cyclic = dict.fromkeys(names[node] for node, degree in enumerate(indegree) if degree)
+            raise ValueError(f"Dependencias circulares en el dataflow: {', '.join(cyclic)}")
 
         logger.info("Validación de estructura de dataflow exitosa")
 
@@ -912,3 +1237,42 @@ class ADFGenerator:
     def get_generated_files(self) -> List[str]:
         """Retorna lista de archivos generados"""
         return self.generated_files
+
+
+# Generador por (directorio de salida, validate_structure) en cada proceso del pool (conserva su
+# caché de dataflows entre los mappings que le tocan)
+_worker_generators: Dict[Tuple[str, bool], ADFGenerator] = {}
+
+
+def _generate_all_worker(
+    task: Tuple[str, bool, Optional[datetime], str, Dict[str, Any], Optional[Any]]
+) -> Tuple[Dict[str, str], List[str], List[str]]:
+    """
+    Ejecuta generate_all en un proceso del pool de generate_many.
+
+    Args:
+        task: Tupla (output_dir, validate_structure, instante del lote, nombre,
+            estructura traducida, metadata)
+
+    Returns:
+        Tupla (archivos generados, warnings emitidos, errores emitidos)
+    """
+    output_dir, validate_structure, batch_moment, name, translated_structure, original_metadata = task
+
+    key = (output_dir, validate_structure)
+    generator = _worker_generators.get(key)
+    if generator is None:
+        generator = _worker_generators[key] = ADFGenerator(output_dir, validate_structure=validate_structure)
+    if batch_moment is not None:
+        generator.set_batch_timestamp(batch_moment)
+    else:
+        generator.clear_batch_timestamp()
+
+    warnings_start = len(generator.validation_warnings)
+    errors_start = len(generator.validation_errors)
+    files = generator.generate_all(name, translated_structure, original_metadata)
+    return (
+        files,
+        generator.validation_warnings[warnings_start:],
+        generator.validation_errors[errors_start:]
+    )
@@ -97,8 +97,12 @@ class PowerCenterXMLParser:
         'Update Strategy': 'update_strategy'
     }
 
+    # Elementos que parse_file convierte en componentes del mapping
+    COMPONENT_TAGS = ('SOURCE', 'TARGET', 'TRANSFORMATION', 'CONNECTOR')
+
     def __init__(self):
         """Inicializa el parser"""
+        # parse_file procesa el XML en streaming y no conserva el árbol
         self.tree: Optional[etree._ElementTree] = None
         self.root: Optional[etree._Element] = None
 
@@ -106,6 +110,10 @@ class PowerCenterXMLParser:
         """
         Parsea un archivo XML de PowerCenter.
 
+        El archivo se recorre una sola vez con iterparse: cada componente se
+        convierte al cerrarse y se libera junto con sus hermanos anteriores,
+        de modo que la memoria no crece con el tamaño del documento.
+
         Args:
             xml_file: Path al archivo XML
 
@@ -117,115 +125,128 @@ class PowerCenterXMLParser:
         """
         logger.info(f"Iniciando parseo de archivo: {xml_file}")
 
+        mapping_name = None
+        sources: List[Source] = []
+        targets: List[Target] = []
+        transformations: List[Transformation] = []
+        connectors: List[Connector] = []
+        extractors = {
+            'SOURCE': (self._extract_source, sources),
+            'TARGET': (self._extract_target, targets),
+            'TRANSFORMATION': (self._extract_transformation, transformations),
+            'CONNECTOR': (self._extract_connector, connectors)
+        }
+
+        # Componentes abiertos: un elemento solo se libera si no está dentro de otro
+        open_components = 0
         try:
-            self.tree = etree.parse(str(xml_file))
-            self.root = self.tree.getroot()
+            for event, elem in etree.iterparse(
+                str(xml_file), events=('start', 'end'), tag=('MAPPING',) + self.COMPONENT_TAGS
+            ):
+                if elem.tag == 'MAPPING':
+                    # El nombre está disponible al abrir; se usa el primer mapping del archivo
+                    if event == 'start' and mapping_name is None:
+                        mapping_name = elem.get('NAME', 'UnknownMapping')
+                    elif event == 'end' and not open_components:
+                        self._release_element(elem)
+                    continue
+
+                if event == 'start':
+                    open_components += 1
+                    continue
+
+                extract, components = extractors[elem.tag]
+                components.append(extract(elem))
+                open_components -= 1
+                if not open_components:
+                    self._release_element(elem)
         except etree.XMLSyntaxError as e:
             raise ValidationError(f"Error de sintaxis XML: {e}")
 
-        # Extraer información del mapping
-        mapping_name = self._extract_mapping_name()
+        if mapping_name is None:
+            mapping_name = 'UnknownMapping'
         logger.info(f"Mapping encontrado: {mapping_name}")
 
-        metadata = MappingMetadata(name=mapping_name)
-
-        # Extraer componentes
-        metadata.sources = self._extract_sources()
+        metadata = MappingMetadata(
+            name=mapping_name,
+            sources=sources,
+            targets=targets,
+            transformations=transformations,
+            connectors=connectors
+        )
         logger.info(f"Fuentes extraídas: {len(metadata.sources)}")
-
-        metadata.targets = self._extract_targets()
         logger.info(f"Destinos extraídos: {len(metadata.targets)}")
-
-        metadata.transformations = self._extract_transformations()
         logger.info(f"Transformaciones extraídas: {len(metadata.transformations)}")
-
-        metadata.connectors = self._extract_connectors()
         logger.info(f"Conectores extraídos: {len(metadata.connectors)}")
 
         logger.info("Parseo completado exitosamente")
         return metadata
 
-    def _extract_mapping_name(self) -> str:
-        """Extrae el nombre del mapping"""
-        mapping_elem = self.root.find('.//MAPPING')
-        if mapping_elem is not None:
-            return mapping_elem.get('NAME', 'UnknownMapping')
-        return 'UnknownMapping'
-
-    def _extract_sources(self) -> List[Source]:
-        """Extrae todas las fuentes del mapping"""
-        sources = []
-        source_elems = self.root.findall('.//SOURCE')
-
-        for source_elem in source_elems:
-            source = Source(
-                name=source_elem.get('NAME', ''),
-                database_type=source_elem.get('DATABASETYPE', 'Unknown'),
-                table_name=source_elem.get('TABLENAME')
-            )
-
-            # Extraer campos
-            source.fields = self._extract_fields(source_elem)
-
-            sources.append(source)
-
-        return sources
+    @staticmethod
+    def _release_element(elem: etree._Element) -> None:
+        """Libera un elemento ya procesado y los hermanos que lo preceden"""
+        elem.clear(keep_tail=True)
+        parent = elem.getparent()
+        if parent is not None:
+            while elem.getprevious() is not None:
+                del parent[0]
+
+    def _extract_source(self, source_elem: etree._Element) -> Source:
+        """Extrae una fuente del mapping"""
+        source = Source(
+            name=source_elem.get('NAME', ''),
+            database_type=source_elem.get('DATABASETYPE', 'Unknown'),
+            table_name=source_elem.get('TABLENAME')
+        )
 
-    def _extract_targets(self) -> List[Target]:
-        """Extrae todos los targets del mapping"""
-        targets = []
-        target_elems = self.root.findall('.//TARGET')
+        # Extraer campos
+        source.fields = self._extract_fields(source_elem)
 
-        for target_elem in target_elems:
-            target = Target(
-                name=target_elem.get('NAME', ''),
-                database_type=target_elem.get('DATABASETYPE', 'Unknown'),
-                table_name=target_elem.get('TABLENAME')
-            )
+        return source
 
-            # Extraer campos
-            target.fields = self._extract_fields(target_elem)
+    def _extract_target(self, target_elem: etree._Element) -> Target:
+        """Extrae un target del mapping"""
+        target = Target(
+            name=target_elem.get('NAME', ''),
+            database_type=target_elem.get('DATABASETYPE', 'Unknown'),
+            table_name=target_elem.get('TABLENAME')
+        )
 
-            targets.append(target)
+        # Extraer campos
+        target.fields = self._extract_fields(target_elem)
 
-        return targets
+        return target
 
-    def _extract_transformations(self) -> List[Transformation]:
-        """Extrae todas las transformaciones del mapping"""
-        transformations = []
-        trans_elems = self.root.findall('.//TRANSFORMATION')
+    def _extract_transformation(self, trans_elem: etree._Element) -> Transformation:
+        """Extrae una transformación del mapping"""
+        trans_type = trans_elem.get('TYPE', '')
+        trans_name = trans_elem.get('NAME', '')
 
-        for trans_elem in trans_elems:
-            trans_type = trans_elem.get('TYPE', '')
-            trans_name = trans_elem.get('NAME', '')
+        transformation = Transformation(
+            name=trans_name,
+            type=trans_type,
+            description=trans_elem.get('DESCRIPTION')
+        )
 
-            transformation = Transformation(
-                name=trans_name,
-                type=trans_type,
-                description=trans_elem.get('DESCRIPTION')
-            )
+        # Extraer campos
+        transformation.fields = self._extract_fields(trans_elem)
 
-            # Extraer campos
-            transformation.fields = self._extract_fields(trans_elem)
+        # Extraer propiedades específicas por tipo
+        transformation.properties = self._extract_transformation_properties(
+            trans_elem, trans_type
+        )
 
-            # Extraer propiedades específicas por tipo
-            transformation.properties = self._extract_transformation_properties(
-                trans_elem, trans_type
+        # Log si la transformación no es soportada (solo para transformaciones realmente no soportadas)
+        unsupported_transformations = {
+            'Sequence Generator', 'Normalizer', 'Rank', 'Union',
+            'XML Source Qualifier', 'XML Target', 'Custom Transformation'
+        }
+        if trans_type in unsupported_transformations:
+            logger.warning(
+                f"Transformación '{trans_type}' en '{trans_name}' no está soportada en v2.0"
             )
 
-            transformations.append(transformation)
-
-            # Log si la transformación no es soportada (solo para transformaciones realmente no soportadas)
-            unsupported_transformations = {
-                'Sequence Generator', 'Normalizer', 'Rank', 'Union',
-                'XML Source Qualifier', 'XML Target', 'Custom Transformation'
-            }
-            if trans_type in unsupported_transformations:
-                logger.warning(
-                    f"Transformación '{trans_type}' en '{trans_name}' no está soportada en v2.0"
-                )
-
-        return transformations
+        return transformation
 
     def _extract_fields(self, parent_elem: etree._Element) -> List[TransformField]:
         """Extrae campos de un elemento (source, target, transformation)"""
@@ -601,25 +622,19 @@ class PowerCenterXMLParser:
 
         return properties
 
-    def _extract_connectors(self) -> List[Connector]:
-        """Extrae todas las conexiones entre transformaciones"""
-        connectors = []
-        connector_elems = self.root.findall('.//CONNECTOR')
-
-        for conn_elem in connector_elems:
-            connector = Connector(
-                from_instance=conn_elem.get('FROMINSTANCE', ''),
-                to_instance=conn_elem.get('TOINSTANCE', '')
-            )
-
-            # Extraer campos conectados
-            for field_map in conn_elem.findall('.//FIELDMAP'):
-                connector.from_fields.append(field_map.get('FROMFIELD', ''))
-                connector.to_fields.append(field_map.get('TOFIELD', ''))
+    def _extract_connector(self, conn_elem: etree._Element) -> Connector:
+        """Extrae una conexión entre transformaciones"""
+        connector = Connector(
+            from_instance=conn_elem.get('FROMINSTANCE', ''),
+            to_instance=conn_elem.get('TOINSTANCE', '')
+        )
 
-            connectors.append(connector)
+        # Extraer campos conectados
+        for field_map in conn_elem.findall('.//FIELDMAP'):
+            connector.from_fields.append(field_map.get('FROMFIELD', ''))
+            connector.to_fields.append(field_map.get('TOFIELD', ''))
 
-        return connectors
+        return connector
 
 
 def parse_powercenter_xml(xml_file: str) -> MappingMetadata:
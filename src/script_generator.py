@@ -6,6 +6,7 @@ Genera JSONs 100% compatibles con ADF usando su DSL nativo
 
 import json
 import logging
+import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from datetime import datetime
@@ -15,6 +16,17 @@ from .expression_translator import translate_expression, validate_adf_expression
 
 logger = logging.getLogger('pc-to-adf.script_generator')
 
+# CRÍTICO: Lista exhaustiva de funciones de agregación que ADF espera en lowercase.
+# Patrón (case insensitive, con word boundary) -> nombre en minúsculas
+_AGG_FUNCTION_PATTERNS = [
+    (re.compile(r'\b' + re.escape(func) + r'\b', re.IGNORECASE), func.lower())
+    for func in (
+        'SUM', 'AVG', 'COUNT', 'MIN', 'MAX', 'FIRST', 'LAST',
+        'STDDEV', 'VARIANCE', 'MEDIAN', 'PERCENTILE',
+        'COUNT_DISTINCT', 'COLLECT_LIST', 'COLLECT_SET'
+    )
+]
+
 
 class ADFScriptGenerator:
     """
@@ -1075,30 +1087,15 @@ class ADFScriptGenerator:
         Returns:
             Expresión con funciones normalizadas pero columnas preservadas
         """
-        import re
-
-        # CRÍTICO: Lista exhaustiva de funciones que ADF espera en lowercase
-        agg_functions = [
-            'SUM', 'AVG', 'COUNT', 'MIN', 'MAX', 'FIRST', 'LAST',
-            'STDDEV', 'VARIANCE', 'MEDIAN', 'PERCENTILE',
-            'COUNT_DISTINCT', 'COLLECT_LIST', 'COLLECT_SET'
-        ]
-
         normalized = expression
 
         # Log para debugging
         logger.debug(f"Normalizando expresión: {expression}")
 
-        for func in agg_functions:
+        for pattern, func_lower in _AGG_FUNCTION_PATTERNS:
             # Buscar la función (case insensitive) y reemplazar con minúsculas
             # IMPORTANTE: Usar word boundary para evitar reemplazos parciales
-            pattern = r'\b' + re.escape(func) + r'\b'
-
-            # Reemplazar preservando lo que está dentro de los paréntesis
-            def replace_func(match):
-                return func.lower()
-
-            normalized = re.sub(pattern, replace_func, normalized, flags=re.IGNORECASE)
+            normalized = pattern.sub(func_lower, normalized)
 
         logger.debug(f"Resultado normalizado: {normalized}")
         return normalized
@@ -3,13 +3,23 @@ Utilidades comunes para la herramienta de migración
 Funciones helper para logging, file I/O, formateo y validaciones
 """
 
+import hashlib
 import logging
+import mmap
+import os
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
+from types import GeneratorType
+from typing import Dict, Any, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 import json
 
+try:
+    import orjson
+except ImportError:  # Dependencia opcional (extra "fast")
+    orjson = None
+
 
 def setup_logging(verbose: bool = False, log_file: Optional[str] = None) -> logging.Logger:
     """
@@ -91,6 +101,25 @@ def create_output_directory(output_dir: str) -> Path:
     return path
 
 
+def serialize_json(data: Dict[str, Any], pretty: bool = True) -> bytes:
+    """
+    Serializa un diccionario a JSON (UTF-8).
+
+    Args:
+        data: Diccionario a serializar
+        pretty: Si True, formatea el JSON con indentación
+
+    Returns:
+        Bytes del JSON codificado en UTF-8
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(data, option=option)
+    if pretty:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
 def save_json(data: Dict[str, Any], file_path: str, pretty: bool = True) -> None:
     """
     Guarda un diccionario como archivo JSON.
@@ -100,11 +129,90 @@ def save_json(data: Dict[str, Any], file_path: str, pretty: bool = True) -> None
         file_path: Ruta del archivo de salida
         pretty: Si True, formatea el JSON con indentación
     """
-    with open(file_path, 'w', encoding='utf-8') as f:
-        if pretty:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        else:
-            json.dump(data, f, ensure_ascii=False)
+    # Se codifica completo antes de abrir el archivo: una sola escritura
+    Path(file_path).write_bytes(serialize_json(data, pretty))
+
+
+# Tamaño del búfer de escritura de stream_json (bytes)
+STREAM_BUFFER_SIZE = 1 << 20
+
+# Tamaño a partir del cual load_json mapea el archivo en memoria en lugar de leerlo
+MMAP_MIN_SIZE = 1 << 20
+
+
+def _encode_indented(value: Any, level: int) -> bytes:
+    """Codifica un valor con indent=2 como si estuviera anidado en el nivel indicado"""
+    encoded = serialize_json(value)
+    if level and b'\n' in encoded:
+        encoded = encoded.replace(b'\n', b'\n' + b'  ' * level)
+    return encoded
+
+
+def _iter_json_chunks(value: Any, level: int = 0) -> Iterator[bytes]:
+    """
+    Genera el JSON con indent=2 de un valor por fragmentos.
+
+    Los diccionarios (con claves str) y listas se recorren; cada elemento de
+    una lista se codifica completo, de uno en uno. Los generadores se escriben
+    como listas, consumiéndolos elemento a elemento.
+    """
+    if isinstance(value, dict) and value and all(isinstance(key, str) for key in value):
+        inner = b'\n' + b'  ' * (level + 1)
+        separator = b''
+        yield b'{'
+        for key, item in value.items():
+            yield separator + inner + json.dumps(key, ensure_ascii=False).encode('utf-8') + b': '
+            yield from _iter_json_chunks(item, level + 1)
+            separator = b','
+        yield b'\n' + b'  ' * level + b'}'
+    elif isinstance(value, (list, GeneratorType)):
+        inner = b'\n' + b'  ' * (level + 1)
+        opening = b'['
+        for item in value:
+            yield opening + inner + _encode_indented(item, level + 1)
+            opening = b','
+        yield b'[]' if opening == b'[' else b'\n' + b'  ' * level + b']'
+    else:
+        yield _encode_indented(value, level)
+
+
+def stream_json(data: Dict[str, Any], file_path: str) -> None:
+    """
+    Guarda un diccionario como JSON indentado escribiéndolo por fragmentos.
+
+    Produce el mismo contenido que save_json(pretty=True) sin tener en memoria
+    el JSON codificado completo (útil para dataflows muy grandes). Admite
+    generadores en lugar de listas.
+
+    Args:
+        data: Diccionario a guardar
+        file_path: Ruta del archivo de salida
+    """
+    # Búfer grande: los fragmentos son pequeños y así se agrupan en pocas escrituras
+    with open(file_path, 'wb', buffering=STREAM_BUFFER_SIZE) as f:
+        f.writelines(_iter_json_chunks(data))
+
+
+def write_files(files: Iterable[Tuple[str, bytes]]) -> None:
+    """
+    Escribe varios archivos ya serializados en paralelo (un hilo por archivo).
+
+    Args:
+        files: Pares (ruta, contenido) a escribir
+
+    Raises:
+        OSError: El primer error de escritura, tras intentar escribir todos
+    """
+    files = list(files)
+    if len(files) <= 1:
+        for file_path, content in files:
+            Path(file_path).write_bytes(content)
+        return
+
+    with ThreadPoolExecutor(max_workers=len(files)) as executor:
+        futures = [executor.submit(Path(file_path).write_bytes, content) for file_path, content in files]
+    for future in futures:
+        future.result()
 
 
 def load_json(file_path: str) -> Dict[str, Any]:
@@ -116,7 +224,19 @@ def load_json(file_path: str) -> Dict[str, Any]:
 
     Returns:
         Diccionario con los datos cargados
+
+    Raises:
+        json.JSONDecodeError: Si el contenido no es JSON válido
     """
+    if orjson is not None:
+        # orjson.JSONDecodeError es subclase de json.JSONDecodeError
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+                return orjson.loads(f.read())
+            # Archivos grandes: orjson parsea directamente sobre el mapeo, sin copiarlo a un bytes
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
     with open(file_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
@@ -141,14 +261,37 @@ def sanitize_name(name: str) -> str:
     return sanitized
 
 
-def format_timestamp() -> str:
+def format_timestamp(moment: Optional[datetime] = None) -> str:
     """
     Retorna timestamp formateado para nombres de archivo.
 
+    Args:
+        moment: Instante a formatear (por defecto, el actual)
+
     Returns:
         String con formato YYYYMMDD_HHMMSS
     """
-    return datetime.now().strftime('%Y%m%d_%H%M%S')
+    return (moment or datetime.now()).strftime('%Y%m%d_%H%M%S')
+
+
+def hash_json(data: Any) -> Optional[str]:
+    """
+    Calcula un hash del contenido JSON de un valor (independiente del orden de claves).
+
+    Args:
+        data: Valor serializable a JSON
+
+    Returns:
+        Hash hexadecimal (blake2b), o None si el valor no es serializable
+    """
+    try:
+        if orjson is not None:
+            encoded = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            encoded = json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
 
 
 def calculate_migration_stats(
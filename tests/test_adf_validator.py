@@ -0,0 +1,190 @@
+"""
+Tests unitarios para el módulo adf_validator
+"""
+
+import copy
+import hashlib
+import json
+from collections import OrderedDict
+
+import pytest
+
+from src import adf_validator
+from src.adf_validator import (
+    ADFSchemaValidator, validate_dataflow, validate_dataflow_bytes, validate_dataflows_bulk
+)
+
+
+def _dep(activity, conditions=('Succeeded',)):
+    return [{'activity': activity, 'dependencyConditions': list(conditions)}]
+
+
+def _dataset(name):
+    return {'referenceName': name, 'type': 'DatasetReference'}
+
+
+@pytest.fixture(params=adf_validator.SCHEMA_BACKENDS)
+def schema_mode(request, monkeypatch):
+    """Ejecuta cada test con cada backend del esquema compilado"""
+    adf_validator._results_by_digest.clear()
+    check = adf_validator._compile_schema_check(request.param)
+    if check is None and request.param != 'python':
+        pytest.skip(f"{request.param} no está instalado")
+    monkeypatch.setattr(adf_validator, '_COMPILED_SCHEMA', check)
+    return request.param
+
+
+@pytest.fixture
+def sample_dataflow():
+    """Crea un dataflow válido con varios tipos de transformación"""
+    return {
+        'name': 'dataflow_Test',
+        'type': 'Microsoft.DataFactory/factories/dataflows',
+        'properties': {
+            'type': 'MappingDataFlow',
+            'typeProperties': {
+                'sources': [{'name': 'SRC_A', 'dataset': _dataset('ds_A')}],
+                'transformations': [
+                    {
+                        'name': 'EXP_A',
+                        'type': 'derivedColumn',
+                        'dependsOn': _dep('SRC_A'),
+                        'typeProperties': {
+                            'columns': [{'name': 'C', 'value': {'value': 'upper(X)', 'type': 'Expression'}}]
+                        }
+                    },
+                    {
+                        'name': 'AGG_A',
+                        'type': 'aggregate',
+                        'dependsOn': _dep('EXP_A'),
+                        'typeProperties': {'groupBy': ['C'], 'aggregates': []}
+                    }
+                ],
+                'sinks': [{'name': 'TGT_A', 'dataset': _dataset('ds_T'), 'dependsOn': _dep('AGG_A')}],
+                'scriptLines': []
+            }
+        }
+    }
+
+
+class TestADFSchemaValidator:
+    """Tests para el validador de esquemas de ADF"""
+
+    def test_valid_dataflow(self, schema_mode, sample_dataflow):
+        """Verifica que un dataflow correcto no genere errores ni warnings"""
+        is_valid, errors, warnings = validate_dataflow(sample_dataflow)
+
+        assert is_valid
+        assert errors == []
+        assert warnings == []
+
+    def test_missing_top_level_field(self, schema_mode, sample_dataflow):
+        """Verifica detección de campos requeridos faltantes"""
+        del sample_dataflow['name']
+
+        is_valid, errors, _ = validate_dataflow(sample_dataflow)
+
+        assert not is_valid
+        assert "Falta campo requerido: 'name'" in errors
+
+    def test_unknown_dependency(self, schema_mode, sample_dataflow):
+        """Verifica detección de dependencias a steps inexistentes"""
+        sinks = sample_dataflow['properties']['typeProperties']['sinks']
+        sinks[0]['dependsOn'] = _dep('NO_EXISTE')
+
+        is_valid, errors, _ = validate_dataflow(sample_dataflow)
+
+        assert not is_valid
+        assert errors == ["Sink 'TGT_A': Dependencia a actividad inexistente 'NO_EXISTE'"]
+
+    def test_non_json_types_same_result_for_every_backend(self, schema_mode, sample_dataflow):
+        """Verifica que una lista dada como tupla se rechace con cualquier backend"""
+        type_props = sample_dataflow['properties']['typeProperties']
+        type_props['sources'] = tuple(type_props['sources'])
+
+        is_valid, errors, _ = validate_dataflow(sample_dataflow)
+
+        assert not is_valid
+        assert "Campo typeProperties.sources debe ser una lista" in errors
+
+    def test_warnings_do_not_invalidate(self, schema_mode, sample_dataflow):
+        """Verifica que los warnings no marquen el dataflow como inválido"""
+        transformations = sample_dataflow['properties']['typeProperties']['transformations']
+        del transformations[1]['typeProperties']['groupBy']
+        transformations[1]['dependsOn'] = _dep('EXP_A', ('Custom',))
+
+        is_valid, errors, warnings = validate_dataflow(sample_dataflow)
+
+        assert is_valid
+        assert errors == []
+        assert warnings == [
+            "Transformation 'AGG_A': Condición de dependencia 'Custom' no es estándar",
+            "Aggregate 'AGG_A': No tiene groupBy (posible agregación total)"
+        ]
+
+    def test_results_are_independent_between_calls(self, schema_mode, sample_dataflow):
+        """Verifica que una validación no altere los resultados de otra"""
+        validator = ADFSchemaValidator()
+        invalid = copy.deepcopy(sample_dataflow)
+        invalid['type'] = 'Other'
+
+        _, first_errors, _ = validator.validate_dataflow(invalid)
+        is_valid, errors, _ = validator.validate_dataflow(sample_dataflow)
+
+        assert is_valid
+        assert errors == []
+        assert len(first_errors) == 1
+
+    def test_bulk_validation_keeps_order(self, monkeypatch, sample_dataflow):
+        """Verifica que la validación en procesos devuelva resultados en orden"""
+        monkeypatch.setattr(adf_validator, 'BULK_PROCESS_MIN_FLOWS', 1)
+        invalid = copy.deepcopy(sample_dataflow)
+        del invalid['name']
+
+        results = validate_dataflows_bulk([invalid, sample_dataflow, invalid], max_workers=2)
+
+        assert [is_valid for is_valid, _, _ in results] == [False, True, False]
+        assert results[0] == validate_dataflow(invalid)
+
+    def test_cached_results_are_not_shared(self, schema_mode, sample_dataflow, monkeypatch):
+        """Verifica que un resultado cacheado no se vea afectado por el llamador"""
+        del sample_dataflow['name']
+
+        _, errors, _ = validate_dataflow(sample_dataflow)
+        errors.clear()
+        monkeypatch.setattr(adf_validator, '_validate', None)  # Debe salir del caché
+        is_valid, errors, _ = validate_dataflow(copy.deepcopy(sample_dataflow))
+
+        assert not is_valid
+        assert errors == ["Falta campo requerido: 'name'"]
+        assert len(adf_validator._results_by_digest) == 1
+
+    def test_cache_distinguishes_python_types(self, schema_mode, sample_dataflow):
+        """Verifica que un OrderedDict no comparta resultado cacheado con el dict equivalente"""
+        plain = copy.deepcopy(sample_dataflow)
+        sample_dataflow['properties'] = OrderedDict(sample_dataflow['properties'])
+
+        is_valid, errors, _ = validate_dataflow(sample_dataflow)
+        assert not is_valid
+        assert errors == ["Campo 'properties' debe ser de tipo dict, pero es OrderedDict"]
+
+        assert validate_dataflow(plain) == (True, [], [])
+
+    def test_validate_bytes_matches_dict(self, schema_mode, sample_dataflow):
+        """Verifica que validar el JSON en bytes dé lo mismo que el dict"""
+        sample_dataflow['properties']['typeProperties']['sinks'][0]['dependsOn'] = _dep('NO_EXISTE')
+
+        result = validate_dataflow_bytes(json.dumps(sample_dataflow).encode('utf-8'))
+
+        assert result == validate_dataflow(sample_dataflow)
+        assert validate_dataflow_bytes(b'{"name": ')[0] is False
+
+    def test_validate_bytes_cached_by_digest(self, schema_mode, sample_dataflow, monkeypatch):
+        """Verifica que los mismos bytes se resuelvan desde el caché, sin decodificar"""
+        buf = json.dumps(sample_dataflow).encode('utf-8')
+
+        result = validate_dataflow_bytes(bytearray(buf))
+        monkeypatch.setattr(adf_validator, '_loads_bytes', None)  # Debe salir del caché
+
+        assert validate_dataflow_bytes(memoryview(buf)) == result
+        assert list(adf_validator._results_by_digest) == [hashlib.blake2b(buf, digest_size=16).digest()]
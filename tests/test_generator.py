@@ -172,6 +172,22 @@ class TestADFGenerator:
         # Verificar que se agregaron a la lista de archivos generados
         assert len(generator.generated_files) == 3
 
+        # Los tres archivos comparten el mismo sufijo de timestamp
+        suffixes = {Path(p).stem[-len('YYYYMMDD_HHMMSS'):] for p in files.values()}
+        assert len(suffixes) == 1
+
+    def test_generate_many(self, generator, sample_translated_structure):
+        """Verifica generación de muchos mappings repartidos entre procesos"""
+        items = [(f'Mapping{i}', sample_translated_structure, None) for i in range(8)]
+
+        results = generator.generate_many(items, max_workers=2)
+
+        assert len(results) == 8
+        assert results[3]['dataflow'].endswith('.json')
+        assert 'dataflow_Mapping3_' in results[3]['dataflow']
+        assert len(generator.generated_files) == 24
+        assert all(Path(f).exists() for f in generator.generated_files)
+
     def test_validate_json_valid(self, generator, sample_translated_structure):
         """Verifica validación de JSON válido"""
         # Generar un archivo
@@ -194,6 +210,106 @@ class TestADFGenerator:
         is_valid = generator.validate_json(str(invalid_file))
         assert is_valid is False
 
+    def test_validate_json_schema(self, generator, sample_translated_structure):
+        """Verifica validación contra un esquema (reutilizado entre archivos)"""
+        pipeline_file = generator.generate_pipeline('TestMapping', sample_translated_structure)
+        schema = {
+            'type': 'object',
+            'required': ['name', 'properties'],
+            'properties': {'name': {'type': 'string'}}
+        }
+
+        assert generator.validate_json(pipeline_file, schema) is True
+        assert generator.validate_json(pipeline_file, {'type': 'object', 'required': ['missing']}) is False
+        assert generator.validate_json(pipeline_file, schema) is True
+
+    def test_generate_dataflow_same_structure(self, generator, sample_translated_structure):
+        """Verifica que mappings con la misma estructura solo difieren en el nombre"""
+        first = generator.generate_dataflow('First', sample_translated_structure)
+        second = generator.generate_dataflow('Second', sample_translated_structure)
+
+        with open(first, 'r', encoding='utf-8') as f:
+            first_df = json.load(f)
+        with open(second, 'r', encoding='utf-8') as f:
+            second_df = json.load(f)
+
+        assert first_df['name'] == 'dataflow_First'
+        assert second_df['name'] == 'dataflow_Second'
+        assert first_df['properties'] == second_df['properties']
+
+    def test_validate_json_default_schema(self, output_dir, sample_translated_structure):
+        """Verifica el esquema por defecto del generador"""
+        generator = ADFGenerator(str(output_dir), schema={'type': 'object', 'required': ['missing']})
+        pipeline_file = generator.generate_pipeline('TestMapping', sample_translated_structure)
+
+        assert generator.validate_json(pipeline_file) is False
+        assert generator.validate_json(pipeline_file, {'type': 'object'}) is True
+
+    def test_join_uses_last_two_steps(self, generator):
+        """Verifica que el Join toma como inputs los dos últimos pasos emitidos"""
+        structure = {
+            'sources': [{'name': 'SRC_A'}, {'name': 'SRC_B'}],
+            'transformations': [
+                {'name': 'FIL_A', 'type': 'Filter', 'condition': 'true'},
+                {'name': 'JNR_AB', 'type': 'Join', 'joinConditions': []}
+            ],
+            'sinks': [{'name': 'TGT'}]
+        }
+
+        dataflow_file = generator.generate_dataflow('JoinMapping', structure)
+        with open(dataflow_file, 'r', encoding='utf-8') as f:
+            dataflow = json.load(f)
+
+        join = dataflow['properties']['typeProperties']['transformations'][1]
+        assert join['typeProperties']['leftInput'] == 'SRC_B'
+        assert join['typeProperties']['rightInput'] == 'FIL_A'
+
+    def test_validate_dataflow_structure_cycle(self, generator):
+        """Verifica que se detectan dependencias circulares entre transformaciones"""
+        def step(name, activity):
+            return {'name': name, 'dependsOn': [{'activity': activity, 'dependencyConditions': ['Succeeded']}]}
+
+        dataflow = {
+            'name': 'df_cycle',
+            'type': 'Microsoft.DataFactory/factories/dataflows',
+            'properties': {
+                'type': 'MappingDataFlow',
+                'typeProperties': {
+                    'sources': [{'name': 'SRC'}],
+                    'transformations': [step('EXP_A', 'EXP_B'), step('EXP_B', 'EXP_A')],
+                    'sinks': [step('TGT', 'EXP_B')],
+                    'scriptLines': []
+                }
+            }
+        }
+
+        with pytest.raises(ValueError, match='circulares'):
+            generator._validate_dataflow_structure(dataflow)
+
+        dataflow['properties']['typeProperties']['transformations'][0] = step('EXP_A', 'SRC')
+        generator._validate_dataflow_structure(dataflow)
+
+    def test_validate_dataflow_structure_repeated_names(self, generator):
+        """Verifica que un sink con el mismo nombre que otro paso no se toma como ciclo"""
+        def step(name, activity):
+            return {'name': name, 'dependsOn': [{'activity': activity, 'dependencyConditions': ['Succeeded']}]}
+
+        dataflow = {
+            'name': 'df_repeated',
+            'type': 'Microsoft.DataFactory/factories/dataflows',
+            'properties': {
+                'type': 'MappingDataFlow',
+                'typeProperties': {
+                    'sources': [{'name': 'CUSTOMERS'}],
+                    'transformations': [step('T', 'CUSTOMERS')],
+                    'sinks': [step('T', 'T'), step('CUSTOMERS', 'T')],
+                    'scriptLines': []
+                }
+            }
+        }
+
+        generator._validate_dataflow_structure(dataflow)
+
     def test_get_generated_files(self, generator, sample_translated_structure):
         """Verifica obtención de lista de archivos generados"""
         # Generar algunos archivos
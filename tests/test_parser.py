@@ -164,6 +164,35 @@ class TestPowerCenterXMLParser:
         assert trans.type == "Expression"
         assert len(trans.fields) == 2
 
+    def test_extract_connectors(self, tmp_path):
+        """Verifica extracción de conectores y nombre del primer mapping"""
+        xml_content = """<?xml version="1.0" encoding="UTF-8"?>
+        <POWERMART>
+            <REPOSITORY>
+                <FOLDER>
+                    <MAPPING NAME="m_First">
+                        <INSTANCE NAME="SQ_Customer"/>
+                        <CONNECTOR FROMINSTANCE="SQ_Customer" TOINSTANCE="EXP_Transform">
+                            <FIELDMAP FROMFIELD="CUSTOMER_ID" TOFIELD="ID"/>
+                        </CONNECTOR>
+                        <CONNECTOR FROMINSTANCE="EXP_Transform" TOINSTANCE="TGT_Customer"/>
+                    </MAPPING>
+                    <MAPPING NAME="m_Second"/>
+                </FOLDER>
+            </REPOSITORY>
+        </POWERMART>
+        """
+
+        xml_file = tmp_path / "connectors.xml"
+        xml_file.write_text(xml_content)
+
+        metadata = PowerCenterXMLParser().parse_file(xml_file)
+
+        assert metadata.name == "m_First"
+        assert [c.to_instance for c in metadata.connectors] == ["EXP_Transform", "TGT_Customer"]
+        assert metadata.connectors[0].from_fields == ["CUSTOMER_ID"]
+        assert metadata.connectors[0].to_fields == ["ID"]
+
 
 class TestParsePowerCenterXML:
     """Tests para la función de conveniencia"""
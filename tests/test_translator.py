@@ -4,6 +4,7 @@ Tests unitarios para el módulo translator
 
 import pytest
 from src.translator import PowerCenterToADFTranslator
+from src.expression_translator import ExpressionTranslator, translate_expressions
 from src.parser import (
     MappingMetadata,
     Transformation,
@@ -240,6 +241,86 @@ class TestPowerCenterToADFTranslator:
         assert stats['errors'] == 1
 
 
+class TestExpressionTranslator:
+    """Tests para el traductor de expresiones"""
+
+    @pytest.fixture
+    def expression_translator(self):
+        """Crea instancia del traductor de expresiones para tests"""
+        return ExpressionTranslator()
+
+    @pytest.mark.parametrize('unit, adf_func', [
+        ('DD', 'addDays'),
+        ('MM', 'addMonths'),
+        ('YYYY', 'addYears'),
+        ('HH', 'addHours')
+    ])
+    def test_translate_add_todate_alias(self, expression_translator, unit, adf_func):
+        """Verifica que el alias ADD_toDate se traduce igual que ADD_TO_DATE"""
+        result = expression_translator.translate(f"ADD_toDate(HIRE_DATE, '{unit}', 5)")
+
+        assert result == f"{adf_func}(HIRE_DATE, 5)"
+
+    @pytest.mark.parametrize('alias', ['add_todate', 'ADD_TODATE'])
+    def test_translate_add_todate_alias_any_case(self, expression_translator, alias):
+        """Verifica que el alias se reconoce sin importar mayúsculas"""
+        result = expression_translator.translate(f"{alias}(HIRE_DATE, 'DD', 5)")
+
+        assert result == "addDays(HIRE_DATE, 5)"
+
+    def test_translate_add_todate_alias_untranslated_is_reported(self, expression_translator):
+        """Verifica que un ADD_toDate ( sin traducir (unidad desconocida) se reporta"""
+        with pytest.raises(ValueError):
+            expression_translator.translate("ADD_toDate (HIRE_DATE, 'QQ', 1)")
+
+    def test_translate_many_preserves_order(self, expression_translator, monkeypatch):
+        """Verifica orden de salida y una sola traducción por expresión distinta"""
+        calls = []
+        translate = expression_translator.translate
+
+        def counting_translate(expression):
+            calls.append(expression)
+            return translate(expression)
+
+        monkeypatch.setattr(expression_translator, 'translate', counting_translate)
+        expressions = ['IN_COL', 'SYSDATE', 'IN_COL', 'SYSDATE', 'COL']
+
+        result = expression_translator.translate_many(expressions)
+
+        assert result == ['COL', 'currentTimestamp()', 'COL', 'currentTimestamp()', 'COL']
+        assert calls == ['IN_COL', 'SYSDATE', 'COL']
+
+    def test_translate_many_propagates_error(self, expression_translator):
+        """Verifica que una expresión inválida interrumpe el lote con ValueError"""
+        with pytest.raises(ValueError):
+            expression_translator.translate_many(['COL', "ADD_toDate (HIRE_DATE, 'QQ', 1)"])
+
+    def test_translate_expressions(self):
+        """Verifica la función de conveniencia para lotes"""
+        assert translate_expressions(['IN_A', 'SYSDATE', 'IN_A']) == ['A', 'currentTimestamp()', 'A']
+
+        with pytest.raises(ValueError):
+            translate_expressions(["ADD_toDate (HIRE_DATE, 'QQ', 1)"])
+
+    def test_translate_identifier_fast_path(self, expression_translator, monkeypatch):
+        """Verifica que solo las columnas simples toman el camino rápido"""
+        slow_path = []
+        translate_decode = expression_translator._translate_decode
+
+        def spy_translate_decode(expression):
+            slow_path.append(expression)
+            return translate_decode(expression)
+
+        monkeypatch.setattr(expression_translator, '_translate_decode', spy_translate_decode)
+
+        assert expression_translator.translate('IN_COL') == 'COL'
+        assert slow_path == []
+
+        assert expression_translator.translate('AND') == '&&'
+        assert expression_translator.translate('SYSDATE') == 'currentTimestamp()'
+        assert slow_path == ['AND', 'SYSDATE']
+
+
 @pytest.fixture(autouse=True)
 def setup_logging():
     """Configura logging para tests"""